@@ -0,0 +1,6 @@
+"""
+Benchmarks del sistema de visualización de Spotify
+
+Uso:
+    python -m benchmarks.run_benchmarks --sizes 10k 1m 10m
+"""
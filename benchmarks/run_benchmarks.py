@@ -0,0 +1,275 @@
+"""
+🏁 BENCHMARKS DEL PIPELINE COMPLETO
+==================================
+Mide carga, conversión de fechas, limpieza, cada gráfico (create + save), búsqueda y comparación
+sobre datos sintéticos, y guarda un reporte JSON comparable entre versiones
+
+Uso:
+    python -m benchmarks.run_benchmarks --sizes 10k 1m
+    python -m benchmarks.run_benchmarks --sizes 10k --charts 06_pareto 02_mapa_calor
+    python -m benchmarks.run_benchmarks --baseline output/benchmarks/anterior.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')  # Sin ventanas durante los benchmarks
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import OUTPUT_DIR, BASE_DIR
+from src.data.loader import DataLoader
+from src.data.cleaner import DataCleaner
+from src.data.dates import parse_release_dates
+from src.utils.helpers import search_songs, compare_artists
+from src.utils.logger import Logger
+from src.visualizations import CHARTS
+from src.visualizations.base import BasePlot
+from src.visualizations.canvas import close_figure
+from benchmarks.synthetic import ensure_dataset, parse_size
+
+logger = Logger()
+
+BENCHMARK_DIR = OUTPUT_DIR / 'benchmarks'
+REGRESSION_THRESHOLD = 0.10     # 10% más lento que la referencia = regresión
+
+
+def _timeit(func, repeat=1):
+    """
+    Ejecuta una función varias veces y mide cada ejecución
+    
+    Returns:
+        (lista de segundos, resultado de la última ejecución)
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - t0)
+    return timings, result
+
+
+def _stats(timings, rows):
+    """Resumen de una serie de mediciones"""
+    return {
+        'rows': rows,
+        'runs': len(timings),
+        'seconds': [round(t, 6) for t in timings],
+        'min': round(min(timings), 6),
+        'median': round(statistics.median(timings), 6),
+        'rows_per_s': round(rows / min(timings), 1) if min(timings) > 0 else None
+    }
+
+
+def _git_revision():
+    """Commit actual (para identificar la versión medida)"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def bench_chart(name, chart_cls, data, output_dir, repeat=1):
+    """
+    Mide create() y save() de un gráfico por separado
+    
+    Returns:
+        Diccionario {'<name>.create': stats, '<name>.save': stats}; '.save'
+        solo aparece si se llegó a escribir la imagen
+    """
+    create_times, save_times = [], []
+    
+    for _ in range(repeat):
+        plot = chart_cls(data)
+        try:
+            t0 = time.perf_counter()
+            plot.create()
+            create_times.append(time.perf_counter() - t0)
+            
+            if getattr(plot, 'fig', None) is None:
+                continue
+            
+            # Personalizar y ajustar layout (no se mide: no es create ni save)
+            if hasattr(plot, 'customize'):
+                plot.customize()
+                plot.fig.tight_layout()
+            
+            path = output_dir / f'{name}.png'
+            t0 = time.perf_counter()
+            written = plot.save(path)
+            seconds = time.perf_counter() - t0
+            # El Sankey guarda el HTML aunque no pueda escribir el PNG (sin kaleido)
+            if written and (isinstance(plot, BasePlot) or path in written):
+                save_times.append(seconds)
+            else:
+                logger.warning(f"{name}: no se escribió {path.name}, save() no se mide")
+        finally:
+            if isinstance(plot, BasePlot):
+                close_figure(plot.fig)
+    
+    results = {f'{name}.create': _stats(create_times, len(data))}
+    if save_times:
+        results[f'{name}.save'] = _stats(save_times, len(data))
+    return results
+
+
+def run_size(size, charts, repeat=1, seed=42):
+    """
+    Ejecuta todos los benchmarks para un tamaño de dataset
+    
+    Args:
+        size: Clave de tamaño ('10k', '1m', '10m') o número de filas
+        charts: Lista de nombres de gráficos (claves de CHARTS)
+        repeat: Repeticiones por benchmark
+        seed: Semilla del generador sintético
+    
+    Returns:
+        Diccionario {benchmark: estadísticas}
+    """
+    n_rows = parse_size(size)
+    logger.header(f"BENCHMARK: {n_rows:,} filas")
+    
+    t0 = time.perf_counter()
+    path = ensure_dataset(n_rows, seed=seed)
+    logger.info(f"Dataset sintético listo en {time.perf_counter() - t0:.1f}s: {path.name}")
+    
+    results = {}
+    loader = DataLoader()
+    
+    timings, raw = _timeit(lambda: loader.load_raw_data(path), repeat)
+    results['load'] = _stats(timings, len(raw))
+    
+    # Fechas de precisión mixta: pd.to_datetime frente al conversor por forma
+    dates = raw['album_release_date']
+    timings, _ = _timeit(lambda: pd.to_datetime(dates, errors='coerce'), repeat)
+    results['dates.to_datetime'] = _stats(timings, len(raw))
+    timings, _ = _timeit(lambda: parse_release_dates(dates), repeat)
+    results['dates.parse'] = _stats(timings, len(raw))
+    
+    timings, data = _timeit(lambda: DataCleaner(raw).clean(), repeat)
+    results['clean'] = _stats(timings, len(raw))
+    del raw
+    
+    timings, _ = _timeit(lambda: search_songs(data, 'love'), repeat)
+    results['search'] = _stats(timings, len(data))
+    
+    top_two = data['artist_name'].value_counts().index[:2]
+    if len(top_two) == 2:
+        timings, _ = _timeit(lambda: compare_artists(data, top_two[0], top_two[1]), repeat)
+        results['compare'] = _stats(timings, len(data))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in charts:
+            logger.info(f"Gráfico: {name}")
+            try:
+                results.update(bench_chart(name, CHARTS[name], data, Path(tmp), repeat))
+            except Exception as e:
+                logger.error(f"Error en {name}: {e}")
+                results[f'{name}.create'] = {'rows': len(data), 'error': str(e)}
+    
+    return results
+
+
+def compare_reports(current, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Compara dos reportes y devuelve las filas de la comparación
+    
+    Returns:
+        Lista de (tamaño, benchmark, mediana referencia, mediana actual, ratio, regresión)
+    """
+    rows = []
+    for size, benches in current['results'].items():
+        base_benches = baseline.get('results', {}).get(size, {})
+        for name, stats in benches.items():
+            base = base_benches.get(name)
+            if not base or 'median' not in base or 'median' not in stats:
+                continue
+            ratio = stats['median'] / base['median'] if base['median'] > 0 else float('inf')
+            rows.append((size, name, base['median'], stats['median'], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def print_report(report, comparison=None):
+    """Imprime una tabla con los resultados (y la comparación si existe)"""
+    for size, benches in report['results'].items():
+        logger.header(f"RESULTADOS: {size} filas")
+        for name, stats in benches.items():
+            if 'error' in stats:
+                print(f"  {name:40} ERROR: {stats['error']}")
+            else:
+                print(f"  {name:40} {stats['median']:>10.4f}s  (min {stats['min']:.4f}s)")
+    
+    if comparison:
+        logger.header("COMPARACIÓN CON LA REFERENCIA")
+        for size, name, base, cur, ratio, regression in comparison:
+            flag = '  ⚠️ REGRESIÓN' if regression else ''
+            print(f"  [{size}] {name:36} {base:>9.4f}s → {cur:>9.4f}s  x{ratio:5.2f}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks del pipeline de Spotify')
+    parser.add_argument('--sizes', nargs='+', default=['10k'],
+                        help='Tamaños: 10k, 100k, 1m, 10m o número de filas')
+    parser.add_argument('--charts', nargs='+', default=list(CHARTS),
+                        help='Gráficos a medir (por defecto todos)')
+    parser.add_argument('--repeat', type=int, default=1, help='Repeticiones por benchmark')
+    parser.add_argument('--seed', type=int, default=42, help='Semilla del generador')
+    parser.add_argument('--output', type=Path, default=None, help='Ruta del reporte JSON')
+    parser.add_argument('--baseline', type=Path, default=None,
+                        help='Reporte anterior para detectar regresiones')
+    args = parser.parse_args(argv)
+    
+    unknown = [c for c in args.charts if c not in CHARTS]
+    if unknown:
+        parser.error(f"Gráficos desconocidos: {', '.join(unknown)}")
+    
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'seed': args.seed,
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__
+        },
+        'results': {}
+    }
+    
+    for size in args.sizes:
+        report['results'][str(parse_size(size))] = run_size(size, args.charts, args.repeat, args.seed)
+    
+    BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    output = args.output or BENCHMARK_DIR / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}_{report['revision']}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    
+    comparison = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            comparison = compare_reports(report, json.load(f))
+    
+    print_report(report, comparison)
+    logger.success(f"Reporte guardado en: {output}")
+    
+    if comparison and any(row[-1] for row in comparison):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
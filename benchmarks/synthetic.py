@@ -0,0 +1,253 @@
+"""
+🧪 GENERADOR DE DATOS SINTÉTICOS
+===============================
+Genera datasets deterministas con el esquema de Spotify para benchmarks
+
+Características:
+- Popularidad de artistas sesgada (ley de Zipf)
+- Tasa realista de duplicados por track_id y de valores faltantes
+- Fechas con precisión mixta (YYYY, YYYY-MM, YYYY-MM-DD)
+- Generación por bloques: 10M filas sin tener todo en memoria
+"""
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from src.config.settings import DATA_DIR
+
+BENCHMARK_DATA_DIR = DATA_DIR / 'benchmark'
+
+# Tamaños predefinidos
+SIZES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000
+}
+
+COLUMNS = [
+    'track_id', 'track_name', 'track_number', 'track_popularity', 'explicit',
+    'artist_name', 'artist_popularity', 'artist_followers', 'artist_genres',
+    'album_id', 'album_name', 'album_release_date', 'album_total_tracks',
+    'album_type', 'track_duration_min'
+]
+
+DUPLICATE_RATE = 0.03           # Filas que repiten un track_id anterior
+INVALID_DURATION_RATE = 0.002   # Duraciones fuera de rango (se eliminan al limpiar)
+MISSING_RATES = {
+    'track_name': 0.002,
+    'artist_name': 0.001,
+    'album_name': 0.002,
+    'artist_genres': 0.05,
+    'album_release_date': 0.01
+}
+DATE_PRECISION = {'day': 0.85, 'month': 0.05, 'year': 0.10}
+ALBUM_TYPES = (['album', 'single', 'compilation'], [0.55, 0.35, 0.10])
+
+GENRES = [
+    'pop', 'dance pop', 'rap', 'hip hop', 'trap', 'rock', 'indie rock', 'alt rock',
+    'latin', 'reggaeton', 'urbano latino', 'edm', 'house', 'techno', 'r&b', 'soul',
+    'country', 'k-pop', 'j-pop', 'metal', 'punk', 'jazz', 'classical', 'folk',
+    'blues', 'funk', 'disco', 'salsa', 'bachata', 'cumbia', 'afrobeats', 'grime'
+]
+WORDS = [
+    'love', 'night', 'happy', 'heart', 'dance', 'fire', 'summer', 'dream', 'baby',
+    'girl', 'boy', 'rain', 'sun', 'moon', 'star', 'city', 'road', 'home', 'time',
+    'life', 'forever', 'tonight', 'again', 'blue', 'gold', 'wild', 'free', 'young',
+    'sky', 'ocean', 'fly', 'run', 'lost', 'light', 'dark', 'sweet', 'crazy', 'slow'
+]
+
+ID_ALPHABET = np.frombuffer(
+    b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz', dtype='S1'
+)
+
+
+def parse_size(size):
+    """
+    Convierte un tamaño ('10k', '1m', '250000') en número de filas
+    
+    Args:
+        size: Clave de SIZES o número de filas
+    
+    Returns:
+        Número entero de filas
+    """
+    if isinstance(size, int):
+        return size
+    key = str(size).lower()
+    if key in SIZES:
+        return SIZES[key]
+    return int(key.replace('_', ''))
+
+
+def _random_ids(rng, n, length=22):
+    """Genera identificadores alfanuméricos estilo Spotify de forma vectorizada"""
+    chars = ID_ALPHABET[rng.integers(0, len(ID_ALPHABET), size=(n, length))]
+    return chars.view(f'S{length}').ravel().astype(str)
+
+
+def _random_titles(rng, n):
+    """Genera títulos de 1 a 4 palabras"""
+    words = np.array(WORDS, dtype=object)
+    n_words = rng.integers(1, 5, size=n)
+    titles = pd.Series(words[rng.integers(0, len(words), size=n)]).str.title()
+    for k in range(2, 5):
+        extra = words[rng.integers(0, len(words), size=n)]
+        titles = titles.where(n_words < k, titles + ' ' + extra)
+    return titles.to_numpy()
+
+
+class _Catalog:
+    """Artistas y álbumes compartidos por todos los bloques"""
+    
+    def __init__(self, n_rows, rng):
+        self.n_artists = max(50, n_rows // 25)
+        self.n_albums = max(100, n_rows // 8)
+        
+        # Popularidad de artistas sesgada: pocos artistas concentran muchas canciones
+        ranks = np.arange(1, self.n_artists + 1)
+        weights = 1.0 / ranks ** 1.1
+        self.artist_weights = weights / weights.sum()
+        
+        self.artist_name = np.array([f'Artist {i:06d}' for i in ranks], dtype=object)
+        base_pop = 95 - 60 * np.log10(ranks) / np.log10(self.n_artists + 1)
+        self.artist_popularity = np.clip(base_pop + rng.normal(0, 5, self.n_artists), 0, 100).round().astype(int)
+        self.artist_followers = (np.exp(rng.normal(0, 1, self.n_artists)) * 10 ** (self.artist_popularity / 16)).astype(np.int64)
+        
+        genres = np.array(GENRES, dtype=object)
+        n_genres = rng.integers(0, 4, size=self.n_artists)
+        self.artist_genres = np.array([
+            "[" + ", ".join(f"'{g}'" for g in genres[rng.choice(len(genres), k, replace=False)]) + "]"
+            for k in n_genres
+        ], dtype=object)
+        
+        # Álbumes: cada uno pertenece a un artista
+        self.album_artist = rng.choice(self.n_artists, size=self.n_albums, p=self.artist_weights)
+        self.album_id = _random_ids(rng, self.n_albums)
+        self.album_name = _random_titles(rng, self.n_albums)
+        self.album_type = rng.choice(ALBUM_TYPES[0], size=self.n_albums, p=ALBUM_TYPES[1])
+        self.album_total_tracks = np.where(self.album_type == 'single',
+                                           rng.integers(1, 4, self.n_albums),
+                                           rng.integers(6, 25, self.n_albums))
+        self.album_release_date = self._release_dates(rng)
+        
+        # Álbumes agrupados por artista para muestrear rápidamente
+        order = np.argsort(self.album_artist, kind='stable')
+        self.albums_by_artist = order
+        self.artist_album_start = np.searchsorted(self.album_artist[order], np.arange(self.n_artists))
+        self.artist_album_count = np.bincount(self.album_artist, minlength=self.n_artists)
+    
+    def _release_dates(self, rng):
+        """Fechas con precisión mixta, sesgadas hacia años recientes"""
+        n = self.n_albums
+        years = np.clip(2025 - rng.gamma(1.6, 5.0, size=n), 1960, 2025).astype(int)
+        months = rng.integers(1, 13, size=n)
+        days = rng.integers(1, 29, size=n)
+        
+        day = pd.Series(years).astype(str) + '-' + pd.Series(months).map('{:02d}'.format) + '-' + pd.Series(days).map('{:02d}'.format)
+        month = day.str[:7]
+        year = day.str[:4]
+        
+        precision = rng.choice(list(DATE_PRECISION), size=n, p=list(DATE_PRECISION.values()))
+        return np.select([precision == 'day', precision == 'month'],
+                         [day.to_numpy(object), month.to_numpy(object)],
+                         year.to_numpy(object))
+    
+    def sample_albums(self, rng, artists):
+        """Elige un álbum del artista de cada fila (o uno cualquiera si no tiene)"""
+        counts = self.artist_album_count[artists]
+        offsets = (rng.random(len(artists)) * np.maximum(counts, 1)).astype(int)
+        albums = self.albums_by_artist[np.minimum(self.artist_album_start[artists] + offsets, self.n_albums - 1)]
+        fallback = rng.integers(0, self.n_albums, size=len(artists))
+        return np.where(counts > 0, albums, fallback)
+
+
+def generate(n_rows, seed=42, chunk_rows=500_000):
+    """
+    Genera el dataset sintético por bloques
+    
+    Args:
+        n_rows: Número total de filas
+        seed: Semilla (mismo seed y tamaño = mismos datos)
+        chunk_rows: Filas por bloque
+    
+    Yields:
+        DataFrame con el esquema de Spotify
+    """
+    catalog = _Catalog(n_rows, np.random.default_rng(seed))
+    
+    for chunk_index, start in enumerate(range(0, n_rows, chunk_rows)):
+        rng = np.random.default_rng([seed, chunk_index])
+        n = min(chunk_rows, n_rows - start)
+        
+        artists = rng.choice(catalog.n_artists, size=n, p=catalog.artist_weights)
+        albums = catalog.sample_albums(rng, artists)
+        artist_pop = catalog.artist_popularity[artists]
+        
+        chunk = pd.DataFrame({
+            'track_id': _random_ids(rng, n),
+            'track_name': _random_titles(rng, n),
+            'track_number': np.minimum(rng.integers(1, 25, n), catalog.album_total_tracks[albums]),
+            'track_popularity': np.clip(0.6 * artist_pop + rng.normal(10, 15, n), 0, 100).round().astype(int),
+            'explicit': np.where(rng.random(n) < 0.3, 'TRUE', 'FALSE'),
+            'artist_name': catalog.artist_name[artists],
+            'artist_popularity': artist_pop,
+            'artist_followers': catalog.artist_followers[artists],
+            'artist_genres': catalog.artist_genres[artists],
+            'album_id': catalog.album_id[albums],
+            'album_name': catalog.album_name[albums],
+            'album_release_date': catalog.album_release_date[albums],
+            'album_total_tracks': catalog.album_total_tracks[albums],
+            'album_type': catalog.album_type[albums],
+            'track_duration_min': np.round(rng.gamma(9.0, 0.39, n), 2)
+        }, columns=COLUMNS)
+        
+        # Espacios sobrantes en algunos títulos (se limpian con strip)
+        padded = rng.random(n) < 0.02
+        chunk.loc[padded, 'track_name'] = ' ' + chunk.loc[padded, 'track_name'] + ' '
+        
+        # Duraciones inválidas
+        invalid = rng.random(n) < INVALID_DURATION_RATE
+        chunk.loc[invalid, 'track_duration_min'] = rng.choice([0.0, 45.0], size=invalid.sum())
+        
+        # Valores faltantes
+        for column, rate in MISSING_RATES.items():
+            chunk.loc[rng.random(n) < rate, column] = np.nan
+        
+        # Duplicados: copias de filas anteriores del mismo bloque
+        n_dup = int(n * DUPLICATE_RATE)
+        if n_dup and n > 1:
+            targets = rng.choice(np.arange(1, n), size=n_dup, replace=False)
+            sources = (rng.random(n_dup) * targets).astype(int)
+            for column in COLUMNS:
+                values = chunk[column].to_numpy(copy=True)
+                values[targets] = values[sources]
+                chunk[column] = values
+        
+        yield chunk
+
+
+def ensure_dataset(size, seed=42, directory=None):
+    """
+    Devuelve la ruta del CSV sintético, generándolo si no existe
+    
+    Args:
+        size: Clave de SIZES o número de filas
+        seed: Semilla del generador
+        directory: Carpeta destino (usa data/benchmark si es None)
+    
+    Returns:
+        Path del archivo CSV
+    """
+    n_rows = parse_size(size)
+    directory = Path(directory or BENCHMARK_DATA_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f'spotify_synthetic_{n_rows}_{seed}.csv'
+    
+    if path.exists():
+        return path
+    
+    tmp_path = path.with_suffix('.tmp')
+    for i, chunk in enumerate(generate(n_rows, seed=seed)):
+        chunk.to_csv(tmp_path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+    tmp_path.replace(path)
+    return path
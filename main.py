@@ -14,9 +14,9 @@ from pathlib import Path
 from colorama import Fore, Back, Style, init
 
 # Importar módulos del proyecto
-from src.config.settings import MESSAGES, CLEAN_DATA_FILE
-from src.data.loader import DataLoader
-from src.data.cleaner import DataCleaner
+from src.config.settings import MESSAGES
+from src.data.dataset import SpotifyDataset
+from src.data.filters import DataFilter
 from src.utils.logger import Logger
 
 # Importar funciones de visualización
@@ -32,6 +32,7 @@ from src.visualizations import (
     swarm_plot,
     sankey_diagram
 )
+from src.service.batch import BatchExecutor
 
 # Inicializar colorama
 init(autoreset=True)
@@ -42,8 +43,8 @@ class SpotifyVisualizerApp:
     """Aplicación principal de visualización de datos"""
     
     def __init__(self):
-        self.data_loader = DataLoader()
-        self.data = None
+        self.dataset = None       # SpotifyDataset con los datos limpios
+        self.selection = None     # Subconjunto del filtro activo (SpotifyDataset) o None
         self.running = True
     
     def clear_screen(self):
@@ -77,22 +78,12 @@ class SpotifyVisualizerApp:
         self.print_header()
         
         try:
-            # Verificar si existen datos limpios
-            if CLEAN_DATA_FILE.exists():
-                logger.info("Cargando datos procesados...")
-                self.data = self.data_loader.load_clean_data()
-            else:
-                logger.warning("Datos limpios no encontrados. Procesando datos crudos...")
-                raw_data = self.data_loader.load_raw_data()
-                
-                logger.info("Limpiando datos...")
-                cleaner = DataCleaner(raw_data)
-                self.data = cleaner.clean()
-                cleaner.save()
+            # Datos limpios (o limpieza de los crudos si aún no existen)
+            logger.info("Cargando datos procesados...")
+            self.dataset = SpotifyDataset.load()
             
             # Mostrar resumen de datos
-            summary = self.data_loader.get_data_summary()
-            self._show_summary(summary)
+            self._show_summary(self.dataset.summary())
             
             input(f"\n{Fore.CYAN}📌 Presiona Enter para continuar al menú principal...{Style.RESET_ALL}")
             
@@ -154,6 +145,7 @@ class SpotifyVisualizerApp:
         print(f"{Fore.GREEN}  12. 📊 Ver resumen de datos{Style.RESET_ALL}")
         print(f"{Fore.GREEN}  13. 🔍 Buscar canciones{Style.RESET_ALL}")
         print(f"{Fore.GREEN}  14. 🎤 Comparar artistas{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}  15. 🧮 Filtrar datos {Fore.YELLOW}({self.filter_label}){Style.RESET_ALL}")
         print(f"{Fore.RED}   0. 🚪 Salir del sistema{Style.RESET_ALL}")
         
         print(f"\n{Fore.YELLOW}{'═'*70}{Style.RESET_ALL}")
@@ -163,20 +155,21 @@ class SpotifyVisualizerApp:
         
         # Mapeo de opciones a funciones
         actions = {
-            '1': lambda: personalization_advanced(self.data),
-            '2': lambda: heatmap(self.data),
-            '3': lambda: histograms(self.data),
-            '4': lambda: boxplots(self.data),
-            '5': lambda: kde_plots(self.data),
-            '6': lambda: pareto_chart(self.data),
-            '7': lambda: radar_chart(self.data),
-            '8': lambda: waterfall_chart(self.data),
-            '9': lambda: swarm_plot(self.data),
-            '10': lambda: sankey_diagram(self.data),
+            '1': lambda: personalization_advanced(self.chart_data),
+            '2': lambda: heatmap(self.chart_data),
+            '3': lambda: histograms(self.chart_data),
+            '4': lambda: boxplots(self.chart_data),
+            '5': lambda: kde_plots(self.chart_data),
+            '6': lambda: pareto_chart(self.chart_data),
+            '7': lambda: radar_chart(self.chart_data),
+            '8': lambda: waterfall_chart(self.chart_data),
+            '9': lambda: swarm_plot(self.chart_data),
+            '10': lambda: sankey_diagram(self.chart_data),
             '11': self.generate_all,
             '12': self._show_data_summary,
             '13': self.search_songs_menu,
             '14': self.compare_artists_menu,
+            '15': self.filter_menu,
             '0': self.exit_app
         }
         
@@ -184,13 +177,13 @@ class SpotifyVisualizerApp:
         
         if action:
             try:
-                if choice not in ['0', '12']:
+                if choice not in ['0', '12', '15']:
                     self.print_header()
                     logger.info(MESSAGES['generating'])
                 
                 action()
                 
-                if choice not in ['0', '11', '12', '13', '14']:
+                if choice not in ['0', '11', '12', '13', '14', '15']:
                     logger.success(MESSAGES['success'])
                     input(f"\n{Fore.CYAN}📌 Presiona Enter para volver al menú...{Style.RESET_ALL}")
                     
@@ -207,49 +200,121 @@ class SpotifyVisualizerApp:
             logger.warning(f"{Fore.YELLOW}⚠️  Opción inválida. Por favor, intenta de nuevo.{Style.RESET_ALL}")
             input(f"\n{Fore.CYAN}📌 Presiona Enter para continuar...{Style.RESET_ALL}")
     
+    @property
+    def chart_data(self):
+        """Datos que reciben los gráficos: la selección filtrada o el DataFrame completo"""
+        return self.selection if self.selection is not None else self.dataset
+    
+    @property
+    def filter_label(self):
+        """Descripción del filtro activo para el menú"""
+        return self.selection.filters.describe() if self.selection is not None else 'sin filtros'
+    
+    def filter_menu(self):
+        """Menú para definir el filtro que se aplica a todos los gráficos"""
+        self.print_header()
+        
+        print(f"{Back.CYAN}{Fore.BLACK}{'  🧮 FILTRAR DATOS  ':^70}{Style.RESET_ALL}\n")
+        print(f"{Fore.YELLOW}Filtro actual: {Fore.WHITE}{self.filter_label}{Style.RESET_ALL}")
+        print(f"{Fore.YELLOW}Deja un campo vacío para no filtrar por él. Valores múltiples separados por comas.{Style.RESET_ALL}\n")
+        
+        fields = [
+            ('year_min', 'Año desde'),
+            ('year_max', 'Año hasta'),
+            ('artist', 'Artista(s)'),
+            ('genre', 'Género(s)'),
+            ('explicit', 'Explícito (s/n)'),
+            ('album_type', 'Tipo de álbum (album, single, compilation)'),
+            ('popularity_min', 'Popularidad mínima'),
+            ('popularity_max', 'Popularidad máxima')
+        ]
+        params = {key: input(f"{Fore.GREEN}👉 {label}: {Style.RESET_ALL}").strip() for key, label in fields}
+        if params['explicit']:
+            params['explicit'] = 'true' if params['explicit'].lower() in ('s', 'si', 'sí', 'y', 'yes', '1', 'true') else 'false'
+        
+        try:
+            filters = DataFilter.from_dict(params)
+        except ValueError as e:
+            logger.error(f"Filtro inválido: {e}")
+            input(f"\n{Fore.CYAN}📌 Presiona Enter para volver al menú...{Style.RESET_ALL}")
+            return
+        
+        if filters.is_empty:
+            self.selection = None
+            logger.info("Filtro eliminado: se usarán todos los datos")
+        else:
+            self.selection = self.dataset.select(filters)
+            logger.success(f"Filtro aplicado ({filters.describe()}): {len(self.selection):,} de {len(self.dataset):,} canciones")
+            if len(self.selection) == 0:
+                logger.warning("⚠️  Ninguna canción cumple el filtro")
+        
+        input(f"\n{Fore.CYAN}📌 Presiona Enter para volver al menú...{Style.RESET_ALL}")
+    
     def generate_all(self):
         """Genera todos los gráficos con diseño mejorado"""
         self.print_header()
         
         print(f"{Back.GREEN}{Fore.BLACK}{'  🎨 GENERANDO TODAS LAS VISUALIZACIONES  ':^70}{Style.RESET_ALL}\n")
         
-        all_functions = [
-            ("1. Personalización Avanzada", lambda: personalization_advanced(self.data)),
-            ("2. Mapa de Calor", lambda: heatmap(self.data)),
-            ("3. Histogramas", lambda: histograms(self.data)),
-            ("4. Boxplots", lambda: boxplots(self.data)),
-            ("5. KDE Densidad", lambda: kde_plots(self.data)),
-            ("6. Pareto", lambda: pareto_chart(self.data)),
-            ("7. Radar", lambda: radar_chart(self.data)),
-            ("8. Cascada", lambda: waterfall_chart(self.data)),
-            ("9. Enjambre", lambda: swarm_plot(self.data)),
-            ("10. Sankey", lambda: sankey_diagram(self.data)),
+        all_charts = [
+            ("1. Personalización Avanzada", '01_personalizacion_avanzada'),
+            ("2. Mapa de Calor", '02_mapa_calor'),
+            ("3. Histogramas", '03_histogramas'),
+            ("4. Boxplots", '04_boxplots'),
+            ("5. KDE Densidad", '05_kde_densidad'),
+            ("6. Pareto", '06_pareto'),
+            ("7. Radar", '07_radar'),
+            ("8. Cascada", '08_cascada'),
+            ("9. Enjambre", '09_enjambre'),
+            ("10. Sankey", '10_sankey'),
         ]
-        
-        total = len(all_functions)
-        exitosos = 0
-        fallidos = 0
-        
-        for i, (name, func) in enumerate(all_functions, 1):
-            try:
-                # Barra de progreso visual
-                progress = int((i / total) * 50)
-                bar = f"{Fore.GREEN}{'█' * progress}{Fore.WHITE}{'░' * (50 - progress)}{Style.RESET_ALL}"
-                print(f"\r{Fore.CYAN}[{i}/{total}] {bar} {name}...{Style.RESET_ALL}", end='')
-                
-                func()
-                exitosos += 1
-                print(f" {Fore.GREEN}✅{Style.RESET_ALL}")
-            except Exception as e:
-                logger.error(f"Error en {name}: {e}")
-                fallidos += 1
-                print(f" {Fore.RED}❌{Style.RESET_ALL}")
+        labels = {chart: name for name, chart in all_charts}
+        total = len(all_charts)
+        
+        def progress(result, done, total):
+            # Barra de progreso visual (los gráficos terminan en paralelo)
+            filled = int((done / total) * 50)
+            bar = f"{Fore.GREEN}{'█' * filled}{Fore.WHITE}{'░' * (50 - filled)}{Style.RESET_ALL}"
+            mark = (f"{Fore.YELLOW}⚠️" if result.status == 'partial'
+                    else f"{Fore.GREEN}✅" if result.ok else f"{Fore.RED}❌")
+            print(f"{Fore.CYAN}[{done}/{total}] {bar} {labels[result.name]} {mark}{Style.RESET_ALL}")
+        
+        # Cada gráfico en un proceso vigilado: límite de tiempo, de memoria
+        # y detección de figuras sin cerrar (src/service/batch.py); los más
+        # lentos según los perfilados anteriores se envían primero y el PNG
+        # del Sankey lo exporta en segundo plano el StaticExportWorker del lote
+        executor = BatchExecutor(source=self.dataset.source)
+        filters = self.selection.filters if self.selection is not None else None
+        results = executor.run([chart for _, chart in all_charts], filters=filters, progress=progress,
+                               rows=len(self.chart_data))
+        
+        exitosos = sum(1 for result in results if result.ok)
+        fallidos = total - exitosos
         
         print(f"\n\n{Fore.YELLOW}{'='*70}{Style.RESET_ALL}")
         print(f"{Back.BLUE}{Fore.WHITE}{'  📊 RESUMEN DE GENERACIÓN  ':^70}{Style.RESET_ALL}")
         print(f"{Fore.YELLOW}{'='*70}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}  ✅ Exitosos: {Fore.WHITE}{exitosos}/{total}{Style.RESET_ALL}")
         print(f"{Fore.RED}  ❌ Fallidos:  {Fore.WHITE}{fallidos}/{total}{Style.RESET_ALL}")
+        
+        # Tiempo estimado frente al real de cada gráfico
+        print(f"\n{Fore.CYAN}  {'Gráfico':<30}{'Previsto':>10}{'Real':>10}{'Desvío':>10}{Style.RESET_ALL}")
+        for result in results:
+            actual = f"{result.seconds:.1f}s" if result.seconds is not None else '-'
+            deviation = (f"{(result.seconds - result.predicted) / result.predicted:+.0%}"
+                         if result.seconds is not None and result.predicted else '-')
+            print(f"{Fore.WHITE}  {labels[result.name]:<30}{result.predicted:>9.1f}s{actual:>10}{deviation:>10}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}  {'Lote completo':<30}{executor.predicted:>9.1f}s{executor.elapsed:>9.1f}s{Style.RESET_ALL}\n")
+        
+        # Gráficos que fallaron o superaron algún límite
+        problems = [result for result in results if not result.ok or result.exceeded]
+        if problems:
+            print(f"{Fore.YELLOW}  ⚠️  Límites superados / errores:{Style.RESET_ALL}")
+            for result in problems:
+                detail = '; '.join(result.notes) or result.error
+                print(f"{Fore.WHITE}     • {labels[result.name]}: {Fore.RED}{result.status}{Fore.WHITE} - {detail}{Style.RESET_ALL}")
+        if executor.recycled:
+            print(f"{Fore.CYAN}  ♻️  Workers reciclados: {Fore.WHITE}{executor.recycled}{Style.RESET_ALL}")
         print(f"{Fore.YELLOW}{'='*70}{Style.RESET_ALL}")
         
         if exitosos == total:
@@ -267,25 +332,21 @@ class SpotifyVisualizerApp:
         """Muestra resumen detallado de datos"""
         self.print_header()
         
-        summary = self.data_loader.get_data_summary()
-        self._show_summary(summary)
+        self._show_summary(self.dataset.summary())
+        data = self.dataset.frame
         
         # Información adicional
         print(f"\n{Back.MAGENTA}{Fore.WHITE}  📈 ESTADÍSTICAS ADICIONALES  {Style.RESET_ALL}")
-        print(f"{Fore.CYAN}  • Duración promedio: {Fore.WHITE}{self.data['track_duration_min'].mean():.2f} min{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}  • Duración máxima:   {Fore.WHITE}{self.data['track_duration_min'].max():.2f} min{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}  • Duración mínima:   {Fore.WHITE}{self.data['track_duration_min'].min():.2f} min{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}  • Seguidores promedio: {Fore.WHITE}{self.data['artist_followers'].mean():,.0f}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}  • Seguidores máximos:  {Fore.WHITE}{self.data['artist_followers'].max():,.0f}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}  • Tracks por álbum:    {Fore.WHITE}{self.data['album_total_tracks'].mean():.1f}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}  • Duración promedio: {Fore.WHITE}{data['track_duration_min'].mean():.2f} min{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}  • Duración máxima:   {Fore.WHITE}{data['track_duration_min'].max():.2f} min{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}  • Duración mínima:   {Fore.WHITE}{data['track_duration_min'].min():.2f} min{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}  • Seguidores promedio: {Fore.WHITE}{data['artist_followers'].mean():,.0f}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}  • Seguidores máximos:  {Fore.WHITE}{data['artist_followers'].max():,.0f}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}  • Tracks por álbum:    {Fore.WHITE}{data['album_total_tracks'].mean():.1f}{Style.RESET_ALL}")
         
         # Top 5 artistas
         print(f"\n{Back.YELLOW}{Fore.BLACK}  🏆 TOP 5 ARTISTAS MÁS POPULARES  {Style.RESET_ALL}")
-        top_5 = (self.data
-                .groupby('artist_name')['artist_popularity']
-                .max()
-                .nlargest(5)
-                .reset_index())
+        top_5 = self.dataset.top_by('artist_name', 'artist_popularity', 5).reset_index()
         
         for i, (_, row) in enumerate(top_5.iterrows(), 1):
             medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "🏅"
@@ -311,7 +372,7 @@ class SpotifyVisualizerApp:
         logger.info(f"Buscando '{query}'...")
         
         from src.utils.helpers import search_songs
-        results = search_songs(self.data, query)
+        results = search_songs(self.dataset, query)
         
         if len(results) == 0:
             print(f"\n{Fore.RED}❌ No se encontraron resultados para '{query}'{Style.RESET_ALL}")
@@ -355,11 +416,7 @@ class SpotifyVisualizerApp:
         print(f"{Fore.YELLOW}Compara dos artistas en múltiples métricas{Style.RESET_ALL}\n")
         
         # Mostrar sugerencias de artistas populares
-        top_artists = (self.data
-                      .groupby('artist_name')['artist_popularity']
-                      .first()
-                      .nlargest(10)
-                      .index.tolist())
+        top_artists = self.dataset.top_by('artist_name', 'artist_popularity', 10).index.tolist()
         
         print(f"{Fore.CYAN}💡 Artistas disponibles (top 10):{Style.RESET_ALL}")
         for i, artist in enumerate(top_artists, 1):
@@ -398,7 +455,7 @@ class SpotifyVisualizerApp:
         logger.info(f"Comparando '{artist1}' vs '{artist2}'...")
         
         from src.utils.helpers import compare_artists
-        comparison = compare_artists(self.data, artist1, artist2)
+        comparison = compare_artists(self.dataset, artist1, artist2)
         
         if comparison is None:
             print(f"\n{Fore.RED}❌ Uno o ambos artistas no fueron encontrados{Style.RESET_ALL}")
@@ -8,9 +8,11 @@ from .settings import (
     INTERACTIVE_DIR, 
     CLEAN_DATA_FILE,
     RAW_DATA_FILE,
+    NUMERIC_COLUMNS,
     MESSAGES,
     MPL_CONFIG
 )
+from .themes import THEMES, get_theme
 
 __all__ = [
     'SPOTIFY',
@@ -21,6 +23,9 @@ __all__ = [
     'INTERACTIVE_DIR',
     'CLEAN_DATA_FILE',
     'RAW_DATA_FILE',
+    'NUMERIC_COLUMNS',
     'MESSAGES',
-    'MPL_CONFIG'
+    'MPL_CONFIG',
+    'THEMES',
+    'get_theme'
 ]
\ No newline at end of file
@@ -14,15 +14,56 @@ PROCESSED_DATA_DIR = DATA_DIR / 'processed'
 OUTPUT_DIR = BASE_DIR / 'output'
 IMAGES_DIR = OUTPUT_DIR / 'images'
 INTERACTIVE_DIR = OUTPUT_DIR / 'interactive'
+PROFILING_DIR = OUTPUT_DIR / 'profiling'
 
 # Crear directorios si no existen
 for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, 
-                  OUTPUT_DIR, IMAGES_DIR, INTERACTIVE_DIR]:
+                  OUTPUT_DIR, IMAGES_DIR, INTERACTIVE_DIR, PROFILING_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
 
 # === ARCHIVOS DE DATOS ===
-RAW_DATA_FILE = RAW_DATA_DIR / 'spotify_data.csv'
+RAW_DATA_FILE = RAW_DATA_DIR / 'spotify_data.csv'   # ← También una carpeta de partes o un patrón ('data/raw/spotify_*.csv.gz')
+RAW_DATA_PATTERNS = ['*.csv', '*.csv.gz', '*.csv.bz2', '*.csv.xz', '*.csv.zip', '*.csv.zst']   # ← Archivos que se leen de una carpeta de partes
+RAW_LOAD_WORKERS = 4                 # ← Hilos que leen y descomprimen partes a la vez
 CLEAN_DATA_FILE = PROCESSED_DATA_DIR / 'spotify_data_limpio.csv'
+SHARED_DATA_DIR = PROCESSED_DATA_DIR / 'shared'   # ← Columnas en .npy para compartir entre procesos (mmap)
+SHARED_DATA_ENABLED = True           # ← DataCleaner.save escribe también la versión compartida
+
+# === ESQUEMA DE DATOS ===
+NUMERIC_COLUMNS = [
+    'track_number',
+    'track_popularity',
+    'artist_popularity',
+    'artist_followers',
+    'album_total_tracks',
+    'track_duration_min'
+]
+
+# Texto con muchas repeticiones: diccionario de cadenas + códigos (Categorical)
+DICTIONARY_COLUMNS = [
+    'track_name',
+    'artist_name',
+    'album_name',
+    'artist_genres'
+]
+
+# === PROCESAMIENTO POR BLOQUES ===
+CHUNK_SIZE = 100_000                 # ← Filas por bloque al leer archivos grandes
+CORRELATION_SAMPLE_SIZE = 50_000     # ← Muestra por columna para rangos aproximados (Spearman)
+CLEAN_MEMORY_BUDGET_MB = 1024        # ← Memoria para deduplicar y ordenar al limpiar por bloques
+CLEAN_EXTERNAL = 'auto'              # ← True: limpiar por bloques con ordenación externa; 'auto': si el CSV crudo supera CLEAN_MEMORY_BUDGET_MB
+
+# === PERFILADO DE GRÁFICOS ===
+PROFILING_ENABLED = True             # ← Registrar tiempos por fase de cada gráfico
+PROFILE_MEMORY = False               # ← Medir memoria pico (tracemalloc: ~3× más lento y los tiempos dejan de servir al CostModel)
+PROFILE_CPROFILE = False             # ← Guardar volcado cProfile (.prof) por gráfico
+PROFILE_LOG_FILE = PROFILING_DIR / 'charts.jsonl'
+
+# === LOGGING ===
+LOGS_DIR = OUTPUT_DIR / 'logs'
+LOG_LEVEL = 'INFO'                   # ← DEBUG, INFO, SUCCESS, WARNING o ERROR
+LOG_JSON_FILE = None                 # ← p. ej. LOGS_DIR / 'app.jsonl' para registro estructurado
+LOG_ASYNC = False                    # ← True: escritura en segundo plano (lotes sin interacción)
 
 # === CONFIGURACIÓN DE VISUALIZACIONES ===
 FIGURE_SIZE = (12, 6)        # ← REDUCIDO para pantalla normal
@@ -31,6 +72,48 @@ SAVE_DPI = 300               # ← DPI alto solo para archivos guardados
 FONT_SCALE = 1.0             # ← Reducido de 1.2 a 1.0
 PLOT_STYLE = 'whitegrid'
 
+# === EXPORTACIÓN DE GRÁFICOS ===
+# Cada destino genera un archivo a partir del mismo dibujado:
+# {'format': 'png' | 'jpg' | 'webp' | 'svg' | 'pdf', 'dpi': ..., 'suffix': ...}
+EXPORT_TARGETS = [
+    {'format': 'png', 'dpi': SAVE_DPI},                  # ← PNG de impresión (nombre clásico)
+    # {'format': 'png', 'dpi': 96, 'suffix': '_web'},    # ← PNG ligero para web
+    # {'format': 'svg'},
+    # {'format': 'pdf'},
+]
+CHART_EXPORT_TARGETS = {}            # ← Por gráfico, p. ej. {'06_pareto': [{'format': 'svg'}]}
+EXPORT_PAD_INCHES = 0.3              # ← Margen alrededor del recorte ajustado
+STATIC_EXPORT_TIMEOUT = 120          # ← Segundos máximos de espera a las exportaciones de Plotly
+
+# === EXPORTACIÓN INTERACTIVA (PLOTLY) ===
+INTERACTIVE_EXPORT = False           # ← True: cada gráfico genera también su versión HTML interactiva
+INTERACTIVE_COMPRESS = False         # ← True: JSON de la figura comprimido (gzip + base64) en el HTML
+
+# === SERVIDOR DEL DASHBOARD ===
+SERVER_HOST = '127.0.0.1'            # ← Usa '0.0.0.0' para compartirlo en la red local
+SERVER_PORT = 8050
+SERVER_WORKERS = 2                   # ← Procesos que renderizan gráficos en paralelo
+SERVER_EXECUTOR = 'process'          # ← 'thread': un solo proceso con hilos (los datos se cargan una vez)
+SERVER_DPI = 100                     # ← Resolución de los PNG servidos
+RENDER_CACHE_MAX_MB = 256            # ← Memoria máxima de la caché de renderizados (LRU)
+DAEMON_WORKERS = 2                   # ← Procesos precalentados del demonio (python -m src.service.daemon)
+
+# === GENERACIÓN POR LOTES (Generar todos) ===
+BATCH_WORKERS = 2                    # ← Procesos que generan gráficos en paralelo
+BATCH_TIMEOUT = 180                  # ← Segundos máximos por gráfico (después se cancela)
+BATCH_CHART_TIMEOUTS = {             # ← Límites propios de algunos gráficos
+    '09_enjambre': 90,               #   swarmplot puede quedarse colgado con muestras malas
+}
+BATCH_MAX_TASKS_PER_WORKER = 4       # ← Gráficos por proceso antes de reemplazarlo
+BATCH_MAX_RSS_MB = 1536              # ← Memoria máxima por proceso (se cancela o recicla al superarla)
+BATCH_SCHEDULING = 'cost'            # ← 'cost' (más lentos primero, según perfilados anteriores) o 'order'
+BATCH_COST_HISTORY = 20              # ← Ejecuciones recientes por gráfico usadas para estimar su coste
+BATCH_DEFAULT_COST = 5.0             # ← Segundos estimados cuando aún no hay perfilados
+
+# === ORQUESTADOR ASÍNCRONO (python -m src.service.orchestrator) ===
+ORCHESTRATOR_QUEUE_SIZE = 2          # ← Figuras dibujadas que pueden esperar a ser codificadas
+ORCHESTRATOR_ENCODERS = 2            # ← Hilos que codifican y escriben las imágenes
+
 # === CONFIGURACIÓN DE MATPLOTLIB (OPTIMIZADA) ===
 MPL_CONFIG = {
     'figure.figsize': FIGURE_SIZE,
@@ -57,8 +140,8 @@ MPL_CONFIG = {
     'figure.constrained_layout.use': True,  # Layout automático mejorado
 }
 
-# Aplicar configuración global
-plt.rcParams.update(MPL_CONFIG)
+# MPL_CONFIG se aplica como parte del tema (themes.py), no al importar
+DEFAULT_THEME = 'spotify'           # ← Tema de los gráficos ('spotify', 'spotify_dark')
 
 # Configurar backend para mejor renderizado
 try:
@@ -0,0 +1,277 @@
+"""
+🎭 TEMAS DE LOS GRÁFICOS
+=======================
+Estilo visual compilado una sola vez por tema
+
+Un tema reúne el estilo de seaborn, el contexto de tamaños, la paleta y
+MPL_CONFIG. Resolverlo (sns.axes_style, plotting_context, color_palette y
+la validación de cada rcParam) se hace la primera vez que se pide el tema;
+el resultado es un diccionario inmutable que todos los gráficos reutilizan.
+
+Los rcParams de matplotlib son globales del proceso (no hay rcParams por
+hilo). Por eso:
+- El tema por defecto (DEFAULT_THEME) se instala una vez en rcParams y los
+  gráficos que lo usan no tocan nada: pueden dibujar en paralelo.
+- Un gráfico con otro tema aplica sus parámetros solo durante su
+  renderizado (scope) y los restaura al terminar; mientras tanto ningún
+  otro gráfico dibuja, para que no herede un tema que no es el suyo.
+
+Uso:
+    >>> theme = get_theme('spotify_dark')
+    >>> with theme.scope():
+    ...     fig = new_figure()
+"""
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+
+import matplotlib
+import seaborn as sns
+from cycler import cycler
+from matplotlib.colors import to_hex
+from .colors import SPOTIFY, CATEGORICAL
+from .settings import MPL_CONFIG, DEFAULT_THEME
+
+# Definición de cada tema (se compila al primer uso)
+THEMES = {
+    'spotify': {
+        'style': 'whitegrid',
+        'context': 'notebook',
+        'palette': CATEGORICAL,
+        'rc': {},
+    },
+    'spotify_dark': {
+        'style': 'darkgrid',
+        'context': 'notebook',
+        'palette': CATEGORICAL,
+        'rc': {
+            'figure.facecolor': SPOTIFY['dark'],
+            'savefig.facecolor': SPOTIFY['dark'],
+            'axes.facecolor': '#212121',
+            'axes.edgecolor': SPOTIFY['gray'],
+            'axes.labelcolor': SPOTIFY['white'],
+            'grid.color': SPOTIFY['gray'],
+            'text.color': SPOTIFY['white'],
+            'xtick.color': SPOTIFY['white'],
+            'ytick.color': SPOTIFY['white'],
+            'legend.facecolor': SPOTIFY['dark'],
+            'legend.edgecolor': SPOTIFY['gray'],
+        },
+    },
+}
+
+_compiled = {}
+_compile_lock = threading.Lock()
+
+
+class Theme:
+    """
+    Tema compilado: nombre + rcParams validados e inmutables
+    
+    No se crea directamente: usar get_theme().
+    """
+    
+    def __init__(self, name, rc):
+        """
+        Args:
+            name: Nombre del tema
+            rc: Diccionario de rcParams ya resuelto
+        """
+        # RcParams valida (y normaliza) cada valor una sola vez
+        validated = matplotlib.RcParams(rc)
+        self.name = name
+        self.rc = MappingProxyType({key: validated[key] for key in rc})
+    
+    def __repr__(self):
+        return f"Theme({self.name!r}, {len(self.rc)} parámetros)"
+    
+    @property
+    def palette(self):
+        """Colores del ciclo del tema (lista hex)"""
+        return [to_hex(color) for color in self.rc['axes.prop_cycle'].by_key()['color']]
+    
+    def scope(self):
+        """Context manager que deja activo este tema mientras dura"""
+        return theme_scope(self)
+
+
+def compile_theme(name, style='whitegrid', context='notebook', font_scale=1.0, palette=CATEGORICAL, rc=None):
+    """
+    Resuelve un tema completo en un diccionario de rcParams
+    
+    El orden es el mismo que se aplicaba antes gráfico a gráfico:
+    MPL_CONFIG, después el estilo y el contexto de seaborn, la paleta y,
+    por último, los parámetros propios del tema.
+    
+    Args:
+        name: Nombre del tema
+        style: Estilo de seaborn (whitegrid, darkgrid, ticks...)
+        context: Contexto de seaborn (paper, notebook, talk, poster)
+        font_scale: Escala de las fuentes del contexto
+        palette: Lista de colores del ciclo
+        rc: rcParams adicionales del tema
+    
+    Returns:
+        Theme
+    """
+    resolved = dict(MPL_CONFIG)
+    resolved.update(sns.axes_style(style))
+    resolved.update(sns.plotting_context(context, font_scale=font_scale))
+    resolved['axes.prop_cycle'] = cycler(color=sns.color_palette(palette))
+    resolved.update(rc or {})
+    return Theme(name, resolved)
+
+
+def get_theme(theme=None):
+    """
+    Devuelve un tema compilado (compilándolo la primera vez)
+    
+    Args:
+        theme: Nombre del tema, Theme ya compilado o None (DEFAULT_THEME)
+    
+    Returns:
+        Theme
+    """
+    if isinstance(theme, Theme):
+        return theme
+    name = theme or DEFAULT_THEME
+    compiled = _compiled.get(name)
+    if compiled is not None:
+        return compiled
+    if name not in THEMES:
+        raise ValueError(f"Tema desconocido: {name} (disponibles: {', '.join(THEMES)})")
+    with _compile_lock:
+        if name not in _compiled:
+            _compiled[name] = compile_theme(name, **THEMES[name])
+        return _compiled[name]
+
+
+# === APLICACIÓN A RCPARAMS ===
+
+class _ThemeLock:
+    """
+    Cerrojo lectores/escritor sobre rcParams
+    
+    Los gráficos con el tema instalado entran a la vez (compartido); uno
+    con otro tema entra solo (exclusivo). Un escritor esperando bloquea a
+    los lectores nuevos para no quedarse esperando indefinidamente.
+    """
+    
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting = 0
+    
+    @contextmanager
+    def shared(self):
+        with self._condition:
+            while self._writer or self._waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+    
+    @contextmanager
+    def exclusive(self):
+        with self._condition:
+            self._waiting += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+_rc_lock = _ThemeLock()
+_installed = None
+_install_lock = threading.Lock()
+_local = threading.local()
+
+
+def install_theme(theme=None):
+    """
+    Instala el tema por defecto en rcParams (una sola vez por proceso)
+    
+    Returns:
+        Theme instalado
+    """
+    global _installed
+    if _installed is None:
+        theme = get_theme(theme)
+        with _install_lock:
+            if _installed is None:
+                with _rc_lock.exclusive():
+                    matplotlib.rcParams.update(theme.rc)
+                _installed = theme
+    return _installed
+
+
+@contextmanager
+def _applied(theme):
+    """Aplica los parámetros de un tema y restaura los anteriores al salir"""
+    previous = {key: matplotlib.rcParams[key] for key in theme.rc}
+    matplotlib.rcParams.update(theme.rc)
+    try:
+        yield
+    finally:
+        matplotlib.rcParams.update(previous)
+
+
+@contextmanager
+def theme_scope(theme=None):
+    """
+    Deja activo un tema mientras dura el bloque
+    
+    Con el tema instalado no se modifica nada (varios hilos a la vez);
+    con otro tema se aplica en exclusiva y se restaura al salir.
+    
+    Args:
+        theme: Nombre, Theme o None (DEFAULT_THEME)
+    """
+    theme = get_theme(theme)
+    installed = install_theme()
+    current = getattr(_local, 'scope', None)
+    
+    # Bloques anidados del mismo hilo: no volver a tomar el cerrojo
+    if current is not None:
+        active, exclusive = current
+        if active is theme:
+            yield theme
+            return
+        if not exclusive:
+            raise RuntimeError(f"No se puede activar el tema {theme.name} dentro de un gráfico con el tema {active.name}")
+        _local.scope = (theme, True)
+        try:
+            with _applied(theme):
+                yield theme
+        finally:
+            _local.scope = current
+        return
+    
+    if theme is installed:
+        with _rc_lock.shared():
+            _local.scope = (theme, False)
+            try:
+                yield theme
+            finally:
+                _local.scope = None
+        return
+    
+    with _rc_lock.exclusive():
+        _local.scope = (theme, True)
+        try:
+            with _applied(theme):
+                yield theme
+        finally:
+            _local.scope = None
@@ -4,5 +4,43 @@ Módulo de procesamiento de datos
 
 from .loader import DataLoader
 from .cleaner import DataCleaner
+from .external import ExternalSorter
+from .dates import parse_release_dates
+from .correlation import StreamingCorrelation, correlation_matrix
+from .indexes import DatasetIndex, CategoryIndex, SortedIndex, dataset_index
+from .genres import GenreIndex, parse_genres
+from .topk import top_k
+from .filters import DataFilter, RowSelection
+from .dataset import SpotifyDataset, as_dataset
+from .pipeline import Pipeline, intermediate
+from .shared import SharedDataset, write_shared, ensure_shared
+from .text import encode_text, decode_text, map_text, contains_text
 
-__all__ = ['DataLoader', 'DataCleaner']
\ No newline at end of file
+__all__ = [
+    'DataLoader',
+    'DataCleaner',
+    'ExternalSorter',
+    'parse_release_dates',
+    'StreamingCorrelation',
+    'correlation_matrix',
+    'DatasetIndex',
+    'CategoryIndex',
+    'SortedIndex',
+    'dataset_index',
+    'GenreIndex',
+    'parse_genres',
+    'top_k',
+    'DataFilter',
+    'RowSelection',
+    'SpotifyDataset',
+    'as_dataset',
+    'Pipeline',
+    'intermediate',
+    'SharedDataset',
+    'write_shared',
+    'ensure_shared',
+    'encode_text',
+    'decode_text',
+    'map_text',
+    'contains_text'
+]
\ No newline at end of file
@@ -2,25 +2,46 @@
 🧹 LIMPIADOR DE DATOS
 ====================
 Limpia y preprocesa datos de Spotify
+
+Los archivos que no caben en memoria se limpian por bloques
+(DataCleaner.clean_external): la deduplicación y la ordenación por
+popularidad usan ordenación externa (external.py) con el mismo resultado.
 """
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-from ..config.settings import CLEAN_DATA_FILE
+from ..config.settings import (
+    RAW_DATA_FILE,
+    CLEAN_DATA_FILE,
+    SHARED_DATA_ENABLED,
+    DICTIONARY_COLUMNS,
+    CLEAN_MEMORY_BUDGET_MB,
+    CLEAN_EXTERNAL
+)
 from ..utils.logger import Logger
+from .dates import parse_release_dates, PRECISION_COLUMN
+from .external import ExternalSorter, ROW_COLUMN
+from .indexes import dataset_index
+from .loader import DataLoader, resolve_sources, read_columns
+from .text import encode_columns, map_text
 
-logger = Logger()
+logger = Logger(__name__)
 
 class DataCleaner:
     """Clase para limpiar datos de Spotify"""
     
-    def __init__(self, data):
+    def __init__(self, data, verbose=True):
         """
         Inicializa el limpiador con datos
         
         Args:
             data: DataFrame con datos crudos
+            verbose: Informar de cada paso (False al limpiar bloques sueltos)
         """
         self.data = data.copy()
         self.original_count = len(data)
+        self.verbose = verbose
     
     def clean(self):
         """
@@ -33,17 +54,154 @@ class DataCleaner:
         logger.info("Iniciando proceso de limpieza...")
         
         self._remove_duplicates()
-        self._handle_missing_values()
-        self._clean_text_fields()
-        self._convert_types()
-        self._validate_numeric_fields()
+        self._clean_rows()
         self._sort_data()
         
+        # Índices secundarios para seleccionar filas sin recorrer columnas
+        dataset_index(self.data).build()
+        
         removed = self.original_count - len(self.data)
         logger.success(f"Limpieza completada: {len(self.data):,} registros válidos ({removed:,} eliminados)")
         
         return self.data
     
+    @classmethod
+    def merge(cls, frames):
+        """
+        Une varios DataFrames ya limpios (p. ej. un CSV crudo por mes)
+        
+        Cada parte se limpia por separado; al unirlas se vuelven a quitar
+        los track_id repetidos entre partes (se queda el de la primera),
+        se recodifica el texto con un diccionario común y se reordena.
+        
+        Args:
+            frames: DataFrames devueltos por clean(), en orden de entrada
+        
+        Returns:
+            DataCleaner con los datos unidos (save() los guarda)
+        """
+        frames = list(frames)
+        cleaner = cls(pd.concat(frames, ignore_index=True))
+        cleaner.original_count = sum(len(frame) for frame in frames)
+        
+        cleaner._remove_duplicates()
+        encode_columns(cleaner.data, DICTIONARY_COLUMNS)
+        cleaner._sort_data()
+        dataset_index(cleaner.data).build()
+        
+        logger.success(f"Partes unidas: {len(frames)} ({len(cleaner.data):,} registros)")
+        return cleaner
+    
+    @staticmethod
+    def use_external(filepath=None):
+        """
+        Indica si un CSV crudo debe limpiarse por bloques (CLEAN_EXTERNAL)
+        
+        Con varias partes cuenta la suma de sus tamaños en disco (las
+        comprimidas ocupan bastante más al leerlas).
+        
+        Args:
+            filepath: CSV crudo, carpeta o patrón (usa RAW_DATA_FILE si es None)
+        """
+        if CLEAN_EXTERNAL != 'auto':
+            return bool(CLEAN_EXTERNAL)
+        try:
+            paths = resolve_sources(filepath or RAW_DATA_FILE)
+        except FileNotFoundError:
+            return False
+        return sum(path.stat().st_size for path in paths) > CLEAN_MEMORY_BUDGET_MB * 1024 ** 2
+    
+    @classmethod
+    def clean_external(cls, source=None, destination=None, budget_mb=None, chunksize=None):
+        """
+        Limpia un CSV crudo que no cabe en memoria y escribe el CSV limpio
+        
+        Mismo resultado que clean() + save(): de cada track_id se queda la
+        primera aparición en el archivo (con varias partes, en el orden de
+        sus nombres) y las filas se ordenan por popularidad descendente
+        (empates en el orden del archivo). Pasadas:
+        1. Lectura por bloques y ordenación externa por (track_id, fila)
+        2. Primera fila de cada track_id, limpieza fila a fila (faltantes,
+           texto, tipos, validación) y ordenación externa por (popularidad, fila)
+        3. Escritura del CSV limpio en ese orden
+        
+        Args:
+            source: CSV crudo, carpeta o patrón de partes (usa RAW_DATA_FILE si es None)
+            destination: CSV limpio (usa CLEAN_DATA_FILE si es None)
+            budget_mb: Memoria de cada ordenación (usa CLEAN_MEMORY_BUDGET_MB si es None)
+            chunksize: Filas por bloque de lectura (usa CHUNK_SIZE si es None)
+        
+        Returns:
+            Número de registros válidos escritos
+        """
+        source = source or RAW_DATA_FILE
+        destination = Path(destination or CLEAN_DATA_FILE)
+        budget_mb = budget_mb or CLEAN_MEMORY_BUDGET_MB
+        
+        logger.header("LIMPIEZA DE DATOS (POR BLOQUES)")
+        logger.info(f"Ordenación externa con {budget_mb:,} MB de memoria: {Path(source).name}")
+        
+        columns = read_columns(source)
+        by_id = ['track_id'] if 'track_id' in columns else []
+        by_popularity = ['track_popularity'] if 'track_popularity' in columns else []
+        if not by_id:
+            logger.warning("  • Columna 'track_id' no encontrada, omitiendo eliminación de duplicados")
+        
+        total = unique = written = 0
+        dtypes = {}
+        with ExternalSorter(by_id, budget_mb=budget_mb) as first_pass, \
+                ExternalSorter(by_popularity, ascending=[False] * len(by_popularity), budget_mb=budget_mb) as second_pass:
+            
+            # 1. Bloques del CSV crudo con su posición en el archivo
+            for chunk in DataLoader().iter_chunks(source, chunksize=chunksize):
+                chunk[ROW_COLUMN] = np.arange(total, total + len(chunk))
+                total += len(chunk)
+                # Sin track_id la fila se descartaría igualmente (_handle_missing_values)
+                first_pass.add(chunk.dropna(subset=by_id) if by_id else chunk)
+            
+            # 2. Primera aparición de cada track_id y limpieza fila a fila
+            last_id = None
+            for block in first_pass.sorted_blocks():
+                if by_id:
+                    ids = block['track_id']
+                    block = block[~ids.duplicated() & (ids != last_id)]
+                    last_id = ids.iat[-1]
+                unique += len(block)
+                cleaner = cls(block, verbose=False)
+                cleaner._clean_rows()
+                for column, dtype in cleaner.data.dtypes.items():
+                    dtypes.setdefault(column, set()).add(dtype)
+                second_pass.add(cleaner.data)
+            
+            if by_id and first_pass.rows > unique:
+                logger.info(f"  • Duplicados eliminados: {first_pass.rows - unique:,}")
+            
+            # 3. CSV limpio en orden de popularidad
+            common = _common_dtypes(dtypes)
+            with open(destination, 'w', encoding='utf-8-sig', newline='') as handle:
+                for block in second_pass.sorted_blocks():
+                    block = block.drop(columns=ROW_COLUMN).astype(common)
+                    block.to_csv(handle, header=not written, index=False)
+                    written += len(block)
+            
+            logger.info(f"  • Tramos ordenados en disco: {len(first_pass.runs) + len(second_pass.runs)}")
+        
+        logger.success(f"Limpieza completada: {written:,} registros válidos ({total - written:,} eliminados)")
+        logger.success(f"Datos guardados en: {destination.name}")
+        return written
+    
+    def _report(self, message, warning=False):
+        """Informa de un paso de la limpieza (solo si verbose)"""
+        if self.verbose:
+            (logger.warning if warning else logger.info)(message)
+    
+    def _clean_rows(self):
+        """Pasos que tratan cada fila por separado (no dependen del resto del archivo)"""
+        self._handle_missing_values()
+        self._clean_text_fields()
+        self._convert_types()
+        self._validate_numeric_fields()
+    
     def _remove_duplicates(self):
         """Elimina registros duplicados por track_id"""
         before = len(self.data)
@@ -52,9 +210,9 @@ class DataCleaner:
             self.data = self.data.drop_duplicates(subset=['track_id'], keep='first')
             removed = before - len(self.data)
             if removed > 0:
-                logger.info(f"  • Duplicados eliminados: {removed:,}")
+                self._report(f"  • Duplicados eliminados: {removed:,}")
         else:
-            logger.warning("  • Columna 'track_id' no encontrada, omitiendo eliminación de duplicados")
+            self._report("  • Columna 'track_id' no encontrada, omitiendo eliminación de duplicados", warning=True)
     
     def _handle_missing_values(self):
         """Maneja valores faltantes en columnas críticas"""
@@ -67,22 +225,29 @@ class DataCleaner:
             self.data = self.data.dropna(subset=existing_columns)
             removed = before - len(self.data)
             if removed > 0:
-                logger.info(f"  • Valores faltantes eliminados: {removed:,}")
+                self._report(f"  • Valores faltantes eliminados: {removed:,}")
         else:
-            logger.warning("  • No se encontraron columnas críticas para validar")
+            self._report("  • No se encontraron columnas críticas para validar", warning=True)
     
     def _clean_text_fields(self):
-        """Limpia espacios en blanco de campos de texto"""
+        """
+        Limpia espacios en blanco de campos de texto
+        
+        Los campos se guardan como diccionario + códigos (DICTIONARY_COLUMNS)
+        y el strip se aplica una vez por cadena distinta, no por fila.
+        """
         text_fields = ['track_name', 'artist_name', 'album_name']
         cleaned = 0
         
+        encode_columns(self.data, DICTIONARY_COLUMNS)
+        
         for field in text_fields:
             if field in self.data.columns:
-                self.data[field] = self.data[field].astype(str).str.strip()
+                self.data[field] = map_text(self.data[field], lambda values: values.str.strip())
                 cleaned += 1
         
         if cleaned > 0:
-            logger.info(f"  • Campos de texto limpiados: {cleaned}")
+            self._report(f"  • Campos de texto limpiados: {cleaned}")
     
     def _convert_types(self):
         """Convierte tipos de datos apropiadamente"""
@@ -98,17 +263,16 @@ class DataCleaner:
             })
             conversions += 1
         
-        # Convertir fechas
+        # Convertir fechas (día, mes o año según el valor; ver dates.py)
         if 'album_release_date' in self.data.columns:
-            self.data['album_release_date'] = pd.to_datetime(
-                self.data['album_release_date'], 
-                errors='coerce'
-            )
-            self.data['year'] = self.data['album_release_date'].dt.year
+            dates, precision, year = parse_release_dates(self.data['album_release_date'])
+            self.data['album_release_date'] = dates
+            self.data[PRECISION_COLUMN] = precision
+            self.data['year'] = year
             conversions += 1
         
         if conversions > 0:
-            logger.info(f"  • Tipos de datos convertidos: {conversions}")
+            self._report(f"  • Tipos de datos convertidos: {conversions}")
     
     def _validate_numeric_fields(self):
         """Valida y corrige campos numéricos"""
@@ -134,27 +298,53 @@ class DataCleaner:
         
         removed = before - len(self.data)
         if removed > 0:
-            logger.info(f"  • Valores numéricos inválidos corregidos/eliminados: {removed:,}")
+            self._report(f"  • Valores numéricos inválidos corregidos/eliminados: {removed:,}")
     
     def _sort_data(self):
         """Ordena datos por popularidad descendente"""
         if 'track_popularity' in self.data.columns:
-            self.data = self.data.sort_values('track_popularity', ascending=False)
+            # Estable: los empates conservan el orden del archivo (como clean_external)
+            self.data = self.data.sort_values('track_popularity', ascending=False, kind='stable')
             self.data = self.data.reset_index(drop=True)
-            logger.info(f"  • Datos ordenados por popularidad")
+            self._report(f"  • Datos ordenados por popularidad")
     
-    def save(self, filepath=None):
+    def save(self, filepath=None, shared=None):
         """
         Guarda datos limpios en CSV
         
         Args:
             filepath: Ruta donde guardar (usa default si es None)
+            shared: Escribir también la versión compartida para procesos
+                    (usa SHARED_DATA_ENABLED si es None)
         """
         filepath = filepath or CLEAN_DATA_FILE
+        shared = SHARED_DATA_ENABLED if shared is None else shared
         
         try:
             self.data.to_csv(filepath, index=False, encoding='utf-8-sig')
             logger.success(f"Datos guardados en: {filepath.name}")
         except Exception as e:
             logger.error(f"Error al guardar datos: {e}")
-            raise
\ No newline at end of file
+            raise
+        
+        if shared:
+            from .shared import write_shared
+            try:
+                write_shared(self.data, source=filepath)
+            except Exception as e:
+                logger.warning(f"No se pudo escribir el dataset compartido: {e}")
+
+
+def _common_dtypes(dtypes):
+    """
+    Tipo común de las columnas numéricas que cambian de un bloque a otro
+    
+    Un bloque sin nulos deja una columna como entera y otro con nulos como
+    float; en memoria toda la columna sería float y así se escribe.
+    """
+    common = {}
+    for column, kinds in dtypes.items():
+        numeric = all(pd.api.types.is_numeric_dtype(kind) and not pd.api.types.is_bool_dtype(kind) for kind in kinds)
+        if len(kinds) > 1 and numeric:
+            common[column] = np.result_type(*kinds)
+    return common
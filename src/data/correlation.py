@@ -0,0 +1,216 @@
+"""
+🔗 CORRELACIÓN INCREMENTAL
+=========================
+Calcula matrices de correlación bloque a bloque, sin cargar todo el archivo
+"""
+import numpy as np
+import pandas as pd
+from ..config.settings import CHUNK_SIZE, CORRELATION_SAMPLE_SIZE
+
+METHODS = ('pearson', 'spearman')
+
+
+class StreamingCorrelation:
+    """
+    Acumulador de correlación de Pearson por pares (co-momentos tipo Welford)
+    
+    Mantiene, para cada par de columnas (i, j), el número de filas válidas
+    en ambas, las medias, las varianzas y el co-momento sobre esas filas.
+    Los bloques se combinan con la fórmula de Chan et al., por lo que el
+    resultado coincide con ``DataFrame.corr()`` (observaciones completas
+    por pares) sin mantener más de un bloque en memoria.
+    """
+    
+    def __init__(self, columns):
+        """
+        Args:
+            columns: Lista de columnas numéricas a correlacionar
+        """
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.count = np.zeros((k, k))
+        self.mean = np.zeros((k, k))       # Media de i sobre las filas válidas del par (i, j)
+        self.var = np.zeros((k, k))        # Suma de cuadrados de i sobre el par (i, j)
+        self.comoment = np.zeros((k, k))
+    
+    def update(self, chunk):
+        """
+        Incorpora un bloque de filas
+        
+        Args:
+            chunk: DataFrame (o array n×k) con las columnas del acumulador
+        """
+        if isinstance(chunk, pd.DataFrame):
+            chunk = chunk[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = np.asarray(chunk, dtype=np.float64)
+        if len(values) == 0:
+            return self
+        
+        valid = ~np.isnan(values)
+        mask = valid.astype(np.float64)
+        
+        # Centrar por la media del bloque para estabilidad numérica
+        counts = valid.sum(axis=0)
+        shift = np.divide(np.where(valid, values, 0).sum(axis=0), counts,
+                          out=np.zeros(values.shape[1]), where=counts > 0)
+        centered = np.where(valid, values - shift, 0.0)
+        
+        n = mask.T @ mask
+        sums = centered.T @ mask                  # Σ x_i sobre filas válidas en (i, j)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            partial_mean = np.where(n > 0, sums / n, 0.0)
+        products = centered.T @ centered
+        squares = (centered ** 2).T @ mask
+        
+        chunk_mean = shift[:, None] + partial_mean
+        chunk_var = squares - sums * partial_mean
+        chunk_comoment = products - sums * partial_mean.T
+        
+        self._combine(n, chunk_mean, chunk_var, chunk_comoment)
+        return self
+    
+    def merge(self, other):
+        """
+        Combina otro acumulador con las mismas columnas (p. ej. de otro proceso)
+        
+        Args:
+            other: StreamingCorrelation
+        """
+        if other.columns != self.columns:
+            raise ValueError("Los acumuladores deben tener las mismas columnas")
+        self._combine(other.count, other.mean, other.var, other.comoment)
+        return self
+    
+    def _combine(self, n_b, mean_b, var_b, comoment_b):
+        """Fórmula de combinación de Chan et al. aplicada a toda la matriz"""
+        n_a = self.count
+        n = n_a + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(n > 0, n_a * n_b / n, 0.0)
+            ratio = np.where(n > 0, n_b / n, 0.0)
+        delta = mean_b - self.mean
+        
+        self.comoment = self.comoment + comoment_b + delta * delta.T * weight
+        self.var = self.var + var_b + delta ** 2 * weight
+        self.mean = self.mean + delta * ratio
+        self.count = n
+    
+    def result(self):
+        """
+        Returns:
+            DataFrame k×k con la matriz de correlación
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            denom = np.sqrt(self.var * self.var.T)
+            corr = np.where((self.count > 1) & (denom > 0), self.comoment / denom, np.nan)
+        corr = np.clip(corr, -1.0, 1.0)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+class RankSketch:
+    """
+    Muestra aleatoria de tamaño fijo por columna para rangos aproximados
+    
+    Usa un muestreo por prioridades (se conservan las k claves aleatorias
+    más pequeñas), que es combinable entre bloques y completamente
+    vectorizado. El rango aproximado de un valor es su posición
+    (rango medio, con empates) dentro de la muestra ordenada.
+    """
+    
+    def __init__(self, columns, sample_size=CORRELATION_SAMPLE_SIZE, seed=42):
+        self.columns = list(columns)
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self._values = [np.empty(0) for _ in self.columns]
+        self._keys = [np.empty(0) for _ in self.columns]
+        self._sorted = None
+    
+    def update(self, chunk):
+        """Incorpora un bloque a la muestra de cada columna"""
+        for i, column in enumerate(self.columns):
+            values = chunk[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            keys = self.rng.random(len(values))
+            
+            values = np.concatenate([self._values[i], values])
+            keys = np.concatenate([self._keys[i], keys])
+            if len(keys) > self.sample_size:
+                keep = np.argpartition(keys, self.sample_size)[:self.sample_size]
+                values, keys = values[keep], keys[keep]
+            
+            self._values[i], self._keys[i] = values, keys
+        self._sorted = None
+        return self
+    
+    def ranks(self, chunk):
+        """
+        Transforma un bloque a rangos aproximados en [0, 1]
+        
+        Args:
+            chunk: DataFrame con las columnas de la muestra
+        
+        Returns:
+            Array n×k con NaN donde el valor original falta
+        """
+        if self._sorted is None:
+            self._sorted = [np.sort(v) for v in self._values]
+        
+        out = np.full((len(chunk), len(self.columns)), np.nan)
+        for i, column in enumerate(self.columns):
+            sample = self._sorted[i]
+            if len(sample) == 0:
+                continue
+            values = chunk[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = ~np.isnan(values)
+            left = np.searchsorted(sample, values[valid], side='left')
+            right = np.searchsorted(sample, values[valid], side='right')
+            out[valid, i] = (left + right) / (2.0 * len(sample))
+        return out
+
+
+def iter_frame_chunks(data, columns, chunksize=CHUNK_SIZE):
+    """
+    Recorre un DataFrame en memoria por bloques de filas
+    
+    Args:
+        data: DataFrame
+        columns: Columnas a extraer
+        chunksize: Filas por bloque
+    
+    Yields:
+        DataFrame con ``chunksize`` filas como máximo
+    """
+    for start in range(0, len(data), chunksize):
+        yield data.iloc[start:start + chunksize][columns]
+
+
+def correlation_matrix(chunks, columns, method='pearson'):
+    """
+    Calcula la matriz de correlación a partir de una fuente de bloques
+    
+    Args:
+        chunks: Función sin argumentos que devuelve un iterador de DataFrames
+                (se llama dos veces para Spearman: muestra + rangos)
+        columns: Columnas numéricas a correlacionar
+        method: 'pearson' o 'spearman' (rangos aproximados)
+    
+    Returns:
+        DataFrame con la matriz de correlación
+    """
+    if method not in METHODS:
+        raise ValueError(f"Método no soportado: {method} (usa {', '.join(METHODS)})")
+    
+    accumulator = StreamingCorrelation(columns)
+    
+    if method == 'pearson':
+        for chunk in chunks():
+            accumulator.update(chunk)
+        return accumulator.result()
+    
+    # Spearman: primera pasada para la muestra, segunda para los rangos
+    sketch = RankSketch(columns)
+    for chunk in chunks():
+        sketch.update(chunk)
+    for chunk in chunks():
+        accumulator.update(sketch.ranks(chunk))
+    return accumulator.result()
@@ -0,0 +1,370 @@
+"""
+💾 DATASET DE SPOTIFY
+====================
+Objeto que reciben todos los gráficos y helpers en lugar de un DataFrame
+
+Un SpotifyDataset agrupa el DataFrame y todo lo que se deriva de él:
+esquema, huella del contenido, índices secundarios, resumen estadístico,
+agregados compartidos entre gráficos y selecciones filtradas. Cada
+estructura derivada se calcula como máximo una vez por proceso; los diez
+gráficos la reutilizan.
+"""
+import hashlib
+import threading
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from ..config.settings import CLEAN_DATA_FILE
+from ..utils.logger import Logger
+from .indexes import dataset_index
+
+logger = Logger(__name__)
+
+MAX_SELECTIONS = 8    # Selecciones filtradas que se conservan por dataset
+
+# Datasets creados implícitamente a partir de un DataFrame (viven mientras alguien los use)
+_wrapped = weakref.WeakValueDictionary()
+
+
+class SpotifyDataset:
+    """
+    DataFrame de Spotify más sus estructuras derivadas (calculadas una vez)
+    
+    Uso:
+        >>> dataset = SpotifyDataset.load()
+        >>> heatmap(dataset)
+        >>> dataset.summary()['total_tracks']
+        >>> recientes = dataset.select(DataFilter(years=(2020, None)))
+    """
+    
+    def __init__(self, frame, source=None, filters=None, parent=None):
+        """
+        Args:
+            frame: DataFrame limpio (no debe modificarse después)
+            source: Archivo del que se cargó (opcional)
+            filters: DataFilter que produjo este subconjunto (opcional)
+            parent: Dataset completo del que se filtró (opcional)
+        """
+        self.frame = frame
+        self.source = Path(source) if source is not None else None
+        self.filters = filters
+        self.parent = parent
+        self._cache = {}
+        self._selections = {}
+        self._lock = threading.RLock()
+    
+    @classmethod
+    def load(cls, source=None, save_clean=True):
+        """
+        Carga el dataset limpio (o limpia los datos crudos si no existe)
+        
+        Args:
+            source: CSV limpio (usa CLEAN_DATA_FILE si es None)
+            save_clean: Guardar el resultado de la limpieza si se partió de datos crudos
+        
+        Returns:
+            SpotifyDataset
+        """
+        from .loader import DataLoader
+        from .cleaner import DataCleaner
+        
+        loader = DataLoader()
+        source = Path(source or CLEAN_DATA_FILE)
+        if source.exists():
+            return cls(loader.load_clean_data(source), source=source)
+        
+        logger.warning("Datos limpios no encontrados. Procesando datos crudos...")
+        if save_clean and DataCleaner.use_external():
+            # No cabe en memoria: se limpia por bloques directamente al CSV limpio
+            DataCleaner.clean_external(destination=source)
+            return cls(loader.load_clean_data(source), source=source)
+        
+        cleaner = DataCleaner(loader.load_raw_data())
+        frame = cleaner.clean()
+        if save_clean:
+            cleaner.save(source)
+        return cls(frame, source=source)
+    
+    @classmethod
+    def attach(cls, directory=None):
+        """
+        Abre la versión compartida (mmap) escrita por DataCleaner.save
+        
+        Las columnas numéricas no se copian: todos los procesos que la
+        abren comparten las mismas páginas de memoria.
+        
+        Args:
+            directory: Carpeta compartida (usa SHARED_DATA_DIR si es None)
+        
+        Returns:
+            SpotifyDataset
+        """
+        from .shared import SharedDataset
+        
+        shared = SharedDataset(directory)
+        return cls(shared.frame(), source=shared.source)
+    
+    # === ACCESO AL DATAFRAME ===
+    
+    def __len__(self):
+        return len(self.frame)
+    
+    def __getitem__(self, key):
+        return self.frame[key]
+    
+    @property
+    def columns(self):
+        return self.frame.columns
+    
+    @property
+    def is_filtered(self):
+        return self.filters is not None
+    
+    # === ESTRUCTURAS DERIVADAS ===
+    
+    def cached(self, key, compute):
+        """
+        Devuelve un valor derivado, calculándolo solo la primera vez
+        
+        Es seguro entre hilos: si dos gráficos piden lo mismo a la vez,
+        uno calcula y el otro espera el resultado.
+        
+        Args:
+            key: Clave hashable del valor
+            compute: Función sin argumentos que lo calcula
+        
+        Returns:
+            El valor guardado
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = compute()
+            return self._cache[key]
+    
+    @property
+    def index(self):
+        """Índices secundarios (año, tipo de álbum, explícito, artista)"""
+        return self.cached('index', lambda: dataset_index(self.frame).build())
+    
+    @property
+    def pipeline(self):
+        """Intermedios compartidos entre gráficos (pipeline.py)"""
+        from .pipeline import Pipeline
+        return self.cached('pipeline', lambda: Pipeline(self))
+    
+    @property
+    def schema(self):
+        """Diccionario columna -> tipo de dato"""
+        return self.cached('schema', lambda: {col: str(dtype) for col, dtype in self.frame.dtypes.items()})
+    
+    @property
+    def fingerprint(self):
+        """Huella corta del contenido (cambia si cambia cualquier valor)"""
+        def compute():
+            hashes = pd.util.hash_pandas_object(self.frame, index=False).to_numpy()
+            digest = hashlib.sha1(hashes.tobytes())
+            digest.update(','.join(self.frame.columns).encode('utf-8'))
+            return digest.hexdigest()[:16]
+        return self.cached('fingerprint', compute)
+    
+    def summary(self):
+        """
+        Resumen estadístico (el mismo formato que DataLoader.get_data_summary)
+        
+        Returns:
+            Diccionario con estadísticas
+        """
+        def compute():
+            df = self.frame
+            years = self.index.range('year') if 'year' in df.columns else None
+            has_years = years is not None and len(years.sorted) > 0
+            return {
+                'total_tracks': len(df),
+                'unique_artists': len(self.index.category('artist_name').uniques) if 'artist_name' in df.columns else 0,
+                'unique_albums': df['album_name'].nunique() if 'album_name' in df.columns else 0,
+                'explicit_count': int(df['explicit'].sum()) if 'explicit' in df.columns else 0,
+                'avg_popularity': df['track_popularity'].mean() if 'track_popularity' in df.columns else 0,
+                'date_range': (
+                    int(years.sorted[0]) if has_years else None,
+                    int(years.sorted[-1]) if has_years else None
+                )
+            }
+        return self.cached('summary', compute)
+    
+    def value_counts(self, column):
+        """
+        Filas por valor de una columna categórica, de mayor a menor
+        
+        Se obtiene del índice de la columna (sin volver a recorrerla) y lo
+        comparten todos los gráficos que piden los "top N".
+        
+        Returns:
+            Serie valor -> número de filas
+        """
+        def compute():
+            index = self.index.category(column)
+            counts = pd.Series(index.counts(), index=pd.Index(index.uniques, name=column), name='count')
+            return counts.sort_values(ascending=False, kind='stable')
+        return self.cached(('value_counts', column), compute)
+    
+    def top_counts(self, column, n, filters=None):
+        """
+        Los ``n`` valores más frecuentes de una columna con su número de filas
+        
+        Usa bincount + argpartition sobre los códigos del índice: no ordena
+        todos los conteos. Los empates se resuelven por orden de aparición
+        (como value_counts). Con ``filters`` cuenta solo las filas
+        seleccionadas, sin materializar el subconjunto (ese resultado no se
+        guarda: cada filtro distinto ocuparía una entrada más).
+        
+        Args:
+            column: Columna categórica
+            n: Número de valores
+            filters: DataFilter opcional
+        
+        Returns:
+            Serie valor -> número de filas, de mayor a menor
+        """
+        def compute(positions=None):
+            values, counts = self.index.category(column).top(n, positions)
+            return pd.Series(counts, index=pd.Index(values, name=column), name='count')
+        
+        if filters is not None and not filters.is_empty:
+            return compute(np.flatnonzero(filters.mask(self.frame)))
+        return self.cached(('top_counts', column, n), compute)
+    
+    def top_values(self, column, n, filters=None):
+        """Los ``n`` valores más frecuentes de una columna"""
+        return self.top_counts(column, n, filters=filters).index
+    
+    def top_by(self, column, by, n):
+        """
+        Los ``n`` valores distintos de ``column`` con mayor máximo de ``by``
+        
+        Cada valor aparece una sola vez (p. ej. los 5 artistas más
+        populares son siempre 5 artistas distintos).
+        
+        Args:
+            column: Columna categórica (p. ej. 'artist_name')
+            by: Columna numérica (p. ej. 'artist_popularity')
+            n: Número de valores
+        
+        Returns:
+            Serie valor -> máximo, de mayor a menor
+        """
+        def compute():
+            scores = self.frame[by].to_numpy(dtype=np.float64, na_value=np.nan)
+            values, maxima = self.index.category(column).top_by(scores, n)
+            return pd.Series(maxima, index=pd.Index(values, name=column), name=by)
+        return self.cached(('top_by', column, by, n), compute)
+    
+    def artist_popularity(self):
+        """
+        Popularidad (máxima) de cada artista, de mayor a menor
+        
+        Returns:
+            Serie artista -> popularidad
+        """
+        return self.top_by('artist_name', 'artist_popularity', len(self.index.category('artist_name').uniques))
+    
+    def genre_stats(self):
+        """
+        Métricas por género (canciones, artistas, popularidad media, seguidores)
+        
+        Se calculan con bincount sobre el índice de géneros, sin expandir
+        el DataFrame a una fila por género.
+        
+        Returns:
+            DataFrame indexado por género, de más a menos canciones
+        """
+        return self.cached('genre_stats', lambda: self.index.genres().aggregate(self.frame))
+    
+    def correlation(self, columns, method='pearson'):
+        """
+        Matriz de correlación de las columnas indicadas (calculada una vez)
+        
+        Args:
+            columns: Columnas numéricas
+            method: 'pearson' o 'spearman'
+        """
+        from .correlation import correlation_matrix, iter_frame_chunks
+        
+        columns = [col for col in columns if col in self.frame.columns]
+        return self.cached(
+            ('correlation', tuple(columns), method),
+            lambda: correlation_matrix(lambda: iter_frame_chunks(self.frame, columns), columns, method=method)
+        )
+    
+    # === SELECCIONES ===
+    
+    def select(self, filters, selection=None):
+        """
+        Subconjunto filtrado como otro SpotifyDataset
+        
+        La selección de cada filtro se calcula una vez y se reutiliza, con
+        sus propios índices y agregados.
+        
+        Args:
+            filters: DataFilter (None o vacío = este mismo dataset)
+            selection: RowSelection ya evaluada para ese filtro (opcional)
+        
+        Returns:
+            SpotifyDataset
+        """
+        if filters is None or filters.is_empty:
+            return self
+        key = filters.key()
+        with self._lock:
+            subset = self._selections.get(key)
+            if subset is None:
+                if selection is None:
+                    selection = filters.select(self.frame)
+                subset = SpotifyDataset(selection.frame, source=self.source, filters=filters, parent=self)
+                if len(self._selections) >= MAX_SELECTIONS:
+                    self._selections.pop(next(iter(self._selections)))
+                self._selections[key] = subset
+            return subset
+    
+    def __repr__(self):
+        label = f", filtro: {self.filters.describe()}" if self.filters is not None else ''
+        return f"SpotifyDataset({len(self):,} filas{label})"
+
+
+def as_dataset(data):
+    """
+    Convierte lo que recibe un gráfico en un SpotifyDataset
+    
+    Acepta un SpotifyDataset, un RowSelection (DataFilter.select) o un
+    DataFrame. Un mismo DataFrame siempre produce el mismo dataset, así
+    que los gráficos que lo reciben comparten sus agregados.
+    
+    Args:
+        data: SpotifyDataset, RowSelection o DataFrame (o None)
+    
+    Returns:
+        SpotifyDataset o None
+    """
+    from .filters import RowSelection
+    
+    if data is None or isinstance(data, SpotifyDataset):
+        return data
+    if isinstance(data, RowSelection):
+        if data.filters is None:
+            return _wrap(data.frame)
+        return as_dataset(data.source).select(data.filters, selection=data)
+    return _wrap(data)
+
+
+def _wrap(frame):
+    """Dataset asociado a un DataFrame (el mismo mientras siga en uso)"""
+    dataset = _wrapped.get(id(frame))
+    if dataset is None or dataset.frame is not frame:
+        dataset = SpotifyDataset(frame)
+        _wrapped[id(frame)] = dataset
+    return dataset
@@ -0,0 +1,91 @@
+"""
+📅 FECHAS DE LANZAMIENTO
+=======================
+Convierte album_release_date en bloque, respetando su precisión
+
+Spotify mezcla tres precisiones en la misma columna: '2019-05-17' (día),
+'2019-05' (mes) y '2019' (año). pd.to_datetime(errors='coerce') deduce un
+solo formato del primer valor y deja como NaT las otras precisiones, o, si
+no encuentra uno común, interpreta fila a fila. Aquí:
+- Se trabaja sobre los valores distintos (las canciones de un álbum
+  comparten fecha), no sobre cada fila
+- Cada valor se clasifica por su longitud (10, 7 o 4 caracteres) y cada
+  grupo se convierte de una vez con su formato fijo
+- Solo lo que no encaja en ninguna forma (p. ej. '2019-5-7') se
+  interpreta valor a valor
+- La precisión va en PRECISION_COLUMN ('day', 'month', 'year') y el año
+  como entero pequeño (Int16), sin pasar por float
+
+Las fechas de mes o de año quedan en su primer día ('2019' -> 2019-01-01).
+"""
+import numpy as np
+import pandas as pd
+
+PRECISION_COLUMN = 'release_date_precision'
+PRECISIONS = ('day', 'month', 'year')
+
+# Longitud del texto -> (formato, precisión)
+SHAPES = {
+    10: ('%Y-%m-%d', 'day'),
+    7: ('%Y-%m', 'month'),
+    4: ('%Y', 'year'),
+}
+
+
+def parse_release_dates(values):
+    """
+    Convierte fechas de lanzamiento de precisión mixta
+    
+    Args:
+        values: Serie de texto (o Categorical) con las fechas
+    
+    Returns:
+        Tupla de Series alineadas con ``values``: (fechas datetime64,
+        precisión Categorical con PRECISIONS, año Int16). Los valores
+        vacíos o no reconocidos quedan como nulos en las tres.
+    """
+    series = pd.Series(values, copy=False)
+    codes, uniques = pd.factorize(series)      # -1 = nulo
+    text = pd.Series(np.asarray(uniques, dtype=object)).astype(str).str.strip()
+    lengths = text.str.len().to_numpy()
+    
+    # Una posición extra al final para los nulos: codes == -1 la selecciona
+    dates = None
+    precision = np.full(len(text) + 1, -1, dtype=np.int8)
+    pending = np.ones(len(text), dtype=bool)
+    
+    def store(positions, parsed, kind):
+        nonlocal dates
+        parsed = parsed.to_numpy()
+        if dates is None:
+            dates = np.full(len(text) + 1, np.datetime64('NaT'), dtype=parsed.dtype)
+        ok = ~np.isnat(parsed)
+        dates[positions[ok]] = parsed[ok]
+        precision[positions[ok]] = PRECISIONS.index(kind)
+        pending[positions] = False
+    
+    for length, (fmt, kind) in SHAPES.items():
+        positions = np.flatnonzero(lengths == length)
+        if len(positions):
+            parsed = pd.to_datetime(text.iloc[positions], format=fmt, errors='coerce')
+            ok = parsed.notna().to_numpy()
+            store(positions[ok], parsed[ok], kind)
+    
+    rest = np.flatnonzero(pending & (lengths > 0))
+    if len(rest):
+        store(rest, pd.to_datetime(text.iloc[rest], format='mixed', errors='coerce'), 'day')
+    
+    if dates is None:
+        dates = np.full(len(text) + 1, np.datetime64('NaT'), dtype='datetime64[ns]')
+    
+    valid = ~np.isnat(dates)
+    years = np.zeros(len(dates), dtype=np.int16)
+    years[valid] = dates[valid].astype('datetime64[Y]').astype(np.int64) + 1970
+    
+    index = series.index
+    return (
+        pd.Series(dates[codes], index=index, name=series.name),
+        pd.Series(pd.Categorical.from_codes(precision[codes], categories=PRECISIONS), index=index,
+                  name=PRECISION_COLUMN),
+        pd.Series(pd.arrays.IntegerArray(years[codes], ~valid[codes]), index=index, name='year')
+    )
@@ -0,0 +1,250 @@
+"""
+💽 ORDENACIÓN EXTERNA
+====================
+Ordena tablas que no caben en memoria: tramos ordenados en disco + mezcla
+
+- Los bloques que llegan (p. ej. leídos del CSV por partes) se acumulan
+  hasta llenar la memoria asignada; entonces se ordenan y se vuelcan a un
+  archivo temporal (un "tramo") como una serie de bloques pequeños
+- La mezcla de k tramos lee un bloque de cada uno: todas las filas que no
+  superan el menor de los últimos valores de esos bloques ya tienen su
+  sitio definitivo y se emiten de una vez (ordenadas con pandas, sin
+  comparar fila a fila en Python)
+- Si hay más tramos de los que caben a la vez en memoria, se mezclan por
+  grupos en tramos más largos hasta que queden pocos
+
+El orden es estable: cada fila lleva su posición de entrada (columna
+ROW_COLUMN, la pone quien añade los bloques) y se usa como último criterio,
+así los empates conservan el orden del archivo, igual que
+sort_values(kind='stable') en memoria. Los nulos van al final.
+"""
+import pickle
+import shutil
+import tempfile
+from bisect import bisect_right
+from pathlib import Path
+
+import pandas as pd
+from ..config.settings import CLEAN_MEMORY_BUDGET_MB
+from ..utils.logger import Logger
+
+logger = Logger(__name__)
+
+ROW_COLUMN = '_row'     # Posición de cada fila en la entrada (desempate estable)
+RUN_BLOCKS = 16         # Bloques en que se divide cada tramo al volcarlo
+
+
+class Run:
+    """Tramo ordenado en disco: bloques de DataFrame serializados uno tras otro"""
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.rows = 0
+        self.blocks = 0
+    
+    def write(self, frames, block_rows):
+        """
+        Vuelca bloques ya ordenados, partidos en trozos de ``block_rows`` filas
+        
+        Args:
+            frames: Iterable de DataFrames (en orden)
+            block_rows: Filas por bloque en el archivo
+        
+        Returns:
+            El propio tramo
+        """
+        with open(self.path, 'wb') as handle:
+            for frame in frames:
+                for start in range(0, len(frame), block_rows):
+                    pickle.dump(frame.iloc[start:start + block_rows], handle, protocol=pickle.HIGHEST_PROTOCOL)
+                    self.blocks += 1
+                self.rows += len(frame)
+        return self
+    
+    def read(self):
+        """Genera los bloques del tramo en orden"""
+        with open(self.path, 'rb') as handle:
+            for _ in range(self.blocks):
+                yield pickle.load(handle)
+    
+    def remove(self):
+        self.path.unlink(missing_ok=True)
+
+
+class ExternalSorter:
+    """
+    Ordena por columnas una secuencia de bloques con memoria limitada
+    
+    Uso:
+        >>> with ExternalSorter(['track_popularity'], ascending=[False]) as sorter:
+        ...     for chunk in chunks:            # Cada bloque con su columna '_row'
+        ...         sorter.add(chunk)
+        ...     for block in sorter.sorted_blocks():
+        ...         block.to_csv(...)
+    """
+    
+    def __init__(self, by, ascending=None, budget_mb=None, directory=None):
+        """
+        Args:
+            by: Columnas de ordenación (vacío = solo el orden de entrada)
+            ascending: Lista de bool por columna (todas ascendentes si es None)
+            budget_mb: Memoria para los bloques en curso (usa CLEAN_MEMORY_BUDGET_MB si es None)
+            directory: Carpeta para los tramos temporales (la del sistema si es None)
+        """
+        self.by = list(by)
+        self.ascending = list(ascending) if ascending is not None else [True] * len(self.by)
+        self.budget = (budget_mb or CLEAN_MEMORY_BUDGET_MB) * 1024 ** 2
+        self.directory = directory
+        self.runs = []
+        self.rows = 0
+        self._pending = []
+        self._pending_bytes = 0
+        self._row_bytes = None
+        self._tmp = None
+        self._created = 0
+    
+    # === ENTRADA ===
+    
+    def add(self, frame):
+        """
+        Añade un bloque (debe incluir ROW_COLUMN con su posición de entrada)
+        
+        Args:
+            frame: DataFrame
+        """
+        if not len(frame):
+            return
+        size = int(frame.memory_usage(deep=True).sum())
+        if self._row_bytes is None:
+            self._row_bytes = max(1, size // len(frame))
+        self._pending.append(frame)
+        self._pending_bytes += size
+        self.rows += len(frame)
+        # La ordenación necesita una copia: la mitad de la memoria para los bloques
+        if self._pending_bytes >= self.budget // 2:
+            self._spill()
+    
+    def _spill(self):
+        """Ordena los bloques acumulados y los vuelca como un tramo"""
+        frame = self._sort(pd.concat(self._pending, ignore_index=True))
+        self._pending, self._pending_bytes = [], 0
+        self.runs.append(self._new_run().write([frame], self.block_rows))
+        logger.debug(f"Tramo {len(self.runs)} volcado: {len(frame):,} filas")
+    
+    # === SALIDA ===
+    
+    @property
+    def block_rows(self):
+        """Filas por bloque de tramo: caben RUN_BLOCKS bloques en media memoria"""
+        return max(1_000, self.budget // 2 // RUN_BLOCKS // (self._row_bytes or 1))
+    
+    @property
+    def fan_in(self):
+        """Tramos que se mezclan a la vez: un bloque de cada uno ocupa media memoria, la salida la otra media"""
+        return RUN_BLOCKS
+    
+    def sorted_blocks(self):
+        """
+        Genera todas las filas añadidas, ordenadas, en bloques
+        
+        Si todo cupo en memoria no se escribe ningún archivo.
+        """
+        if not self.runs:
+            if self._pending:
+                frame = self._sort(pd.concat(self._pending, ignore_index=True))
+                self._pending = []
+                yield frame
+            return
+        
+        if self._pending:
+            self._spill()
+        
+        # Mezclas intermedias hasta que los tramos quepan en una sola
+        while len(self.runs) > self.fan_in:
+            groups = [self.runs[i:i + self.fan_in] for i in range(0, len(self.runs), self.fan_in)]
+            logger.debug(f"Mezcla intermedia: {len(self.runs)} tramos -> {len(groups)}")
+            self.runs = [self._merge_into_run(group) for group in groups]
+        
+        yield from self._merge(self.runs)
+    
+    def _merge_into_run(self, runs):
+        if len(runs) == 1:
+            return runs[0]
+        merged = self._new_run().write(self._merge(runs), self.block_rows)
+        for run in runs:
+            run.remove()
+        return merged
+    
+    def _merge(self, runs):
+        """
+        Mezcla k tramos ordenados leyendo un bloque de cada uno
+        
+        En cada paso, la cota es la menor de las últimas claves de los
+        bloques actuales: ninguna fila posterior de ningún tramo puede ir
+        antes que ella, así que todo lo que no la supera ya es definitivo.
+        El bloque que la define se consume entero, así cada paso avanza.
+        """
+        heads = []
+        for run in runs:
+            blocks = run.read()
+            block = next(blocks, None)
+            if block is not None:
+                heads.append([block, blocks])
+        
+        while heads:
+            bound = min(self._key(self._columns(block), len(block) - 1) for block, _ in heads)
+            parts = []
+            for head in heads:
+                block = head[0]
+                columns = self._columns(block)
+                cut = bisect_right(range(len(block)), bound, key=lambda i: self._key(columns, i))
+                if cut:
+                    parts.append(block.iloc[:cut])
+                    head[0] = block.iloc[cut:]
+                if not len(head[0]):
+                    head[0] = next(head[1], None)
+            heads = [head for head in heads if head[0] is not None]
+            yield self._sort(pd.concat(parts, ignore_index=True)) if len(parts) > 1 else parts[0].reset_index(drop=True)
+    
+    def _sort(self, frame):
+        return frame.sort_values(self.by + [ROW_COLUMN], ascending=self.ascending + [True], kind='stable',
+                                 ignore_index=True)
+    
+    def _columns(self, frame):
+        """Arrays de las columnas de ordenación (y de la posición) de un bloque"""
+        return [frame[column].to_numpy() for column in self.by + [ROW_COLUMN]]
+    
+    def _key(self, columns, position):
+        """Clave comparable de una fila (nulos al final, descendentes negados)"""
+        key = []
+        for values, ascending in zip(columns, self.ascending):
+            value = values[position]
+            if pd.isna(value):
+                key.append((1, 0))
+            else:
+                key.append((0, value if ascending else -value))
+        key.append(columns[-1][position])
+        return tuple(key)
+    
+    # === ARCHIVOS TEMPORALES ===
+    
+    def _new_run(self):
+        if self._tmp is None:
+            self._tmp = Path(tempfile.mkdtemp(prefix='spotify-sort-', dir=self.directory))
+        self._created += 1
+        return Run(self._tmp / f"run_{self._created:05d}.pkl")
+    
+    def close(self):
+        """Borra los tramos temporales"""
+        if self._tmp is not None:
+            shutil.rmtree(self._tmp, ignore_errors=True)
+            self._tmp = None
+        self.runs = []
+        self._pending = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
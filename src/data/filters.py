@@ -0,0 +1,226 @@
+"""
+🧮 FILTROS DE DATOS
+==================
+Selección de filas compartida por todos los gráficos
+
+Un DataFilter (rango de años, artistas, géneros, explícito, tipo de álbum,
+rango de popularidad) se evalúa una sola vez como máscara de filas. Las
+columnas se resuelven con los índices secundarios del DataFrame
+(indexes.py), así que seleccionar k artistas cuesta O(k) y un rango de
+años O(log n), sin recorrer la columna completa. El resultado, un
+RowSelection, materializa el DataFrame filtrado una única vez aunque lo
+reciban los diez gráficos.
+"""
+import numpy as np
+from .indexes import dataset_index
+
+
+def _as_list(value):
+    """Convierte un valor suelto o un iterable en lista (None -> None)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def _as_range(value):
+    """Normaliza un rango (min, max) donde cualquiera de los extremos puede ser None"""
+    if value is None:
+        return None
+    low, high = value
+    if low is None and high is None:
+        return None
+    return (low, high)
+
+
+class DataFilter:
+    """
+    Filtro declarativo sobre el dataset de Spotify
+    
+    Uso:
+        >>> filtro = DataFilter(years=(2018, 2023), explicit=False)
+        >>> seleccion = filtro.select(data)
+        >>> heatmap(seleccion)       # Todos los gráficos aceptan la selección
+    """
+    
+    def __init__(self, years=None, artists=None, genres=None, explicit=None,
+                 album_types=None, popularity=None):
+        """
+        Args:
+            years: Rango (min, max) de años, extremos inclusivos o None
+            artists: Nombre o lista de artistas
+            genres: Género o lista de géneros (basta con que coincida uno)
+            explicit: True / False para filtrar por contenido explícito
+            album_types: Tipo o lista de tipos de álbum
+            popularity: Rango (min, max) de popularidad de la canción
+        """
+        self.years = _as_range(years)
+        self.artists = _as_list(artists)
+        self.genres = [g.lower() for g in _as_list(genres)] if genres is not None else None
+        self.explicit = explicit
+        self.album_types = _as_list(album_types)
+        self.popularity = _as_range(popularity)
+    
+    @classmethod
+    def from_dict(cls, params):
+        """
+        Crea un filtro desde un diccionario plano (CLI, parámetros de URL...)
+        
+        Claves reconocidas: year_min, year_max, artist, genre, explicit,
+        album_type, popularity_min, popularity_max. Los valores múltiples
+        pueden venir como lista o separados por comas.
+        
+        Args:
+            params: Diccionario de parámetros (los valores vacíos se ignoran)
+        
+        Returns:
+            DataFilter
+        """
+        def value(key):
+            raw = params.get(key)
+            if isinstance(raw, (list, tuple)):
+                raw = ','.join(str(v) for v in raw)
+            raw = str(raw).strip() if raw is not None else ''
+            return raw or None
+        
+        def many(key):
+            raw = value(key)
+            return [item.strip() for item in raw.split(',') if item.strip()] if raw else None
+        
+        def number(key):
+            raw = value(key)
+            return float(raw) if raw is not None else None
+        
+        explicit = value('explicit')
+        if explicit is not None:
+            explicit = explicit.lower() in ('1', 'true', 'si', 'sí', 'yes')
+        
+        return cls(
+            years=(number('year_min'), number('year_max')),
+            artists=many('artist'),
+            genres=many('genre'),
+            explicit=explicit,
+            album_types=many('album_type'),
+            popularity=(number('popularity_min'), number('popularity_max'))
+        )
+    
+    @property
+    def is_empty(self):
+        """True si el filtro no restringe nada"""
+        return self.key() == ()
+    
+    def key(self):
+        """Tupla hashable que identifica el filtro (para cachés)"""
+        parts = [
+            ('years', self.years),
+            ('artists', tuple(sorted(self.artists)) if self.artists else None),
+            ('genres', tuple(sorted(self.genres)) if self.genres else None),
+            ('explicit', self.explicit),
+            ('album_types', tuple(sorted(self.album_types)) if self.album_types else None),
+            ('popularity', self.popularity)
+        ]
+        return tuple((name, part) for name, part in parts if part is not None)
+    
+    def describe(self):
+        """Texto corto para subtítulos y registros"""
+        labels = []
+        if self.years:
+            low, high = self.years
+            labels.append(f"años {int(low) if low is not None else '…'}-{int(high) if high is not None else '…'}")
+        if self.artists:
+            labels.append(f"artistas: {', '.join(self.artists[:3])}{'…' if len(self.artists) > 3 else ''}")
+        if self.genres:
+            labels.append(f"géneros: {', '.join(self.genres)}")
+        if self.explicit is not None:
+            labels.append('explícitas' if self.explicit else 'no explícitas')
+        if self.album_types:
+            labels.append(f"álbum: {', '.join(self.album_types)}")
+        if self.popularity:
+            low, high = self.popularity
+            labels.append(f"popularidad {low if low is not None else 0:g}-{high if high is not None else 100:g}")
+        return '; '.join(labels) or 'sin filtros'
+    
+    def mask(self, data):
+        """
+        Evalúa el filtro como máscara booleana de filas
+        
+        Args:
+            data: DataFrame con los datos de Spotify
+        
+        Returns:
+            Array booleano de longitud len(data)
+        """
+        index = dataset_index(data)
+        mask = np.ones(len(data), dtype=bool)
+        
+        if self.years and 'year' in data.columns:
+            mask &= index.year_mask(*self.years)
+        if self.popularity and 'track_popularity' in data.columns:
+            mask &= index.range('track_popularity').mask(*self.popularity)
+        if self.explicit is not None and 'explicit' in data.columns:
+            mask &= index.category('explicit').mask([bool(self.explicit)])
+        
+        if self.artists and 'artist_name' in data.columns:
+            mask &= index.category('artist_name').mask(self.artists, case=False)
+        if self.album_types and 'album_type' in data.columns:
+            mask &= index.category('album_type').mask(self.album_types)
+        if self.genres and 'artist_genres' in data.columns:
+            mask &= index.genres().mask(self.genres)
+        
+        return mask
+    
+    def select(self, data):
+        """
+        Evalúa el filtro y devuelve la selección de filas
+        
+        Args:
+            data: DataFrame con los datos de Spotify
+        
+        Returns:
+            RowSelection
+        """
+        if isinstance(data, RowSelection):
+            data = data.source
+        return RowSelection(data, self.mask(data), self)
+
+
+class RowSelection:
+    """
+    Filas seleccionadas de un DataFrame (máscara + filtro que la produjo)
+    
+    El DataFrame filtrado se materializa una sola vez, la primera vez que
+    se pide ``frame``, y todos los gráficos comparten esa misma copia.
+    """
+    
+    def __init__(self, source, mask, filters=None):
+        """
+        Args:
+            source: DataFrame completo
+            mask: Array booleano de filas seleccionadas
+            filters: DataFilter que generó la máscara (opcional)
+        """
+        self.source = source
+        self.mask = mask
+        self.filters = filters
+        self._frame = None
+    
+    def __len__(self):
+        return int(self.mask.sum())
+    
+    @property
+    def positions(self):
+        """Posiciones (enteras) de las filas seleccionadas"""
+        return np.flatnonzero(self.mask)
+    
+    @property
+    def is_full(self):
+        """True si la selección contiene todas las filas"""
+        return bool(self.mask.all())
+    
+    @property
+    def frame(self):
+        """DataFrame filtrado (sin copia si no se descarta ninguna fila)"""
+        if self._frame is None:
+            self._frame = self.source if self.is_full else self.source.take(self.positions)
+        return self._frame
@@ -0,0 +1,176 @@
+"""
+🎼 ÍNDICE DE GÉNEROS
+===================
+Géneros de cada canción sin expandir el DataFrame
+
+``artist_genres`` es un texto con varios valores ("['pop', 'dance pop']").
+Se interpreta una sola vez por texto distinto (la columna está codificada
+con diccionario, ver text.py) y se guarda en formato CSR:
+
+    offsets[i]:offsets[i + 1]   rango de la fila i dentro de ``codes``
+    codes                       código de género de cada par (fila, género)
+    names                       nombre de cada código
+
+Los agregados por género (canciones, popularidad media, seguidores) se
+calculan con np.bincount sobre ``codes``, sin crear una fila por género.
+"""
+import ast
+
+import numpy as np
+import pandas as pd
+from ..utils.logger import Logger
+from .text import encode_text
+
+logger = Logger(__name__)
+
+
+def parse_genres(text):
+    """
+    Interpreta un texto de géneros
+    
+    Args:
+        text: Lista en texto ("['pop', 'rap']"), valores separados por
+              comas o nulo
+    
+    Returns:
+        Lista de géneros (vacía si no hay)
+    """
+    if not isinstance(text, str) or not text.strip():
+        return []
+    try:
+        values = ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        values = text.strip('[]').split(',')
+    if isinstance(values, str):
+        values = [values]
+    genres = [str(value).strip().strip('\'"').strip() for value in values]
+    return [genre for genre in genres if genre]
+
+
+class GenreIndex:
+    """
+    Géneros por fila en formato CSR (desplazamientos + códigos)
+    
+    Uso:
+        >>> genres = dataset_index(data).genres()
+        >>> genres.row_genres(0)             # ['pop', 'dance pop']
+        >>> mask = genres.mask(['rock'])     # Filas con alguno de los géneros
+        >>> genres.aggregate(data)           # Métricas por género
+    """
+    
+    def __init__(self, values):
+        """
+        Args:
+            values: Serie ``artist_genres`` (texto o codificada)
+        """
+        values = encode_text(values)
+        texts = values.cat.categories
+        
+        # Interpretar cada texto distinto una sola vez
+        parsed = [parse_genres(text) for text in texts]
+        names = sorted({genre for genres in parsed for genre in genres})
+        lookup = {name: code for code, name in enumerate(names)}
+        
+        # CSR por texto distinto (+ una entrada vacía para los nulos)
+        text_lengths = np.array([len(genres) for genres in parsed] + [0], dtype=np.int64)
+        text_offsets = np.zeros(len(text_lengths) + 1, dtype=np.int64)
+        np.cumsum(text_lengths, out=text_offsets[1:])
+        text_codes = np.array([lookup[genre] for genres in parsed for genre in genres], dtype=np.int32)
+        
+        # Expandir a filas con los códigos del diccionario (sin bucles por fila)
+        row_text = values.cat.codes.to_numpy().astype(np.int64)
+        row_text[row_text < 0] = len(texts)
+        lengths = text_lengths[row_text]
+        self.offsets = np.zeros(len(row_text) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        within = np.arange(self.offsets[-1]) - np.repeat(self.offsets[:-1], lengths)
+        self.codes = text_codes[np.repeat(text_offsets[:-1][row_text], lengths) + within]
+        
+        self.names = np.array(names, dtype=object)
+        self.lookup = lookup
+        self._lower = {}
+        for code, name in enumerate(names):
+            self._lower.setdefault(name.lower(), []).append(code)
+        self._rows = None
+    
+    def __len__(self):
+        return len(self.offsets) - 1
+    
+    @property
+    def rows(self):
+        """Fila de cada entrada de ``codes`` (se calcula al primer uso)"""
+        if self._rows is None:
+            self._rows = np.repeat(np.arange(len(self)), np.diff(self.offsets))
+        return self._rows
+    
+    def genre_codes(self, genre):
+        """Códigos de un género sin distinguir mayúsculas, uno por grafía (lista vacía si no existe)"""
+        return self._lower.get(str(genre).strip().lower(), [])
+    
+    def row_genres(self, position):
+        """Géneros de una fila (por posición)"""
+        return list(self.names[self.codes[self.offsets[position]:self.offsets[position + 1]]])
+    
+    def mask(self, genres):
+        """
+        Máscara de las filas que tienen alguno de los géneros
+        
+        Args:
+            genres: Iterable de nombres de género
+        
+        Returns:
+            Array booleano de longitud len(self)
+        """
+        wanted = np.zeros(len(self.names) + 1, dtype=bool)
+        for genre in genres:
+            wanted[self.genre_codes(genre)] = True
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.rows[wanted[self.codes]]] = True
+        return mask
+    
+    def counts(self):
+        """Número de canciones por género (en el orden de ``names``)"""
+        return np.bincount(self.codes, minlength=len(self.names))
+    
+    def aggregate(self, data, artist_column='artist_name'):
+        """
+        Métricas por género, de más a menos canciones
+        
+        Una canción con varios géneros cuenta en cada uno. Los seguidores
+        se suman una vez por artista (no por canción).
+        
+        Args:
+            data: DataFrame indexado (mismas filas que el índice)
+            artist_column: Columna con el artista de cada canción
+        
+        Returns:
+            DataFrame indexado por género con tracks, artists,
+            avg_popularity y followers
+        """
+        size = len(self.names)
+        stats = {'tracks': self.counts()}
+        
+        if 'track_popularity' in data.columns:
+            popularity = data['track_popularity'].to_numpy(dtype=np.float64, na_value=np.nan)[self.rows]
+            valid = ~np.isnan(popularity)
+            totals = np.bincount(self.codes[valid], weights=popularity[valid], minlength=size)
+            counted = np.bincount(self.codes[valid], minlength=size)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                stats['avg_popularity'] = totals / counted
+        
+        if artist_column in data.columns:
+            # Pares (artista, género) distintos
+            artist_codes, _ = pd.factorize(data[artist_column])
+            artist_codes = artist_codes.astype(np.int64)[self.rows]
+            pairs, first = np.unique(artist_codes * size + self.codes, return_index=True)
+            pairs, first = pairs[artist_codes[first] >= 0], first[artist_codes[first] >= 0]
+            pair_genres = pairs % size
+            stats['artists'] = np.bincount(pair_genres, minlength=size)
+            
+            if 'artist_followers' in data.columns:
+                followers = data['artist_followers'].to_numpy(dtype=np.float64, na_value=np.nan)[self.rows[first]]
+                followers = np.nan_to_num(followers)
+                stats['followers'] = np.bincount(pair_genres, weights=followers, minlength=size).astype(np.int64)
+        
+        result = pd.DataFrame(stats, index=pd.Index(self.names, name='genre'))
+        return result.sort_values('tracks', ascending=False, kind='stable')
@@ -0,0 +1,372 @@
+"""
+🗂️ ÍNDICES SECUNDARIOS
+=====================
+Estructuras que se construyen una vez tras la carga para seleccionar filas
+sin recorrer columnas completas
+
+- Columnas numéricas (año, popularidad): valores ordenados + searchsorted,
+  un rango cuesta O(log n) y devuelve directamente las posiciones
+- Columnas categóricas (tipo de álbum, explícito, artista): código -> filas
+  (orden estable + desplazamientos), k valores cuestan O(k)
+- Artistas sin distinguir mayúsculas: tabla hash nombre en minúsculas ->
+  códigos de todas sus grafías ("Drake", "DRAKE"...)
+- Géneros (varios por canción): formato CSR, ver genres.py
+"""
+import weakref
+
+import numpy as np
+import pandas as pd
+from ..utils.logger import Logger
+from .genres import GenreIndex
+from .topk import top_k, code_counts, code_max, first_seen
+
+logger = Logger(__name__)
+
+# Columnas indexadas al llamar a DatasetIndex.build()
+INDEXED_RANGES = ('year',)
+INDEXED_CATEGORIES = ('album_type', 'explicit', 'artist_name')
+GENRE_COLUMN = 'artist_genres'
+
+# Índices por DataFrame: id -> (referencia débil, DatasetIndex)
+_indexes = {}
+
+
+class CategoryIndex:
+    """
+    Índice invertido de una columna categórica
+    
+    Guarda los valores distintos, el código de cada fila y las filas
+    agrupadas por código (orden estable + desplazamientos), por lo que
+    las posiciones de un valor son un simple corte del array.
+    """
+    
+    def __init__(self, values):
+        """
+        Args:
+            values: Serie o array con la columna categórica
+        """
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        self.codes = codes.astype(np.int32)
+        self.uniques = np.asarray(uniques, dtype=object)
+        self.lookup = {value: code for code, value in enumerate(self.uniques)}
+        
+        # Filas agrupadas por código (los nulos, código -1, quedan al principio)
+        self.order = np.argsort(self.codes, kind='stable')
+        self.offsets = np.searchsorted(self.codes[self.order], np.arange(len(self.uniques) + 1))
+        self._lower = None
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def code(self, value, case=True):
+        """
+        Código de un valor (None si no existe)
+        
+        Args:
+            value: Valor a buscar
+            case: False para comparar textos sin distinguir mayúsculas (si
+                hay varias grafías, devuelve la primera que aparece)
+        """
+        if case:
+            return self.lookup.get(value)
+        codes = self.codes_of(value, case=False)
+        return codes[0] if codes else None
+    
+    def codes_of(self, value, case=True):
+        """
+        Códigos de un valor (tupla vacía si no existe)
+        
+        Sin distinguir mayúsculas un texto puede tener varias grafías en los
+        datos ('Drake', 'DRAKE'...), cada una con su propio código.
+        
+        Args:
+            value: Valor a buscar
+            case: False para comparar textos sin distinguir mayúsculas
+        """
+        if case:
+            code = self.lookup.get(value)
+            return () if code is None else (code,)
+        return self.lower_lookup.get(str(value).lower(), ())
+    
+    @property
+    def lower_lookup(self):
+        """Tabla texto en minúsculas -> códigos de todas sus grafías (se construye al primer uso)"""
+        if self._lower is None:
+            lower = {}
+            for code, value in enumerate(self.uniques):
+                lower.setdefault(str(value).lower(), []).append(code)
+            self._lower = {text: tuple(codes) for text, codes in lower.items()}
+        return self._lower
+    
+    def rows(self, value, case=True):
+        """Posiciones (ordenadas) de las filas con ese valor"""
+        codes = self.codes_of(value, case=case)
+        if not codes:
+            return np.empty(0, dtype=np.intp)
+        if len(codes) == 1:
+            return self.order[self.offsets[codes[0]]:self.offsets[codes[0] + 1]]
+        return np.sort(np.concatenate([self.order[self.offsets[code]:self.offsets[code + 1]]
+                                       for code in codes]))
+    
+    def rows_in(self, values, case=True):
+        """Posiciones (ordenadas) de las filas cuyo valor está en ``values``"""
+        parts = [self.rows(value, case=case) for value in values]
+        if not parts:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(parts))
+    
+    def mask(self, values, case=True):
+        """
+        Máscara booleana de las filas cuyo valor está en ``values``
+        
+        Args:
+            values: Iterable de valores a seleccionar
+            case: False para comparar textos sin distinguir mayúsculas
+        
+        Returns:
+            Array booleano de longitud len(self)
+        """
+        mask = np.zeros(len(self.codes), dtype=bool)
+        for value in values:
+            mask[self.rows(value, case=case)] = True
+        return mask
+    
+    def mask_where(self, predicate):
+        """
+        Máscara de las filas cuyo valor cumple ``predicate``
+        
+        El predicado se evalúa sobre los valores distintos (no por fila).
+        
+        Args:
+            predicate: Función vectorizada Serie -> Serie booleana
+        """
+        if len(self.uniques) == 0:
+            return np.zeros(len(self.codes), dtype=bool)
+        matched = np.asarray(predicate(pd.Series(self.uniques, dtype=object)), dtype=bool)
+        return np.append(matched, False)[self.codes]
+    
+    def counts(self, positions=None):
+        """
+        Número de filas por valor distinto (en el orden de ``uniques``)
+        
+        Args:
+            positions: Contar solo estas filas (None = todas)
+        """
+        if positions is None:
+            return np.diff(self.offsets)
+        return code_counts(self.codes, len(self.uniques), positions)
+    
+    def top(self, k, positions=None):
+        """
+        Los ``k`` valores más frecuentes sin ordenar todos los conteos
+        
+        Args:
+            k: Número de valores
+            positions: Contar solo estas filas (None = todas)
+        
+        Returns:
+            Tupla (valores, conteos) de mayor a menor; los empates, por
+            orden de aparición. Con ``positions`` se omiten los valores
+            sin filas.
+        """
+        counts = self.counts(positions)
+        ties = None
+        if positions is not None:
+            ties = first_seen(self.codes, len(self.uniques), positions)
+            counts = np.where(counts > 0, counts, np.nan)
+        chosen = top_k(counts, k, ties=ties)
+        return self.uniques[chosen], np.asarray(counts[chosen], dtype=np.int64)
+    
+    def top_by(self, values, k):
+        """
+        Los ``k`` valores distintos con mayor máximo de ``values``
+        
+        Cada valor aparece una sola vez aunque tenga varias filas.
+        
+        Args:
+            values: Array numérico alineado con las filas
+            k: Número de valores
+        
+        Returns:
+            Tupla (valores, máximos) de mayor a menor
+        """
+        maxima = code_max(self.codes, values, len(self.uniques))
+        chosen = top_k(maxima, k)
+        return self.uniques[chosen], maxima[chosen]
+
+
+class SortedIndex:
+    """
+    Índice ordenado de una columna numérica
+    
+    Los valores no nulos se ordenan una vez; un rango [low, high] se
+    resuelve con dos búsquedas binarias. Si el rango abarca una fracción
+    grande de las filas, comparar la columna directamente es más barato
+    que ordenar las posiciones, y se hace así.
+    """
+    
+    DENSE_FRACTION = 0.125    # Por encima de esta fracción se compara la columna
+    
+    def __init__(self, values):
+        """
+        Args:
+            values: Serie o array numérico
+        """
+        self.values = np.asarray(values, dtype=np.float64)
+        valid = np.flatnonzero(~np.isnan(self.values))
+        self.size = len(self.values)
+        self.order = valid[np.argsort(self.values[valid], kind='stable')]
+        self.sorted = self.values[self.order]
+    
+    def __len__(self):
+        return self.size
+    
+    def bounds(self, low=None, high=None):
+        """Desplazamientos [inicio, fin) del rango dentro del array ordenado"""
+        start = 0 if low is None else np.searchsorted(self.sorted, low, side='left')
+        end = len(self.sorted) if high is None else np.searchsorted(self.sorted, high, side='right')
+        return start, max(start, end)
+    
+    def count(self, low=None, high=None):
+        """Número de filas con low <= valor <= high"""
+        start, end = self.bounds(low, high)
+        return end - start
+    
+    def rows(self, low=None, high=None):
+        """Posiciones (ordenadas) de las filas con low <= valor <= high"""
+        start, end = self.bounds(low, high)
+        if end - start > self.DENSE_FRACTION * self.size:
+            return np.flatnonzero(self._compare(low, high))
+        return np.sort(self.order[start:end])
+    
+    def mask(self, low=None, high=None):
+        """Máscara booleana de las filas con low <= valor <= high (nulos fuera)"""
+        start, end = self.bounds(low, high)
+        if end - start > self.DENSE_FRACTION * self.size:
+            return self._compare(low, high)
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.order[start:end]] = True
+        return mask
+    
+    def _compare(self, low, high):
+        """Máscara por comparación directa (rangos que abarcan muchas filas)"""
+        mask = ~np.isnan(self.values)
+        if low is not None:
+            mask &= self.values >= low
+        if high is not None:
+            mask &= self.values <= high
+        return mask
+
+
+class DatasetIndex:
+    """
+    Índices secundarios de un DataFrame
+    
+    Cada índice se construye la primera vez que se usa (o todos juntos con
+    build()) y se reutiliza mientras viva el DataFrame.
+    
+    Uso:
+        >>> index = dataset_index(data)
+        >>> recientes = data.iloc[index.year_rows(2015)]
+        >>> index.artist_rows('the weeknd')     # Sin distinguir mayúsculas
+    """
+    
+    def __init__(self, data):
+        """
+        Args:
+            data: DataFrame indexado (no debe modificarse después)
+        """
+        self._data = weakref.ref(data)
+        self.size = len(data)
+        self.columns = set(data.columns)
+        self._ranges = {}
+        self._categories = {}
+        self._genres = None
+    
+    @property
+    def data(self):
+        data = self._data()
+        if data is None:
+            raise ReferenceError("El DataFrame indexado ya no existe")
+        return data
+    
+    def build(self):
+        """Construye por adelantado los índices de las columnas habituales"""
+        built = []
+        for column in INDEXED_RANGES:
+            if column in self.columns:
+                self.range(column)
+                built.append(column)
+        for column in INDEXED_CATEGORIES:
+            if column in self.columns:
+                self.category(column)
+                built.append(column)
+        if GENRE_COLUMN in self.columns:
+            self.genres()
+            built.append(GENRE_COLUMN)
+        logger.debug(f"Índices construidos ({self.size:,} filas): {', '.join(built)}")
+        return self
+    
+    def range(self, column):
+        """SortedIndex de una columna numérica"""
+        if column not in self._ranges:
+            self._ranges[column] = SortedIndex(self.data[column].to_numpy(dtype=np.float64, na_value=np.nan))
+        return self._ranges[column]
+    
+    def category(self, column):
+        """CategoryIndex de una columna categórica"""
+        if column not in self._categories:
+            self._categories[column] = CategoryIndex(self.data[column])
+        return self._categories[column]
+    
+    def genres(self):
+        """GenreIndex de la columna de géneros (interpretada una sola vez)"""
+        if self._genres is None:
+            self._genres = GenreIndex(self.data[GENRE_COLUMN])
+        return self._genres
+    
+    # === ATAJOS ===
+    
+    def year_rows(self, low=None, high=None):
+        """Posiciones de las canciones con low <= año <= high"""
+        return self.range('year').rows(low, high)
+    
+    def year_mask(self, low=None, high=None):
+        """Máscara de las canciones con low <= año <= high"""
+        return self.range('year').mask(low, high)
+    
+    def rows_in(self, column, values):
+        """Posiciones de las filas cuyo valor de ``column`` está en ``values``"""
+        return self.category(column).rows_in(values)
+    
+    def artist_rows(self, name):
+        """Posiciones de las canciones de un artista (sin distinguir mayúsculas)"""
+        return self.category('artist_name').rows(name, case=False)
+    
+    def artist_name(self, name):
+        """Nombre tal como aparece en los datos (o None si no existe)"""
+        index = self.category('artist_name')
+        code = index.code(name, case=False)
+        return None if code is None else index.uniques[code]
+
+
+def dataset_index(data):
+    """
+    Devuelve los índices de un DataFrame, creándolos la primera vez
+    
+    Los índices se asocian al objeto DataFrame (referencia débil); una
+    copia o un DataFrame filtrado tiene sus propios índices.
+    
+    Args:
+        data: DataFrame
+    
+    Returns:
+        DatasetIndex
+    """
+    key = id(data)
+    entry = _indexes.get(key)
+    if entry is None or entry[0]() is not data:
+        index = DatasetIndex(data)
+        entry = (weakref.ref(data, lambda _, key=key: _indexes.pop(key, None)), index)
+        _indexes[key] = entry
+    return entry[1]
@@ -2,13 +2,120 @@
 📥 CARGADOR DE DATOS
 ===================
 Carga y valida datos desde archivos CSV
+
+Los datos crudos pueden llegar en un solo archivo o en varias partes (p. ej.
+una por día), comprimidas o no. RAW_DATA_FILE (o la ruta que se pase) puede
+ser un archivo, una carpeta (se leen los que encajan en RAW_DATA_PATTERNS) o
+un patrón como 'data/raw/spotify_*.csv.gz':
+- Cada parte se descomprime mientras se lee (.gz, .bz2, .xz, .zip y .zst
+  según la extensión; .zst necesita el paquete opcional zstandard, que no
+  está en requirements.txt)
+- Las partes se leen a la vez en RAW_LOAD_WORKERS hilos: el parser de CSV
+  y la descompresión trabajan sin el GIL, y los DataFrame no se copian
+  entre procesos
+- Se unen en el orden de sus nombres con el esquema común: todas las
+  columnas en orden de aparición y nulos donde una parte no la tenga
 """
-import pandas as pd
+import glob
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from ..config.settings import RAW_DATA_FILE, CLEAN_DATA_FILE
+
+import pandas as pd
+from ..config.settings import (
+    RAW_DATA_FILE,
+    RAW_DATA_PATTERNS,
+    RAW_LOAD_WORKERS,
+    CLEAN_DATA_FILE,
+    CHUNK_SIZE,
+    DICTIONARY_COLUMNS
+)
 from ..utils.logger import Logger
+from .dates import parse_release_dates, PRECISION_COLUMN, PRECISIONS
+from .indexes import dataset_index
+
+logger = Logger(__name__)
+
+ENCODINGS = ['utf-8', 'latin-1', 'cp1252']
+
+
+def resolve_sources(source=None):
+    """
+    Archivos que forman una fuente de datos crudos
+    
+    Args:
+        source: Archivo, carpeta o patrón glob (usa RAW_DATA_FILE si es None)
+    
+    Returns:
+        Lista de Path ordenada por nombre
+    
+    Raises:
+        FileNotFoundError: Si no hay ningún archivo
+    """
+    source = source or RAW_DATA_FILE
+    if Path(source).is_dir():
+        paths = {path for pattern in RAW_DATA_PATTERNS for path in Path(source).glob(pattern)}
+        ignored = sorted(path.name for path in Path(source).iterdir()
+                         if path.is_file() and path not in paths)
+        if ignored:
+            logger.warning(f"Archivos ignorados en {Path(source).name}/ (no encajan en RAW_DATA_PATTERNS): "
+                           f"{', '.join(ignored)}")
+    elif glob.has_magic(str(source)):
+        paths = {Path(path) for path in glob.glob(str(source))}
+    else:
+        paths = {Path(source)} if Path(source).exists() else set()
+    
+    paths = sorted(path for path in paths if path.is_file())
+    if not paths:
+        raise FileNotFoundError(f"No hay archivos de datos en: {source}")
+    return paths
+
+
+def read_columns(source=None):
+    """
+    Columnas del esquema común de una fuente (sin leer filas)
+    
+    Args:
+        source: Archivo, carpeta o patrón glob (usa RAW_DATA_FILE si es None)
+    
+    Returns:
+        Lista de columnas en orden de aparición
+    """
+    columns = {}
+    for path in resolve_sources(source):
+        header = pd.read_csv(path, nrows=0, encoding='utf-8', encoding_errors='ignore')
+        columns.update(dict.fromkeys(header.columns.str.strip()))
+    return list(columns)
+
+
+def _read_shard(path):
+    """
+    Lee una parte cruda (descomprimiéndola según su extensión)
+    
+    Returns:
+        Tupla (DataFrame, segundos)
+    """
+    start = time.perf_counter()
+    for encoding in ENCODINGS:
+        try:
+            frame = pd.read_csv(path, encoding=encoding, encoding_errors='ignore', compression='infer')
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise ValueError(f"No se pudo leer {path.name} con ningún encoding")
+    frame.columns = frame.columns.str.strip()
+    return frame, time.perf_counter() - start
+
+
+def _concat_shards(frames):
+    """Une las partes con el esquema común (columnas en orden de aparición)"""
+    columns = list(dict.fromkeys(column for frame in frames for column in frame.columns))
+    missing = sum(1 for frame in frames if len(frame.columns) < len(columns))
+    if missing:
+        logger.warning(f"  • {missing} parte(s) sin todas las columnas: se completan con nulos")
+    return pd.concat([frame.reindex(columns=columns) for frame in frames], ignore_index=True)
 
-logger = Logger()
 
 class DataLoader:
     """Clase para cargar datos de Spotify"""
@@ -17,39 +124,47 @@ class DataLoader:
         self.raw_data = None
         self.clean_data = None
     
-    def load_raw_data(self, filepath=None):
+    def load_raw_data(self, filepath=None, workers=None):
         """
-        Carga datos crudos desde CSV
+        Carga datos crudos desde CSV (un archivo o varias partes)
         
         Args:
-            filepath: Ruta del archivo (usa default si es None)
+            filepath: Archivo, carpeta o patrón glob (usa default si es None)
+            workers: Hilos de lectura de partes (usa RAW_LOAD_WORKERS si es None)
         
         Returns:
             DataFrame con los datos cargados
         """
         filepath = filepath or RAW_DATA_FILE
+        workers = workers or RAW_LOAD_WORKERS
         
         try:
-            logger.info(f"Cargando datos desde: {filepath.name}")
+            paths = resolve_sources(filepath)
             
-            # Intentar diferentes encodings
-            for encoding in ['utf-8', 'latin-1', 'cp1252']:
-                try:
-                    self.raw_data = pd.read_csv(
-                        filepath, 
-                        encoding=encoding,
-                        encoding_errors='ignore'
-                    )
-                    logger.success(f"Datos cargados: {len(self.raw_data):,} registros")
-                    return self.raw_data
-                except UnicodeDecodeError:
-                    continue
+            if len(paths) == 1:
+                logger.info(f"Cargando datos desde: {paths[0].name}")
+                self.raw_data = _read_shard(paths[0])[0]
+            else:
+                logger.info(f"Cargando {len(paths)} partes desde: {filepath}")
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=min(workers, len(paths)),
+                                        thread_name_prefix='raw-load') as pool:
+                    shards = list(pool.map(_read_shard, paths))
+                for path, (frame, seconds) in zip(paths, shards):
+                    logger.info(f"  • {path.name}: {len(frame):,} registros ({seconds:.2f}s)")
+                self.raw_data = _concat_shards([frame for frame, _ in shards])
+                logger.info(f"  • Lectura en paralelo: {time.perf_counter() - start:.2f}s "
+                            f"(suma de partes {sum(seconds for _, seconds in shards):.2f}s)")
             
-            raise ValueError("No se pudo leer el archivo con ningún encoding")
+            logger.success(f"Datos cargados: {len(self.raw_data):,} registros")
+            return self.raw_data
             
         except FileNotFoundError:
             logger.error(f"Archivo no encontrado: {filepath}")
-            logger.info(f"Coloca tu archivo en: data/raw/spotify_data.csv")
+            logger.info(f"Coloca tu archivo (o sus partes) en: data/raw/")
+            raise
+        except ImportError as e:
+            logger.error(f"Falta una dependencia para descomprimir: {e}")
             raise
         except Exception as e:
             logger.error(f"Error al cargar datos: {e}")
@@ -76,16 +191,23 @@ class DataLoader:
             self.clean_data = pd.read_csv(
                 filepath, 
                 encoding='utf-8',
-                encoding_errors='ignore'
+                encoding_errors='ignore',
+                # Texto repetido directamente como diccionario + códigos
+                dtype={column: 'category' for column in DICTIONARY_COLUMNS}
             )
             
-            # Convertir fechas
+            # Convertir fechas (el CSV limpio las guarda completas; la
+            # precisión original está en su propia columna)
             if 'album_release_date' in self.clean_data.columns:
-                self.clean_data['album_release_date'] = pd.to_datetime(
-                    self.clean_data['album_release_date'], 
-                    errors='coerce'
-                )
-                self.clean_data['year'] = self.clean_data['album_release_date'].dt.year
+                dates, precision, year = parse_release_dates(self.clean_data['album_release_date'])
+                self.clean_data['album_release_date'] = dates
+                if PRECISION_COLUMN in self.clean_data.columns:
+                    precision = pd.Categorical(self.clean_data[PRECISION_COLUMN], categories=PRECISIONS)
+                self.clean_data[PRECISION_COLUMN] = precision
+                self.clean_data['year'] = year
+            
+            # Índices secundarios (año, tipo de álbum, explícito, artista)
+            dataset_index(self.clean_data).build()
             
             logger.success(f"Datos limpios cargados: {len(self.clean_data):,} registros")
             return self.clean_data
@@ -94,28 +216,54 @@ class DataLoader:
             logger.error(f"Error al cargar datos limpios: {e}")
             raise
     
+    def iter_chunks(self, filepath=None, columns=None, chunksize=None):
+        """
+        Lee un CSV por bloques sin cargarlo completo en memoria
+        
+        Args:
+            filepath: Archivo, carpeta o patrón glob (usa el archivo limpio si es None);
+                las partes se leen una tras otra en orden de nombre
+            columns: Columnas a leer (None = todas; las que no existan se ignoran)
+            chunksize: Filas por bloque (usa CHUNK_SIZE si es None)
+        
+        Yields:
+            DataFrame con un bloque de filas
+        """
+        filepath = filepath or CLEAN_DATA_FILE
+        chunksize = chunksize or CHUNK_SIZE
+        usecols = (lambda col: col in columns) if columns is not None else None
+        
+        try:
+            for path in resolve_sources(filepath):
+                reader = pd.read_csv(
+                    path,
+                    usecols=usecols,
+                    chunksize=chunksize,
+                    encoding='utf-8',
+                    encoding_errors='ignore',
+                    compression='infer'
+                )
+                with reader:
+                    for chunk in reader:
+                        chunk.columns = chunk.columns.str.strip()
+                        yield chunk
+        except FileNotFoundError:
+            logger.error(f"Archivo no encontrado: {filepath}")
+            raise
+    
     def get_data_summary(self):
         """
-        Obtiene resumen estadístico de los datos
+        Obtiene resumen estadístico de los datos limpios cargados
+        
+        El resumen lo calcula (una sola vez) el SpotifyDataset asociado
+        al DataFrame; ya no se recargan datos del disco de forma implícita.
         
         Returns:
             Diccionario con estadísticas
         """
-        if self.clean_data is None:
-            self.load_clean_data()
-        
-        df = self.clean_data
+        from .dataset import as_dataset
         
-        summary = {
-            'total_tracks': len(df),
-            'unique_artists': df['artist_name'].nunique() if 'artist_name' in df.columns else 0,
-            'unique_albums': df['album_name'].nunique() if 'album_name' in df.columns else 0,
-            'explicit_count': df['explicit'].sum() if 'explicit' in df.columns else 0,
-            'avg_popularity': df['track_popularity'].mean() if 'track_popularity' in df.columns else 0,
-            'date_range': (
-                df['year'].min() if 'year' in df.columns else None,
-                df['year'].max() if 'year' in df.columns else None
-            )
-        }
+        if self.clean_data is None:
+            raise ValueError("No hay datos limpios cargados: llama antes a load_clean_data()")
         
-        return summary
\ No newline at end of file
+        return as_dataset(self.clean_data).summary()
@@ -0,0 +1,205 @@
+"""
+🧩 RESULTADOS INTERMEDIOS COMPARTIDOS
+====================================
+Cálculos con nombre que varios gráficos necesitan, resueltos una vez
+
+Varios gráficos parten de los mismos resultados intermedios: el conteo de
+canciones por artista (Pareto, Boxplots, Radar), las duraciones de los 3
+tipos de álbum más comunes (Boxplots, Enjambre), las filas de cada valor
+de ``explicit`` o la popularidad media (Histogramas, KDE). Cada gráfico
+declara los que usa (``requires``) y el Pipeline de su dataset:
+- Construye el grafo de dependencias (un intermedio puede partir de otros)
+  y lo recorre en orden topológico
+- Calcula cada intermedio una sola vez por dataset (SpotifyDataset.cached):
+  una selección filtrada es otro dataset y tiene sus propios resultados
+- Entrega a cada gráfico un diccionario nombre -> valor
+
+Los valores se comparten entre gráficos: no deben modificarse.
+
+Uso:
+    >>> @intermediate('followers_max')
+    ... def followers_max(dataset):
+    ...     return dataset['artist_followers'].max()
+    
+    >>> dataset.pipeline.resolve(['artist_counts', 'followers_max'])
+"""
+from ..utils.logger import Logger
+
+logger = Logger(__name__)
+
+# Intermedios registrados: nombre -> Intermediate
+INTERMEDIATES = {}
+
+
+class Intermediate:
+    """Cálculo con nombre a partir del dataset y de otros intermedios"""
+    
+    def __init__(self, name, compute, requires=()):
+        """
+        Args:
+            name: Nombre del intermedio
+            compute: Función (dataset, *valores de requires) -> valor
+            requires: Nombres de los intermedios de los que depende
+        """
+        self.name = name
+        self.compute = compute
+        self.requires = tuple(requires)
+    
+    def __repr__(self):
+        return f"Intermediate({self.name!r}, requires={self.requires})"
+
+
+def intermediate(name, requires=()):
+    """
+    Decorador que registra un intermedio
+    
+    Args:
+        name: Nombre con el que lo piden los gráficos
+        requires: Intermedios que recibe la función tras el dataset
+    """
+    def decorator(compute):
+        if name in INTERMEDIATES:
+            raise ValueError(f"Intermedio duplicado: {name}")
+        INTERMEDIATES[name] = Intermediate(name, compute, requires)
+        return compute
+    return decorator
+
+
+def dependency_order(names, registry=None):
+    """
+    Intermedios necesarios para ``names`` en orden topológico
+    
+    Args:
+        names: Nombres pedidos
+        registry: Diccionario nombre -> Intermediate (usa INTERMEDIATES si es None)
+    
+    Returns:
+        Lista de nombres: cada uno aparece después de sus dependencias
+    
+    Raises:
+        KeyError: Si algún intermedio no está registrado
+        ValueError: Si las dependencias forman un ciclo
+    """
+    registry = INTERMEDIATES if registry is None else registry
+    order = []
+    state = {}      # nombre -> 'visiting' | 'done'
+    
+    def visit(name, path):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"Dependencia circular: {' -> '.join(path + [name])}")
+        if name not in registry:
+            raise KeyError(f"Intermedio desconocido: {name}")
+        state[name] = 'visiting'
+        for dependency in registry[name].requires:
+            visit(dependency, path + [name])
+        state[name] = 'done'
+        order.append(name)
+    
+    for name in names:
+        visit(name, [])
+    return order
+
+
+class Pipeline:
+    """
+    Ejecuta los intermedios de un dataset (cada uno una sola vez)
+    
+    Uso:
+        >>> pipeline = dataset.pipeline
+        >>> pipeline.run(CHARTS.values())        # Todos los que piden los gráficos
+        >>> pipeline.resolve(GraficoPareto.requires)['artist_counts']
+    """
+    
+    def __init__(self, dataset, registry=None):
+        """
+        Args:
+            dataset: SpotifyDataset sobre el que se calcula
+            registry: Diccionario nombre -> Intermediate (usa INTERMEDIATES si es None)
+        """
+        self.dataset = dataset
+        self.registry = INTERMEDIATES if registry is None else registry
+        self.computed = []      # Nombres calculados en este dataset, en orden
+    
+    def get(self, name):
+        """
+        Valor de un intermedio (y de sus dependencias), calculado una vez
+        
+        Args:
+            name: Nombre del intermedio
+        """
+        return self.resolve([name])[name]
+    
+    def resolve(self, names):
+        """
+        Valores de varios intermedios
+        
+        Args:
+            names: Nombres pedidos
+        
+        Returns:
+            Diccionario nombre -> valor (solo los pedidos)
+        """
+        values = {}
+        for name in dependency_order(names, self.registry):
+            step = self.registry[name]
+            values[name] = self.dataset.cached(
+                ('intermediate', name),
+                lambda step=step: self._compute(step, [values[dep] for dep in step.requires])
+            )
+        return {name: values[name] for name in names}
+    
+    def run(self, charts):
+        """
+        Calcula de una vez los intermedios que piden varios gráficos
+        
+        Args:
+            charts: Clases (o instancias) de gráficos con atributo ``requires``
+        
+        Returns:
+            Diccionario nombre -> valor de todos los intermedios pedidos
+        """
+        names = []
+        for chart in charts:
+            names.extend(name for name in getattr(chart, 'requires', ()) if name not in names)
+        return self.resolve(names)
+    
+    def _compute(self, step, inputs):
+        self.computed.append(step.name)
+        logger.debug(f"Intermedio '{step.name}' calculado ({len(self.dataset):,} filas)")
+        return step.compute(self.dataset, *inputs)
+
+
+# === INTERMEDIOS DE LOS GRÁFICOS ===
+
+@intermediate('popularity_mean')
+def popularity_mean(dataset):
+    """Popularidad media de las canciones (Histogramas, KDE)"""
+    return dataset['track_popularity'].mean()
+
+
+@intermediate('artist_counts')
+def artist_counts(dataset):
+    """Los 20 artistas con más canciones y su conteo (Pareto; Boxplots y Radar usan el principio)"""
+    return dataset.top_counts('artist_name', 20)
+
+
+@intermediate('album_types_top3')
+def album_types_top3(dataset):
+    """Los 3 tipos de álbum más comunes (Boxplots, Enjambre)"""
+    return dataset.top_values('album_type', 3)
+
+
+@intermediate('album_type_durations', requires=('album_types_top3',))
+def album_type_durations(dataset, album_types):
+    """Tipo de álbum y duración de las canciones de esos 3 tipos"""
+    return dataset.frame[['album_type', 'track_duration_min']].iloc[
+        dataset.index.rows_in('album_type', album_types)]
+
+
+@intermediate('explicit_rows')
+def explicit_rows(dataset):
+    """Posiciones de las canciones no explícitas (False) y explícitas (True)"""
+    index = dataset.index.category('explicit')
+    return {flag: index.rows(flag) for flag in (False, True)}
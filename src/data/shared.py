@@ -0,0 +1,300 @@
+"""
+🧩 DATASET COMPARTIDO ENTRE PROCESOS
+===================================
+Versión en disco del dataset limpio que los procesos abren con mmap
+
+Cada columna numérica, booleana o de fecha se guarda como un .npy que los
+workers abren con ``np.load(mmap_mode='r')``: el sistema operativo
+comparte esas páginas entre procesos y el DataFrame se construye sobre
+ellas sin copiarlas. Las columnas enteras con nulos (Int16, Int64...)
+guardan sus valores y una máscara de nulos aparte, y las fechas su
+unidad original, así los workers ven los mismos tipos que
+load_clean_data. Las columnas de texto se codifican con un único
+diccionario (todas las cadenas distintas, una sola vez, en UTF-8 con
+desplazamientos) más un array de códigos int32 por columna. Las columnas
+ya codificadas (Categorical, ver text.py) guardan sus propios códigos,
+que también se abren con mmap, y sus categorías como posiciones del
+diccionario.
+
+Estructura:
+    shared/
+        manifest.json            Filas, columnas, tipos y archivo de origen
+        00.npy, 01.npy...        Una columna por archivo: valores (o códigos, para texto)
+        00.mask.npy...           Máscara de nulos de las columnas con nulos propios (Int16...)
+        00.categories.npy...     Categorías de las columnas Categorical (posiciones del diccionario)
+        dictionary.bin           Cadenas del diccionario concatenadas (UTF-8)
+        dictionary_offsets.npy   Inicio de cada cadena en dictionary.bin
+"""
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from ..config.settings import SHARED_DATA_DIR, CLEAN_DATA_FILE
+from ..utils.logger import Logger
+
+logger = Logger(__name__)
+
+FORMAT_VERSION = 3
+MANIFEST = 'manifest.json'
+
+# Arrays de pandas con nulos propios (valores + máscara)
+MASKED_ARRAYS = (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+
+
+def source_stamp(source):
+    """Identifica una versión del archivo de origen (ruta, fecha y tamaño)"""
+    source = Path(source)
+    try:
+        stat = source.stat()
+    except FileNotFoundError:
+        return None
+    return {'path': str(source.resolve()), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def _column_kind(series):
+    """Cómo se guarda una columna: 'numeric', 'datetime', 'category' o 'text'"""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return 'category'
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(dtype):
+        return 'numeric'
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return 'datetime'
+    return 'text'
+
+
+def write_shared(frame, directory=None, source=None):
+    """
+    Escribe la versión compartida de un DataFrame
+    
+    Se escribe en una carpeta temporal que después reemplaza a la
+    anterior, así un worker nunca ve una versión a medias.
+    
+    Args:
+        frame: DataFrame limpio
+        directory: Carpeta de destino (usa SHARED_DATA_DIR si es None)
+        source: Archivo del que procede (para detectar versiones antiguas)
+    
+    Returns:
+        Path de la carpeta escrita
+    """
+    directory = Path(directory or SHARED_DATA_DIR)
+    tmp_dir = directory.with_name(f"{directory.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    
+    t0 = time.perf_counter()
+    dictionary = {}    # Cadena -> código global
+    columns = []
+    
+    def encode(values):
+        """Posiciones de los valores en el diccionario global"""
+        return np.array([dictionary.setdefault(str(value), len(dictionary)) for value in values],
+                        dtype=np.int32)
+    
+    for i, (name, series) in enumerate(frame.items()):
+        kind = _column_kind(series)
+        filename = f"{i:02d}.npy"
+        entry = {'name': name, 'kind': kind, 'file': filename}
+        
+        if kind == 'category':
+            # Códigos propios de la columna (int8/16/32) + categorías en el diccionario
+            values = series.array.codes
+            entry['dtype'] = str(values.dtype)
+            entry['categories'] = f"{i:02d}.categories.npy"
+            np.save(tmp_dir / entry['categories'], encode(series.cat.categories), allow_pickle=False)
+        elif kind == 'numeric' and isinstance(series.array, MASKED_ARRAYS):
+            # Enteros/booleanos con nulos: valores + máscara, sin pasar por float
+            numpy_dtype = series.dtype.numpy_dtype
+            values = series.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+            entry['dtype'] = str(numpy_dtype)
+            entry['extension'] = str(series.dtype)
+            entry['mask'] = f"{i:02d}.mask.npy"
+            np.save(tmp_dir / entry['mask'], series.isna().to_numpy(), allow_pickle=False)
+        elif kind == 'numeric':
+            values = series.to_numpy()
+            if values.dtype == object:
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            entry['dtype'] = str(values.dtype)
+        elif kind == 'datetime':
+            # Se conserva la unidad (s, ms, us, ns) con la que se cargó
+            values = series.to_numpy().view(np.int64)
+            entry['dtype'] = str(series.dtype)
+        else:
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            # Los códigos locales se traducen al diccionario global
+            mapping = encode(uniques)
+            values = np.where(codes >= 0, mapping[codes] if len(mapping) else -1, -1).astype(np.int32)
+            entry['dtype'] = 'int32'
+        
+        np.save(tmp_dir / filename, np.ascontiguousarray(values), allow_pickle=False)
+        columns.append(entry)
+    
+    # Diccionario: cadenas concatenadas + desplazamientos
+    encoded = [text.encode('utf-8') for text in dictionary]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    (tmp_dir / 'dictionary.bin').write_bytes(b''.join(encoded))
+    np.save(tmp_dir / 'dictionary_offsets.npy', offsets, allow_pickle=False)
+    
+    manifest = {
+        'version': FORMAT_VERSION,
+        'rows': len(frame),
+        'columns': columns,
+        'dictionary_size': len(encoded),
+        'source': source_stamp(source) if source is not None else None
+    }
+    (tmp_dir / MANIFEST).write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding='utf-8')
+    
+    # Reemplazar la versión anterior
+    old_dir = directory.with_name(f"{directory.name}.{os.getpid()}.old")
+    if directory.exists():
+        directory.rename(old_dir)
+    tmp_dir.rename(directory)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    
+    logger.info(f"Dataset compartido escrito: {len(columns)} columnas, "
+                f"{len(encoded):,} cadenas distintas ({time.perf_counter() - t0:.2f}s)")
+    return directory
+
+
+def is_current(directory=None, source=None):
+    """
+    Indica si la versión compartida existe y corresponde al archivo de origen
+    
+    Args:
+        directory: Carpeta compartida (usa SHARED_DATA_DIR si es None)
+        source: Archivo de origen a comprobar (None = no comprobarlo)
+    """
+    manifest_path = Path(directory or SHARED_DATA_DIR) / MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    if manifest.get('version') != FORMAT_VERSION:
+        return False
+    return source is None or manifest.get('source') == source_stamp(source)
+
+
+def shared_dir_for(source):
+    """Carpeta compartida de un CSV (SHARED_DATA_DIR para el archivo limpio por defecto)"""
+    source = Path(source)
+    if source.resolve() == Path(CLEAN_DATA_FILE).resolve():
+        return Path(SHARED_DATA_DIR)
+    return source.with_name(f"{source.stem}.shared")
+
+
+def ensure_shared(source=None, directory=None):
+    """
+    Devuelve la carpeta compartida, regenerándola si falta o está desactualizada
+    
+    Args:
+        source: CSV limpio de origen (usa CLEAN_DATA_FILE si es None)
+        directory: Carpeta compartida (None = la que corresponde a source)
+    
+    Returns:
+        Path de la carpeta compartida
+    """
+    from .loader import DataLoader
+    
+    source = Path(source or CLEAN_DATA_FILE)
+    directory = Path(directory or shared_dir_for(source))
+    if not is_current(directory, source):
+        logger.info("Preparando dataset compartido para los workers...")
+        write_shared(DataLoader().load_clean_data(source), directory, source=source)
+    return directory
+
+
+class SharedDataset:
+    """
+    Dataset compartido abierto en modo solo lectura
+    
+    Uso (en cada worker):
+        >>> shared = SharedDataset(SHARED_DATA_DIR)
+        >>> frame = shared.frame()     # Columnas numéricas sin copia
+    """
+    
+    def __init__(self, directory=None):
+        """
+        Args:
+            directory: Carpeta compartida (usa SHARED_DATA_DIR si es None)
+        """
+        self.directory = Path(directory or SHARED_DATA_DIR)
+        self.manifest = json.loads((self.directory / MANIFEST).read_text(encoding='utf-8'))
+        self.rows = self.manifest['rows']
+        self._dictionary = None
+    
+    @property
+    def source(self):
+        """Ruta del archivo del que se generó (o None)"""
+        stamp = self.manifest.get('source')
+        return Path(stamp['path']) if stamp else None
+    
+    def array(self, name):
+        """
+        Array de una columna abierto con mmap (sin leerlo en memoria)
+        
+        Para columnas de texto devuelve los códigos del diccionario.
+        """
+        entry = self._entry(name)
+        return np.load(self.directory / entry['file'], mmap_mode='r', allow_pickle=False)
+    
+    @property
+    def dictionary(self):
+        """Cadenas del diccionario (se decodifican una vez por proceso)"""
+        if self._dictionary is None:
+            offsets = np.load(self.directory / 'dictionary_offsets.npy', allow_pickle=False)
+            blob = (self.directory / 'dictionary.bin').read_bytes()
+            strings = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+            # Posición extra para el código -1 (nulo)
+            self._dictionary = np.array(strings + [np.nan], dtype=object)
+        return self._dictionary
+    
+    def values(self, name):
+        """
+        Array de valores de una columna
+        
+        Numéricas (y sus máscaras), fechas y códigos de las categóricas son
+        vistas del mmap; el resto del texto se decodifica apuntando cada
+        fila a la misma cadena del diccionario.
+        """
+        entry = self._entry(name)
+        values = self.array(name)
+        if entry['kind'] == 'category':
+            positions = np.load(self.directory / entry['categories'], allow_pickle=False)
+            categories = pd.Index(self.dictionary[positions].tolist())
+            return pd.Categorical.from_codes(values, categories=categories, validate=False)
+        if entry['kind'] == 'numeric' and 'mask' in entry:
+            mask = np.load(self.directory / entry['mask'], mmap_mode='r', allow_pickle=False)
+            array_type = pd.api.types.pandas_dtype(entry['extension']).construct_array_type()
+            return array_type(values, mask, copy=False)
+        if entry['kind'] == 'numeric':
+            return values
+        if entry['kind'] == 'datetime':
+            return values.view(entry['dtype'])
+        return self.dictionary.take(values)
+    
+    def column(self, name):
+        """Columna como Serie"""
+        return self.frame([name])[name]
+    
+    def frame(self, columns=None):
+        """
+        DataFrame con las columnas indicadas (None = todas)
+        
+        Las columnas numéricas y de fecha son vistas de solo lectura sobre
+        las páginas compartidas (se pasan como arrays: envolverlas antes en
+        una Serie haría una copia).
+        """
+        names = columns or [entry['name'] for entry in self.manifest['columns']]
+        return pd.DataFrame({name: self.values(name) for name in names}, copy=False)
+    
+    def _entry(self, name):
+        for entry in self.manifest['columns']:
+            if entry['name'] == name:
+                return entry
+        raise KeyError(f"Columna no encontrada en el dataset compartido: {name}")
@@ -0,0 +1,136 @@
+"""
+🔤 TEXTO CODIFICADO CON DICCIONARIO
+==================================
+Columnas de texto guardadas como diccionario de cadenas + códigos enteros
+
+Nombres de canción, artista y álbum (y la lista de géneros) se repiten
+muchísimo: cada fila es un objeto str de Python. Como Categorical de
+pandas cada cadena distinta se guarda una sola vez y cada fila ocupa un
+código int8/16/32. Las operaciones de texto (strip, lower, contains...)
+se aplican al diccionario, no fila a fila, y el resultado se vuelve a
+expandir con los códigos.
+
+Uso:
+    >>> names = encode_text(data['artist_name'])
+    >>> names = map_text(names, lambda d: d.str.strip())
+    >>> mask = contains_text(data['track_name'], 'love', case=False)
+"""
+import numpy as np
+import pandas as pd
+from ..config.settings import DICTIONARY_COLUMNS
+
+
+def is_encoded(series):
+    """True si la columna ya está codificada con diccionario"""
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def encode_text(series):
+    """
+    Codifica una columna de texto como diccionario + códigos
+    
+    El diccionario queda ordenado alfabéticamente, así que agrupar u
+    ordenar por la columna da el mismo orden que con texto normal.
+    
+    Args:
+        series: Serie de texto (si ya está codificada se devuelve tal cual)
+    
+    Returns:
+        Serie categórica
+    """
+    if is_encoded(series):
+        return series
+    return series.astype('category')
+
+
+def encode_columns(data, columns=None):
+    """
+    Codifica las columnas de texto de un DataFrame (in place)
+    
+    Args:
+        data: DataFrame
+        columns: Columnas a codificar (usa DICTIONARY_COLUMNS si es None)
+    
+    Returns:
+        Lista de columnas codificadas
+    """
+    encoded = []
+    for column in columns or DICTIONARY_COLUMNS:
+        if column in data.columns and not is_encoded(data[column]):
+            data[column] = encode_text(data[column])
+            encoded.append(column)
+    return encoded
+
+
+def decode_text(series):
+    """
+    Columna como texto normal (para partes pequeñas que se dibujan)
+    
+    Los gráficos que usan la columna como eje o la concatenan con otras
+    cadenas necesitan los valores, no el diccionario completo.
+    """
+    if not is_encoded(series):
+        return series
+    return series.astype(series.cat.categories.dtype)
+
+
+def map_text(series, func):
+    """
+    Aplica una transformación de texto sobre el diccionario
+    
+    ``func`` se evalúa una vez por cadena distinta. Si dos cadenas pasan
+    a ser iguales (p. ej. "Queen " y "Queen" tras strip) se fusionan en
+    una única entrada del diccionario.
+    
+    Args:
+        series: Serie de texto (se codifica si no lo está)
+        func: Función vectorizada Serie de texto -> Serie de texto
+    
+    Returns:
+        Serie categórica con el resultado
+    """
+    series = encode_text(series)
+    mapped = func(pd.Series(series.cat.categories, dtype=series.cat.categories.dtype))
+    
+    # Reagrupar el nuevo diccionario (ordenado y sin duplicados)
+    remap, categories = pd.factorize(np.asarray(mapped, dtype=object), sort=True)
+    codes = series.cat.codes.to_numpy()
+    codes = np.where(codes >= 0, np.append(remap, -1)[codes], -1)
+    
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=pd.Index(categories, dtype=series.cat.categories.dtype)),
+        index=series.index,
+        name=series.name
+    )
+
+
+def text_mask(series, predicate):
+    """
+    Máscara de las filas cuyo texto cumple ``predicate``
+    
+    El predicado se evalúa sobre el diccionario; los nulos nunca cumplen.
+    
+    Args:
+        series: Serie de texto
+        predicate: Función vectorizada Serie de texto -> Serie booleana
+    
+    Returns:
+        Array booleano de longitud len(series)
+    """
+    series = encode_text(series)
+    categories = pd.Series(series.cat.categories, dtype=series.cat.categories.dtype)
+    matched = np.asarray(predicate(categories), dtype=bool)
+    return np.append(matched, False)[series.cat.codes.to_numpy()]
+
+
+def contains_text(series, pattern, case=True, regex=True):
+    """
+    Máscara de las filas que contienen ``pattern`` (como str.contains)
+    
+    Args:
+        series: Serie de texto
+        pattern: Texto o expresión regular
+        case: False para no distinguir mayúsculas
+        regex: False para buscar el texto literal
+    """
+    return text_mask(series, lambda values: values.str.contains(pattern, case=case, regex=regex, na=False))
@@ -0,0 +1,99 @@
+"""
+🏅 TOP-K SOBRE CÓDIGOS
+=====================
+Los k valores más frecuentes (o con mayor puntuación) sin ordenar todo
+
+Sobre los códigos de un CategoryIndex:
+- Conteos por valor con np.bincount (opcionalmente solo en unas filas)
+- Los k mayores con np.argpartition: O(n) en lugar de O(n log n), y solo
+  los k elegidos se ordenan
+
+Los empates se resuelven siempre a favor del valor que aparece antes en
+los datos (o en las filas contadas), igual que value_counts y nlargest.
+"""
+import numpy as np
+
+
+def top_k(scores, k, ties=None):
+    """
+    Posiciones de las ``k`` puntuaciones más altas, de mayor a menor
+    
+    Args:
+        scores: Array de puntuaciones (los NaN nunca se eligen)
+        k: Número de posiciones a devolver (o menos si no hay tantas)
+        ties: Rango para desempatar, menor primero (None = la posición)
+    
+    Returns:
+        Array de posiciones ordenado por puntuación descendente y, en
+        caso de empate, por ``ties`` ascendente
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    ties = np.arange(len(scores)) if ties is None else np.asarray(ties)
+    valid = np.flatnonzero(~np.isnan(scores))
+    k = min(int(k), len(valid))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    if k < len(valid):
+        # Valor del k-ésimo mayor: los de encima entran todos, los empatados por orden
+        candidates = scores[valid]
+        kth = candidates[np.argpartition(-candidates, k - 1)[k - 1]]
+        above = valid[candidates > kth]
+        tied = valid[candidates == kth]
+        tied = tied[np.argsort(ties[tied], kind='stable')][:k - len(above)]
+        chosen = np.concatenate([above, tied])
+    else:
+        chosen = valid
+    
+    return chosen[np.lexsort((ties[chosen], -scores[chosen]))]
+
+
+def code_counts(codes, size, positions=None):
+    """
+    Filas por código (los nulos, código -1, no cuentan)
+    
+    Args:
+        codes: Código de cada fila
+        size: Número de códigos distintos
+        positions: Filas a contar (None = todas)
+    
+    Returns:
+        Array de longitud ``size``
+    """
+    if positions is not None:
+        codes = codes[positions]
+    return np.bincount(codes[codes >= 0], minlength=size)
+
+
+def first_seen(codes, size, positions):
+    """
+    Orden de primera aparición de cada código dentro de ``positions``
+    
+    Sirve para desempatar igual que value_counts sobre el subconjunto.
+    Los códigos que no aparecen quedan al final.
+    """
+    codes = codes[positions]
+    keep = codes >= 0
+    first = np.full(size, len(codes), dtype=np.int64)
+    np.minimum.at(first, codes[keep], np.flatnonzero(keep))
+    return first
+
+
+def code_max(codes, values, size):
+    """
+    Máximo de ``values`` por código (NaN si el código no tiene valores)
+    
+    Args:
+        codes: Código de cada fila
+        values: Valor numérico de cada fila
+        size: Número de códigos distintos
+    
+    Returns:
+        Array float de longitud ``size``
+    """
+    values = np.asarray(values, dtype=np.float64)
+    keep = (codes >= 0) & ~np.isnan(values)
+    result = np.full(size, -np.inf)
+    np.maximum.at(result, codes[keep], values[keep])
+    result[np.isneginf(result)] = np.nan
+    return result
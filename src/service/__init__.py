@@ -0,0 +1,29 @@
+"""
+Módulo de servicio: dashboard HTTP, demonio de renderizado y su cliente
+
+Las clases se importan al usarlas: el cliente del demonio
+(``python -m src.service.client``) no debe cargar pandas ni matplotlib.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    'RenderCache': '.cache',
+    'RenderedChart': '.cache',
+    'ChartRenderer': '.renderer',
+    'DashboardServer': '.server',
+    'serve': '.server',
+    'RenderDaemon': '.daemon',
+    'BatchExecutor': '.batch',
+    'BatchResult': '.batch',
+    'CostModel': '.scheduling',
+    'BatchOrchestrator': '.orchestrator',
+    'DaemonClient': '.client'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,31 @@
+"""
+Inicia el dashboard HTTP
+
+Uso:
+    python -m src.service
+    python -m src.service --host 0.0.0.0 --port 8050 --workers 4
+    python -m src.service --threads      # Un solo proceso, renderizado en hilos
+"""
+import argparse
+from pathlib import Path
+
+from ..config.settings import SERVER_HOST, SERVER_PORT, SERVER_WORKERS
+from .server import serve
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Dashboard HTTP de visualizaciones de Spotify')
+    parser.add_argument('--host', default=SERVER_HOST, help='Dirección de escucha')
+    parser.add_argument('--port', type=int, default=SERVER_PORT, help='Puerto')
+    parser.add_argument('--workers', type=int, default=SERVER_WORKERS, help='Procesos (o hilos) de renderizado')
+    parser.add_argument('--threads', action='store_true', help='Renderizar en hilos del servidor en lugar de procesos')
+    parser.add_argument('--data', type=Path, default=None, help='CSV limpio a servir')
+    parser.add_argument('--no-warm', action='store_true', help='No precalcular los gráficos al arrancar')
+    args = parser.parse_args(argv)
+    
+    serve(args.host, args.port, source=args.data, workers=args.workers, warm=not args.no_warm,
+          executor='thread' if args.threads else None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,459 @@
+"""
+🧯 GENERACIÓN POR LOTES CON LÍMITES
+==================================
+Ejecuta varios gráficos en procesos vigilados
+
+Un gráfico que se queda colgado (p. ej. swarmplot con una muestra mala)
+o que deja figuras y memoria sin liberar no debe bloquear ni ensuciar el
+resto del lote. Cada gráfico se genera (generate, sin ventana) en un
+proceso worker propio del lote y el proceso principal vigila:
+- Tiempo: cada gráfico tiene un límite (BATCH_TIMEOUT o su valor en
+  BATCH_CHART_TIMEOUTS); al superarlo el worker se termina (cancelación)
+  y se arranca otro para el resto
+- Memoria: la RSS del worker se consulta mientras dibuja y al terminar;
+  por encima de BATCH_MAX_RSS_MB se cancela el gráfico o se recicla el
+  worker
+- Fugas: tras cada gráfico el worker cuenta las figuras de matplotlib que
+  siguen vivas (canvas.open_figures); si quedan, se recicla
+- Reciclado: cada worker genera como máximo BATCH_MAX_TASKS_PER_WORKER
+  gráficos y después se reemplaza por uno nuevo
+- Orden: con BATCH_SCHEDULING = 'cost' los gráficos se envían del más
+  lento al más rápido según su coste estimado (scheduling.py)
+- PNG de Plotly: si el lote tiene gráficos de Plotly (Sankey), un
+  StaticExportWorker del proceso principal prepara kaleido mientras los
+  workers dibujan y exporta las figuras que estos le envían; un PNG que no
+  se pudo exportar deja su gráfico en estado 'partial'
+
+A diferencia de ProcessPoolExecutor, aquí cada worker es un proceso con
+su propia tubería, así se puede terminar uno concreto sin perder el pool.
+"""
+import multiprocessing
+import os
+import time
+from collections import deque
+from multiprocessing.connection import wait
+from pathlib import Path
+
+from ..config.settings import (
+    CLEAN_DATA_FILE,
+    BATCH_WORKERS,
+    BATCH_TIMEOUT,
+    BATCH_CHART_TIMEOUTS,
+    BATCH_MAX_TASKS_PER_WORKER,
+    BATCH_MAX_RSS_MB,
+    BATCH_SCHEDULING
+)
+from ..utils.logger import Logger
+from ..utils.profiling import current_rss_mb
+from .renderer import prepare_shared
+from .scheduling import CostModel
+
+logger = Logger(__name__)
+
+STARTUP_TIMEOUT = 120    # Segundos máximos para que un worker cargue los datos
+STARTUP_RETRIES = 1      # Arranques fallidos seguidos que se reintentan si no hay otro worker listo
+MEMORY_POLL = 1.0        # Segundos entre consultas de memoria de los workers ocupados
+
+
+def _batch_worker(conn, source, shared_dir, forward_exports=False):
+    """Bucle de un worker del lote: recibe (nombre, filtro) y devuelve sus métricas"""
+    from .renderer import init_worker, worker_dataset
+    init_worker(source, shared_dir)
+    from ..visualizations import CHARTS
+    from ..visualizations.canvas import open_figures
+    
+    if forward_exports:
+        # Los PNG de Plotly los exporta el StaticExportWorker del proceso principal
+        from ..visualizations.static_export import ExportForwarder
+        ExportForwarder(lambda item: conn.send(('export', item))).start()
+    
+    conn.send(('ready', os.getpid()))
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        
+        name, filters = task
+        before = open_figures()
+        begin = time.perf_counter()
+        error = None
+        chart = None
+        try:
+            chart = CHARTS[name](worker_dataset().select(filters))
+            chart.generate(show=False, save=True)
+        except Exception as e:
+            error = str(e).splitlines()[0] if str(e) else type(e).__name__
+        warnings = list(chart.warnings) if chart is not None else []
+        chart = None    # Sin referencias propias antes de contar las figuras vivas
+        seconds = time.perf_counter() - begin
+        figures = open_figures()
+        
+        conn.send(('done', {
+            'seconds': seconds,
+            'error': error,
+            'warnings': warnings,
+            'rss_mb': current_rss_mb(),
+            'figures': figures,
+            'leaked': max(0, figures - before)
+        }))
+
+
+class BatchResult:
+    """Resultado de un gráfico del lote"""
+    
+    __slots__ = ('name', 'status', 'seconds', 'predicted', 'rss_mb', 'figures', 'worker', 'error', 'notes')
+    
+    def __init__(self, name, status, seconds=None, rss_mb=None, figures=None, worker=None, error=None,
+                 predicted=None):
+        """
+        Args:
+            name: Clave del registro CHARTS
+            status: 'ok', 'partial' (generado, pero faltan salidas: ver notes),
+                'error', 'timeout', 'memory' o 'crashed'
+            seconds: Duración (reloj de pared)
+            rss_mb: Memoria del worker al terminar
+            figures: Figuras de matplotlib vivas en el worker al terminar
+            worker: PID del worker
+            error: Mensaje de error
+            predicted: Duración estimada antes de generarlo (CostModel)
+        """
+        self.name = name
+        self.status = status
+        self.seconds = seconds
+        self.predicted = predicted
+        self.rss_mb = rss_mb
+        self.figures = figures
+        self.worker = worker
+        self.error = error
+        self.notes = []      # Límites superados (tiempo, memoria, figuras) y salidas que faltan
+    
+    @property
+    def ok(self):
+        """True si el gráfico se generó (aunque falte alguna salida)"""
+        return self.status in ('ok', 'partial')
+    
+    @property
+    def exceeded(self):
+        """True si el gráfico superó algún límite o le falta alguna salida (aunque se generase)"""
+        return bool(self.notes)
+    
+    def __repr__(self):
+        return f"BatchResult({self.name!r}, {self.status!r})"
+
+
+class _Worker:
+    """Proceso worker del lote y su extremo de la tubería"""
+    
+    def __init__(self, context, source, shared_dir, forward_exports=False):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_batch_worker,
+            args=(child, source, shared_dir, forward_exports),
+            daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.ready = False
+        self.tasks = 0
+        self.task = None
+        self.timeout = None
+        self.started = time.monotonic()
+        self.deadline = self.started + STARTUP_TIMEOUT
+    
+    @property
+    def pid(self):
+        return self.process.pid
+    
+    def assign(self, name, filters, timeout):
+        """Envía un gráfico al worker y fija su plazo"""
+        self.task = name
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout
+        self.conn.send((name, filters))
+    
+    def finish(self):
+        """Marca el gráfico actual como terminado"""
+        self.task = None
+        self.deadline = float('inf')
+        self.tasks += 1
+    
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+    
+    def stop(self):
+        """Pide al worker que termine (tras su gráfico actual)"""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        self.kill()
+    
+    def kill(self):
+        """Termina el worker inmediatamente"""
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=2)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+        self.conn.close()
+
+
+class BatchExecutor:
+    """
+    Genera gráficos en workers con límite de tiempo, de memoria y reciclado
+    
+    Uso:
+        >>> results = BatchExecutor().run(['06_pareto', '09_enjambre'])
+        >>> [r.name for r in results if not r.ok or r.exceeded]
+    """
+    
+    def __init__(self, source=None, workers=BATCH_WORKERS, timeout=BATCH_TIMEOUT, timeouts=None,
+                 max_tasks=BATCH_MAX_TASKS_PER_WORKER, max_rss_mb=BATCH_MAX_RSS_MB,
+                 scheduling=BATCH_SCHEDULING, cost_model=None, export=None):
+        """
+        Args:
+            source: CSV limpio (usa CLEAN_DATA_FILE si es None)
+            workers: Procesos en paralelo
+            timeout: Segundos máximos por gráfico
+            timeouts: Límites propios por gráfico (usa BATCH_CHART_TIMEOUTS si es None)
+            max_tasks: Gráficos por worker antes de reemplazarlo (None = sin límite)
+            max_rss_mb: Memoria máxima por worker en MB (None = sin límite)
+            scheduling: 'cost' (más caros primero) u 'order' (orden recibido)
+            cost_model: CostModel con el historial (se lee PROFILE_LOG_FILE si es None)
+            export: Exportar los PNG de Plotly en un StaticExportWorker del lote
+                (None = solo si el lote incluye gráficos de Plotly)
+        """
+        self.source = Path(source or CLEAN_DATA_FILE)
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.timeouts = BATCH_CHART_TIMEOUTS if timeouts is None else timeouts
+        self.max_tasks = max_tasks
+        self.max_rss_mb = max_rss_mb
+        self.scheduling = scheduling
+        self.cost_model = cost_model
+        self.export = export
+        self.recycled = 0
+        self.predicted = None       # Duración estimada del último lote (sin arrancar workers)
+        self.elapsed = None         # Duración real del último lote
+        self._startup_failures = 0  # Arranques fallidos desde el último worker listo
+    
+    def timeout_for(self, name):
+        """Límite de tiempo de un gráfico"""
+        return self.timeouts.get(name, self.timeout)
+    
+    def run(self, names, filters=None, progress=None, rows=None):
+        """
+        Genera los gráficos (archivos en output/, sin mostrar ventanas)
+        
+        Args:
+            names: Claves del registro CHARTS
+            filters: DataFilter común a todos los gráficos (None = todos los datos)
+            progress: Función opcional (resultado, terminados, total) por gráfico
+            rows: Filas que recibirá cada gráfico (para estimar su coste)
+        
+        Returns:
+            Lista de BatchResult en el orden de ``names``
+        """
+        names = list(names)
+        begin = time.monotonic()
+        model = self.cost_model or CostModel()
+        order, costs, self.predicted = model.plan(names, self.workers, rows,
+                                                  longest_first=self.scheduling == 'cost')
+        pending = deque(order)
+        results = {}
+        workers = []
+        context = multiprocessing.get_context()
+        shared_dir = prepare_shared(self.source)
+        self._startup_failures = 0
+        exporter = self._start_exporter(names)
+        exports = {}     # Ruta del PNG -> gráfico que lo pidió
+        
+        def record(result):
+            result.predicted = costs.get(result.name)
+            results[result.name] = result
+            if result.notes:
+                logger.warning(f"{result.name}: {'; '.join(result.notes)}")
+            if progress is not None:
+                progress(result, len(results), len(names))
+        
+        def retire(worker, graceful=True):
+            workers.remove(worker)
+            if graceful:
+                worker.stop()
+            else:
+                worker.kill()
+        
+        try:
+            while pending or any(worker.task for worker in workers):
+                busy = sum(1 for worker in workers if worker.task)
+                while len(workers) < min(self.workers, busy + len(pending)):
+                    workers.append(_Worker(context, str(self.source), shared_dir, exporter is not None))
+                
+                for worker in workers:
+                    if worker.ready and worker.task is None and pending:
+                        name = pending.popleft()
+                        worker.assign(name, filters, self.timeout_for(name))
+                
+                # Esperar al primer mensaje, plazo o consulta de memoria
+                deadline = min(worker.deadline for worker in workers)
+                wait_for = max(0.0, deadline - time.monotonic())
+                if any(worker.task for worker in workers) and self.max_rss_mb:
+                    wait_for = min(wait_for, MEMORY_POLL)
+                ready = wait([worker.conn for worker in workers], timeout=wait_for)
+                
+                for worker in [worker for worker in workers if worker.conn in ready]:
+                    try:
+                        kind, payload = worker.conn.recv()
+                    except (EOFError, OSError):
+                        self._crashed(worker, workers, pending, record)
+                        retire(worker, graceful=False)
+                        continue
+                    
+                    if kind == 'ready':
+                        worker.ready = True
+                        worker.deadline = float('inf')
+                        self._startup_failures = 0
+                        continue
+                    
+                    if kind == 'export':
+                        fig, filepath, options = payload
+                        exporter.submit(fig, filepath, **options)
+                        exports[filepath] = worker.task
+                        continue
+                    
+                    result, recycle = self._finished(worker, payload)
+                    worker.finish()
+                    record(result)
+                    if recycle or (self.max_tasks and worker.tasks >= self.max_tasks):
+                        self.recycled += 1
+                        retire(worker)
+                
+                self._enforce_limits(workers, pending, record, retire)
+        finally:
+            for worker in list(workers):
+                retire(worker, graceful=not worker.task)
+            if exporter is not None:
+                self._close_exporter(exporter, exports, results)
+            self.elapsed = time.monotonic() - begin
+        
+        return [results[name] for name in names]
+    
+    def _start_exporter(self, names):
+        """StaticExportWorker del lote (None si no hace falta)"""
+        export = self.export
+        if export is None:
+            from ..visualizations import CHARTS
+            from ..visualizations.base import BasePlot
+            export = any(not issubclass(CHARTS[name], BasePlot) for name in names)
+        if not export:
+            return None
+        # Arranca kaleido mientras los workers cargan los datos y dibujan
+        from ..visualizations.static_export import StaticExportWorker
+        return StaticExportWorker().start(activate=False)
+    
+    def _close_exporter(self, exporter, exports, results):
+        """Espera a las exportaciones pendientes y anota en su gráfico las que fallaron"""
+        if exports:
+            logger.info("Esperando exportaciones estáticas en segundo plano...")
+        exporter.close()
+        failed = dict(exporter.failed)
+        for filepath, name in exports.items():
+            result = results.get(name)
+            if filepath in exporter.completed or result is None:
+                continue
+            error = failed.get(filepath)
+            if error is None:
+                note = f"PNG sin exportar tras {exporter.timeout}s"
+            else:
+                reason = next((line.strip() for line in error.splitlines() if line.strip()), 'error')
+                note = f"PNG no guardado: {reason}"
+            if result.status == 'ok':
+                result.status = 'partial'
+            result.notes.append(note)
+            logger.warning(f"{name}: {note}")
+    
+    def _finished(self, worker, payload):
+        """Resultado de un gráfico terminado y si hay que reciclar su worker"""
+        status = 'error' if payload['error'] else 'partial' if payload['warnings'] else 'ok'
+        result = BatchResult(
+            worker.task,
+            status,
+            seconds=payload['seconds'],
+            rss_mb=payload['rss_mb'],
+            figures=payload['figures'],
+            worker=worker.pid,
+            error=payload['error']
+        )
+        result.notes.extend(payload['warnings'])
+        recycle = False
+        if payload['leaked']:
+            result.notes.append(f"{payload['leaked']} figura(s) sin cerrar (worker reciclado)")
+            recycle = True
+        if self.max_rss_mb and payload['rss_mb'] and payload['rss_mb'] > self.max_rss_mb:
+            result.notes.append(f"RSS {payload['rss_mb']:,.0f} MB > {self.max_rss_mb:,} MB (worker reciclado)")
+            recycle = True
+        return result, recycle
+    
+    def _crashed(self, worker, workers, pending, record):
+        """Un worker terminó de forma inesperada"""
+        worker.process.join(timeout=2)
+        code = worker.process.exitcode
+        if worker.task:
+            result = BatchResult(worker.task, 'crashed', seconds=worker.elapsed, worker=worker.pid,
+                                 error=f"El proceso terminó inesperadamente (código {code})")
+            result.notes.append('proceso caído')
+            record(result)
+        elif not worker.ready:
+            self._startup_failed(worker, workers, pending, record,
+                                 f"No se pudo iniciar el worker (código {code})")
+    
+    def _startup_failed(self, worker, workers, pending, record, error):
+        """
+        Un worker no llegó a cargar los datos
+        
+        Se arranca otro en su lugar; el resto del lote solo se da por
+        perdido si ningún otro worker está listo y ya fallaron más de
+        STARTUP_RETRIES arranques seguidos (p. ej. datos ilegibles).
+        """
+        self._startup_failures += 1
+        if any(other.ready for other in workers if other is not worker) \
+                or self._startup_failures <= STARTUP_RETRIES:
+            logger.warning(f"Worker {worker.pid}: {error}; se arranca otro")
+            return
+        logger.error(f"Worker {worker.pid}: {error}; {len(pending)} gráfico(s) sin generar")
+        while pending:
+            record(BatchResult(pending.popleft(), 'crashed', worker=worker.pid, error=error))
+    
+    def _enforce_limits(self, workers, pending, record, retire):
+        """Cancela los gráficos que superan su tiempo o la memoria máxima"""
+        now = time.monotonic()
+        for worker in list(workers):
+            if not worker.ready and now >= worker.deadline:
+                retire(worker, graceful=False)
+                self._startup_failed(worker, workers, pending, record,
+                                     f"El worker no terminó de cargar los datos en {STARTUP_TIMEOUT}s")
+                continue
+            if not worker.task:
+                continue
+            
+            if now >= worker.deadline:
+                result = BatchResult(worker.task, 'timeout', seconds=worker.elapsed, worker=worker.pid,
+                                     error=f"Cancelado tras {worker.timeout}s")
+                result.notes.append(f"superó el tiempo límite ({worker.timeout}s)")
+            else:
+                rss = current_rss_mb(worker.pid) if self.max_rss_mb else None
+                if rss is None or rss <= self.max_rss_mb:
+                    continue
+                result = BatchResult(worker.task, 'memory', seconds=worker.elapsed, rss_mb=rss, worker=worker.pid,
+                                     error=f"Cancelado al superar {self.max_rss_mb:,} MB")
+                result.notes.append(f"RSS {rss:,.0f} MB > {self.max_rss_mb:,} MB")
+            
+            retire(worker, graceful=False)
+            record(result)
@@ -0,0 +1,92 @@
+"""
+🗃️ CACHÉ DE RENDERIZADOS
+=======================
+Caché LRU en memoria, limitada por tamaño, con ETags para respuestas 304
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class RenderedChart:
+    """Resultado de renderizar un gráfico (cuerpo, tipo MIME y ETag)"""
+    
+    __slots__ = ('body', 'content_type', 'etag', 'created')
+    
+    def __init__(self, body, content_type):
+        """
+        Args:
+            body: Bytes de la respuesta
+            content_type: Tipo MIME
+        """
+        self.body = body
+        self.content_type = content_type
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.created = time.time()
+
+
+class RenderCache:
+    """
+    Caché LRU segura entre hilos
+    
+    Expulsa las entradas menos usadas recientemente cuando la suma de
+    tamaños supera ``max_bytes``.
+    """
+    
+    def __init__(self, max_bytes):
+        """
+        Args:
+            max_bytes: Tamaño máximo total de los cuerpos guardados
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """
+        Returns:
+            RenderedChart o None si no está en caché
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(self, key, entry):
+        """Guarda un resultado y expulsa los más antiguos si hace falta"""
+        if len(entry.body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old.body)
+            self._entries[key] = entry
+            self.size += len(entry.body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.body)
+    
+    def clear(self):
+        """Vacía la caché"""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+    
+    def stats(self):
+        """Estadísticas para el endpoint /api/stats"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_mb': round(self.size / 1024 ** 2, 2),
+                'max_mb': round(self.max_bytes / 1024 ** 2, 2),
+                'hits': self.hits,
+                'misses': self.misses
+            }
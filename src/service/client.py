@@ -0,0 +1,231 @@
+"""
+📡 CLIENTE DEL DEMONIO DE RENDERIZADO
+====================================
+Cliente ligero: envía la petición al demonio (daemon.py) y devuelve el
+resultado sin importar pandas ni matplotlib
+
+Uso:
+    python -m src.service.client ping
+    python -m src.service.client render 06_pareto -o pareto.png --year-min 2018
+    python -m src.service.client search love
+    python -m src.service.client compare "Drake" "The Weeknd"
+    python -m src.service.client stop
+
+    >>> with DaemonClient() as client:
+    ...     png = client.render('06_pareto', filters={'explicit': 'false'})
+"""
+import argparse
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+
+from .protocol import default_socket_path, read_message, send_message
+
+
+class DaemonClient:
+    """Conexión con el demonio (se puede reutilizar para varias peticiones)"""
+    
+    def __init__(self, socket_path=None, timeout=300):
+        """
+        Args:
+            socket_path: Ruta del socket (usa default_socket_path() si es None)
+            timeout: Segundos máximos de espera por respuesta
+        """
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.timeout = timeout
+        self._socket = None
+        self._reader = None
+        self._writer = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def connect(self):
+        """Abre la conexión (se llama sola en la primera petición)"""
+        if self._socket is not None:
+            return self
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            sock.close()
+            raise ConnectionError(
+                f"No hay demonio en {self.socket_path} (arráncalo con: python -m src.service.daemon)"
+            ) from e
+        self._socket = sock
+        self._reader = sock.makefile('rb')
+        self._writer = sock.makefile('wb')
+        return self
+    
+    def close(self):
+        """Cierra la conexión"""
+        for stream in (self._reader, self._writer, self._socket):
+            if stream is not None:
+                stream.close()
+        self._socket = self._reader = self._writer = None
+    
+    def request(self, op, **params):
+        """
+        Envía una petición y espera la respuesta
+        
+        Args:
+            op: Operación (ping, charts, render, search, compare, stats, shutdown)
+            **params: Parámetros de la operación
+        
+        Returns:
+            Tupla (cabecera, cuerpo)
+        
+        Raises:
+            ConnectionError: Si el demonio no está disponible
+            RuntimeError: Si el demonio devuelve un error
+        """
+        self.connect()
+        send_message(self._writer, dict(params, op=op))
+        header, body = read_message(self._reader)
+        if header is None:
+            self.close()
+            raise ConnectionError("El demonio cerró la conexión")
+        if not header.get('ok'):
+            raise RuntimeError(header.get('error') or 'Error desconocido')
+        return header, body
+    
+    # === OPERACIONES ===
+    
+    def ping(self):
+        """Estado del demonio (pid, uptime, workers)"""
+        return self.request('ping')[0]
+    
+    def charts(self):
+        """Nombres de los gráficos disponibles"""
+        return self.request('charts')[0]['charts']
+    
+    def render(self, chart, fmt='png', dpi=None, filters=None, theme=None):
+        """
+        Renderiza un gráfico
+        
+        Args:
+            chart: Clave del registro CHARTS (p. ej. '06_pareto')
+            fmt: 'png', 'svg', 'pdf' o 'html'
+            dpi: Resolución de los formatos raster (None = SERVER_DPI)
+            filters: Diccionario de filtros (claves de DataFilter.from_dict)
+            theme: Nombre del tema (None = DEFAULT_THEME)
+        
+        Returns:
+            Bytes de la imagen
+        """
+        return self.request('render', chart=chart, fmt=fmt, dpi=dpi, filters=filters, theme=theme)[1]
+    
+    def search(self, query, limit=10, filters=None):
+        """
+        Busca canciones por nombre (helpers.search_songs)
+        
+        Returns:
+            Tupla (total de resultados, lista de los ``limit`` primeros)
+        """
+        header, body = self.request('search', query=query, limit=limit, filters=filters)
+        return header['total'], json.loads(body)
+    
+    def compare(self, artist1, artist2, filters=None):
+        """
+        Compara dos artistas (helpers.compare_artists)
+        
+        Returns:
+            Diccionario {'columns': [...], 'data': [[...], ...]}
+        """
+        return json.loads(self.request('compare', artist1=artist1, artist2=artist2, filters=filters)[1])
+    
+    def stats(self):
+        """Estadísticas de la caché de renderizados"""
+        return self.request('stats')[0]['cache']
+    
+    def shutdown(self):
+        """Detiene el demonio"""
+        self.request('shutdown')
+        self.close()
+
+
+# Filtros aceptados en la línea de comandos (claves de DataFilter.from_dict)
+FILTER_KEYS = ('year_min', 'year_max', 'artist', 'genre', 'explicit', 'album_type', 'popularity_min', 'popularity_max')
+
+
+def _filters(args):
+    """Filtros de la línea de comandos (solo los indicados)"""
+    return {key: getattr(args, key) for key in FILTER_KEYS if getattr(args, key) is not None} or None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cliente del demonio de renderizado')
+    parser.add_argument('--socket', type=Path, default=None, help='Ruta del socket Unix')
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    commands.add_parser('ping', help='Estado del demonio')
+    commands.add_parser('charts', help='Gráficos disponibles')
+    commands.add_parser('stats', help='Estadísticas de la caché')
+    commands.add_parser('stop', help='Detener el demonio')
+    
+    render = commands.add_parser('render', help='Renderizar un gráfico')
+    render.add_argument('chart', help='Nombre del gráfico (p. ej. 06_pareto)')
+    render.add_argument('-o', '--output', type=Path, default=None, help='Archivo de salida (- = stdout)')
+    render.add_argument('--fmt', default='png', choices=('png', 'svg', 'pdf', 'html'))
+    render.add_argument('--dpi', type=int, default=None)
+    render.add_argument('--theme', default=None)
+    
+    search = commands.add_parser('search', help='Buscar canciones')
+    search.add_argument('query')
+    search.add_argument('--limit', type=int, default=10)
+    
+    compare = commands.add_parser('compare', help='Comparar dos artistas')
+    compare.add_argument('artist1')
+    compare.add_argument('artist2')
+    
+    for command in (render, search, compare):
+        for key in FILTER_KEYS:
+            command.add_argument(f"--{key.replace('_', '-')}", dest=key, default=None)
+    
+    args = parser.parse_args(argv)
+    begin = time.perf_counter()
+    
+    try:
+        with DaemonClient(args.socket) as client:
+            if args.command == 'ping':
+                print(json.dumps(client.ping(), ensure_ascii=False))
+            elif args.command == 'charts':
+                print('\n'.join(client.charts()))
+            elif args.command == 'stats':
+                print(json.dumps(client.stats(), ensure_ascii=False))
+            elif args.command == 'stop':
+                client.shutdown()
+                print("Demonio detenido")
+            elif args.command == 'render':
+                body = client.render(args.chart, args.fmt, args.dpi, _filters(args), args.theme)
+                if args.output is not None and str(args.output) == '-':
+                    sys.stdout.buffer.write(body)
+                    return 0
+                output = args.output or Path(f"{args.chart}.{args.fmt}")
+                output.write_bytes(body)
+                print(f"{output} ({len(body):,} bytes)")
+            elif args.command == 'search':
+                total, results = client.search(args.query, args.limit, _filters(args))
+                for i, row in enumerate(results, 1):
+                    print(f"{i:2d}. {row['track_name']} · {row['artist_name']} (⭐ {row['track_popularity']})")
+                print(f"{len(results)} de {total} resultados")
+            elif args.command == 'compare':
+                comparison = client.compare(args.artist1, args.artist2, _filters(args))
+                for row in comparison['data']:
+                    print(' | '.join(str(value) for value in row))
+    except (ConnectionError, RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    
+    print(f"⏱️  {(time.perf_counter() - begin) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
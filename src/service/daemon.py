@@ -0,0 +1,237 @@
+"""
+🔁 DEMONIO DE RENDERIZADO
+========================
+Proceso persistente que mantiene todo cargado entre invocaciones
+
+Arrancar el menú o un script cuesta segundos antes de dibujar nada:
+importar pandas/matplotlib/seaborn/plotly, cargar el CSV y construir los
+índices. El demonio paga ese coste una vez y lo conserva:
+- Un ChartRenderer con sus workers ya arrancados (procesos con las
+  librerías importadas y el dataset compartido abierto) y su caché
+- El dataset con sus índices en el propio demonio, para búsquedas y
+  comparaciones (search_songs, compare_artists)
+
+Atiende peticiones por un socket Unix local (protocol.py); client.py es
+el cliente ligero.
+
+Uso:
+    python -m src.service.daemon                 # En primer plano (Ctrl+C para parar)
+    python -m src.service.daemon --threads       # Renders en hilos del demonio
+    python -m src.service.client render 06_pareto -o pareto.png
+"""
+import argparse
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+
+from ..config.settings import DAEMON_WORKERS, SERVER_DPI, SERVER_EXECUTOR
+from ..data.filters import DataFilter
+from ..utils.helpers import search_songs, compare_artists
+from ..utils.logger import Logger
+from ..visualizations import CHARTS
+from .protocol import default_socket_path, read_message, send_message
+from .renderer import ChartRenderer
+
+logger = Logger(__name__)
+
+OPERATIONS = ('ping', 'charts', 'render', 'search', 'compare', 'stats', 'shutdown')
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+    """Atiende una conexión: varias peticiones seguidas hasta que el cliente cierra"""
+    
+    def handle(self):
+        while True:
+            try:
+                request, _ = read_message(self.rfile)
+            except (ValueError, ConnectionError) as e:
+                send_message(self.wfile, {'ok': False, 'error': f"Petición inválida: {e}"})
+                return
+            if request is None:
+                return
+            
+            header, body = self.server.daemon.dispatch(request)
+            try:
+                send_message(self.wfile, header, body)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            
+            if request.get('op') == 'shutdown':
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Servidor de socket Unix con un hilo por conexión"""
+    
+    daemon_threads = True
+    
+    def __init__(self, path, daemon):
+        self.daemon = daemon
+        super().__init__(str(path), DaemonHandler)
+
+
+class RenderDaemon:
+    """
+    Renderer, dataset e índices precalentados detrás de un socket Unix
+    
+    Uso:
+        >>> RenderDaemon(workers=4).serve_forever()
+    """
+    
+    def __init__(self, socket_path=None, source=None, workers=DAEMON_WORKERS, executor=None):
+        """
+        Args:
+            socket_path: Ruta del socket (usa default_socket_path() si es None)
+            source: CSV limpio a servir (usa CLEAN_DATA_FILE si es None)
+            workers: Procesos (o hilos) de renderizado
+            executor: 'process' o 'thread' (usa SERVER_EXECUTOR si es None)
+        """
+        if not hasattr(socket, 'AF_UNIX'):
+            raise RuntimeError("El demonio necesita sockets Unix (no disponibles en este sistema)")
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.renderer = ChartRenderer(source=source, workers=workers, executor=executor or SERVER_EXECUTOR)
+        self.started = None
+    
+    def start(self, warm=True):
+        """
+        Arranca los workers y carga el dataset con sus índices
+        
+        Args:
+            warm: Si renderizar además los PNG para llenar la caché
+        """
+        begin = time.perf_counter()
+        self.renderer.start()
+        dataset = self.renderer.local_dataset()
+        dataset.index.build()
+        self.started = time.time()
+        logger.success(
+            f"Demonio listo en {time.perf_counter() - begin:.1f}s "
+            f"({len(dataset):,} filas, {self.renderer.workers} workers {self.renderer.executor})"
+        )
+        if warm:
+            self.renderer.warm([name for name in CHARTS if name != '10_sankey'])
+        return self
+    
+    def serve_forever(self, warm=True):
+        """Atiende peticiones hasta recibir 'shutdown' o Ctrl+C"""
+        self._claim_socket()
+        try:
+            with DaemonServer(self.socket_path, self) as server:
+                os.chmod(self.socket_path, 0o600)
+                self.start(warm=warm)
+                logger.info(f"Escuchando en {self.socket_path}")
+                try:
+                    server.serve_forever()
+                except KeyboardInterrupt:
+                    logger.info("Demonio detenido")
+        finally:
+            self.renderer.close()
+            self.socket_path.unlink(missing_ok=True)
+    
+    def _claim_socket(self):
+        """Elimina un socket abandonado (o falla si otro demonio lo está usando)"""
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink(missing_ok=True)
+        else:
+            raise RuntimeError(f"Ya hay un demonio escuchando en {self.socket_path}")
+        finally:
+            probe.close()
+    
+    # === PETICIONES ===
+    
+    def dispatch(self, request):
+        """
+        Ejecuta una petición
+        
+        Args:
+            request: Cabecera recibida ({'op': ..., parámetros})
+        
+        Returns:
+            Tupla (cabecera de respuesta, cuerpo)
+        """
+        op = request.get('op')
+        if op not in OPERATIONS:
+            return {'ok': False, 'error': f"Operación desconocida: {op}"}, b''
+        try:
+            header, body = getattr(self, f'_{op}')(request)
+        except Exception as e:
+            logger.error(f"Error en '{op}': {e}")
+            return {'ok': False, 'error': str(e).splitlines()[0] if str(e) else type(e).__name__}, b''
+        return dict(header, ok=True), body
+    
+    def _dataset(self, request):
+        """Dataset del demonio con el filtro de la petición (si lo hay)"""
+        return self.renderer.local_dataset().select(DataFilter.from_dict(request.get('filters') or {}))
+    
+    def _ping(self, request):
+        return {
+            'pid': os.getpid(),
+            'uptime': round(time.time() - self.started, 1) if self.started else 0,
+            'workers': self.renderer.workers,
+            'executor': self.renderer.executor
+        }, b''
+    
+    def _charts(self, request):
+        return {'charts': list(CHARTS)}, b''
+    
+    def _stats(self, request):
+        return {'cache': self.renderer.cache.stats()}, b''
+    
+    def _shutdown(self, request):
+        logger.info("Parada solicitada por un cliente")
+        return {}, b''
+    
+    def _render(self, request):
+        name = request.get('chart')
+        if name not in CHARTS:
+            raise ValueError(f"Gráfico desconocido: {name}")
+        filters = DataFilter.from_dict(request.get('filters') or {})
+        entry = self.renderer.get(
+            name,
+            request.get('fmt') or 'png',
+            int(request.get('dpi') or SERVER_DPI),
+            filters,
+            theme=request.get('theme')
+        )
+        return {'content_type': entry.content_type, 'etag': entry.etag}, entry.body
+    
+    def _search(self, request):
+        results = search_songs(self._dataset(request), request.get('query') or '')
+        limit = int(request.get('limit') or 10)
+        body = results.head(limit).to_json(orient='records', force_ascii=False) if len(results) else '[]'
+        return {'total': len(results), 'content_type': 'application/json'}, body.encode('utf-8')
+    
+    def _compare(self, request):
+        artist1, artist2 = request.get('artist1'), request.get('artist2')
+        comparison = compare_artists(self._dataset(request), artist1, artist2)
+        if comparison is None:
+            raise ValueError(f"No se encontró alguno de los artistas: {artist1}, {artist2}")
+        body = comparison.to_json(orient='split', index=False, force_ascii=False)
+        return {'content_type': 'application/json'}, body.encode('utf-8')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Demonio de renderizado de visualizaciones de Spotify')
+    parser.add_argument('--socket', type=Path, default=None, help='Ruta del socket Unix')
+    parser.add_argument('--workers', type=int, default=DAEMON_WORKERS, help='Procesos (o hilos) de renderizado')
+    parser.add_argument('--threads', action='store_true', help='Renderizar en hilos del demonio en lugar de procesos')
+    parser.add_argument('--data', type=Path, default=None, help='CSV limpio a servir')
+    parser.add_argument('--no-warm', action='store_true', help='No precalcular los gráficos al arrancar')
+    args = parser.parse_args(argv)
+    
+    daemon = RenderDaemon(args.socket, source=args.data, workers=args.workers,
+                          executor='thread' if args.threads else None)
+    daemon.serve_forever(warm=not args.no_warm)
+
+
+if __name__ == '__main__':
+    main()
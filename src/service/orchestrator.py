@@ -0,0 +1,336 @@
+"""
+🎼 ORQUESTADOR ASÍNCRONO DEL LOTE
+=================================
+Solapa las etapas de E/S y de CPU de una generación completa
+
+En serie, un lote lee el CSV crudo, lo limpia, escribe el CSV limpio y
+después, gráfico a gráfico, dibuja, codifica el PNG y lo escribe (el
+Sankey además escribe su HTML y espera a kaleido): cada etapa espera a la
+anterior aunque no dependa de ella. El orquestador (asyncio) las encadena:
+- Carga: cada CSV crudo se lee en un hilo mientras se limpia el anterior
+- CSV limpio: se escribe en un hilo mientras empiezan los gráficos
+- Dibujo: un hilo dibuja las figuras de matplotlib de una en una
+  (prepare, create, customize, layout)
+- Codificación: ORCHESTRATOR_ENCODERS hilos rasterizan, comprimen y
+  escriben cada figura mientras se dibuja la siguiente
+- Plotly: el Sankey se crea y exporta (HTML y PNG con kaleido a la vez)
+  en paralelo con todo lo anterior
+
+Entre el dibujo y la codificación hay una cola acotada
+(ORCHESTRATOR_QUEUE_SIZE): si los codificadores se retrasan, el dibujo
+espera, así nunca hay más de QUEUE_SIZE + ENCODERS + 1 figuras abiertas.
+
+A diferencia de BatchExecutor (batch.py), todo ocurre en un solo proceso:
+no hay límites de tiempo ni de memoria por gráfico.
+
+Uso:
+    python -m src.service.orchestrator                   # CSV limpio (o el crudo si no existe)
+    python -m src.service.orchestrator --raw enero.csv febrero.csv
+    python -m src.service.orchestrator --charts 06_pareto 10_sankey --encoders 4
+"""
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ..config.settings import (
+    CLEAN_DATA_FILE,
+    RAW_DATA_FILE,
+    INTERACTIVE_EXPORT,
+    ORCHESTRATOR_QUEUE_SIZE,
+    ORCHESTRATOR_ENCODERS
+)
+from ..config.themes import theme_scope
+from ..data.cleaner import DataCleaner
+from ..data.dataset import SpotifyDataset
+from ..data.loader import DataLoader
+from ..utils.logger import Logger
+from ..utils.profiling import ChartProfiler
+from ..visualizations import CHARTS
+from ..visualizations.base import BasePlot
+from ..visualizations.canvas import close_figure, text_layout
+from .batch import BatchResult
+
+logger = Logger(__name__)
+
+STAGES = {
+    'load': 'Carga',
+    'clean': 'Limpieza',
+    'write': 'CSV limpio',
+    'draw': 'Dibujo',
+    'encode': 'Codificación',
+    'plotly': 'Plotly'
+}
+
+
+class BatchOrchestrator:
+    """
+    Genera un lote completo con las etapas solapadas
+    
+    Uso:
+        >>> orchestrator = BatchOrchestrator()
+        >>> results = orchestrator.run()                           # Todos los gráficos
+        >>> results = orchestrator.run(['06_pareto'], raw=['enero.csv', 'febrero.csv'])
+        >>> orchestrator.stages                                    # Segundos ocupados por etapa
+    """
+    
+    def __init__(self, source=None, queue_size=ORCHESTRATOR_QUEUE_SIZE, encoders=ORCHESTRATOR_ENCODERS,
+                 profile=None, interactive=None):
+        """
+        Args:
+            source: CSV limpio que se lee o, si se parte de datos crudos, se
+                    escribe (usa CLEAN_DATA_FILE si es None)
+            queue_size: Figuras dibujadas que pueden esperar a ser codificadas
+            encoders: Hilos que codifican y escriben las imágenes
+            profile: Si registrar tiempos por fase (None = usar PROFILING_ENABLED)
+            interactive: Si guardar también el HTML de Plotly (None = INTERACTIVE_EXPORT)
+        """
+        self.source = Path(source or CLEAN_DATA_FILE)
+        self.queue_size = max(1, queue_size)
+        self.encoders = max(1, encoders)
+        self.profile = profile
+        self.interactive = INTERACTIVE_EXPORT if interactive is None else interactive
+        self.dataset = None
+        self.elapsed = None       # Segundos de pared del último lote
+        self.stages = {}          # Etapa -> segundos ocupados (pueden solaparse)
+    
+    def run(self, charts=None, raw=None):
+        """
+        Genera los gráficos (bloquea hasta terminar)
+        
+        Args:
+            charts: Claves del registro CHARTS (todas si es None)
+            raw: CSV crudos a limpiar y unir (None = leer el CSV limpio si
+                 existe o, si no, limpiar RAW_DATA_FILE)
+        
+        Returns:
+            Lista de BatchResult en el orden de ``charts``
+        """
+        return asyncio.run(self.run_async(charts, raw))
+    
+    async def run_async(self, charts=None, raw=None):
+        """Versión asíncrona de run() (para usarla dentro de otro bucle de eventos)"""
+        begin = time.perf_counter()
+        names = list(charts or CHARTS)
+        self.stages = {}
+        
+        writer = None
+        if raw is None and self.source.exists():
+            self.dataset = await self._stage('load', SpotifyDataset.load, self.source)
+        else:
+            if raw is None:
+                logger.warning("Datos limpios no encontrados. Procesando datos crudos...")
+            cleaner = await self._clean_inputs([Path(path) for path in raw or [RAW_DATA_FILE]])
+            self.dataset = SpotifyDataset(cleaner.data, source=self.source)
+            # El CSV limpio se escribe mientras se dibujan los gráficos
+            writer = asyncio.create_task(self._stage('write', cleaner.save, self.source))
+        
+        try:
+            results = await self._generate(names)
+        finally:
+            if writer is not None:
+                await writer
+        
+        self.elapsed = time.perf_counter() - begin
+        busy = ', '.join(f"{STAGES[name]} {secs:.1f}s" for name, secs in self.stages.items())
+        logger.info(f"Lote en {self.elapsed:.1f}s (ocupación por etapa: {busy})")
+        return results
+    
+    async def _stage(self, name, func, *args, executor=None):
+        """Ejecuta func(*args) en un hilo y suma su duración a la etapa ``name``"""
+        loop = asyncio.get_running_loop()
+        t0 = time.perf_counter()
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - t0)
+    
+    async def _clean_inputs(self, paths):
+        """
+        Lee y limpia los CSV crudos: el siguiente se lee mientras se limpia el actual
+        
+        Como mucho hay un archivo leído por adelantado, así la memoria no
+        crece con el número de archivos.
+        
+        Args:
+            paths: Rutas de los CSV crudos
+        
+        Returns:
+            DataCleaner con los datos limpios (unidos si hay varios archivos)
+        """
+        def read(path):
+            return asyncio.ensure_future(self._stage('load', DataLoader().load_raw_data, path))
+        
+        cleaners = []
+        pending = read(paths[0])
+        for position in range(len(paths)):
+            frame = await pending
+            if position + 1 < len(paths):
+                pending = read(paths[position + 1])
+            cleaner = DataCleaner(frame)
+            del frame
+            await self._stage('clean', cleaner.clean)
+            cleaners.append(cleaner)
+        
+        if len(cleaners) == 1:
+            return cleaners[0]
+        return await self._stage('clean', DataCleaner.merge, [cleaner.data for cleaner in cleaners])
+    
+    async def _generate(self, names):
+        """Dibuja, codifica y exporta los gráficos con las etapas solapadas"""
+        results = {}
+        drawn = asyncio.Queue(maxsize=self.queue_size)
+        draw_pool = ThreadPoolExecutor(1, thread_name_prefix='orchestrator-draw')
+        encode_pool = ThreadPoolExecutor(self.encoders, thread_name_prefix='orchestrator-encode')
+        
+        charts = [(name, CHARTS[name](self.dataset)) for name in names]
+        
+        try:
+            # Plotly (Sankey) no usa el hilo de dibujo y su exportación con
+            # kaleido es la más lenta: arranca antes que nada
+            exports = [asyncio.create_task(self._plotly(name, chart, results))
+                       for name, chart in charts if not isinstance(chart, BasePlot)]
+            encoders = [asyncio.create_task(self._encoder(drawn, encode_pool, results))
+                        for _ in range(self.encoders)]
+            
+            for name, chart in charts:
+                if isinstance(chart, BasePlot):
+                    job = await self._draw(name, chart, draw_pool, results)
+                    if job is not None:
+                        await drawn.put(job)      # Espera si la cola está llena
+            
+            for _ in encoders:
+                await drawn.put(None)
+            await asyncio.gather(*encoders, *exports)
+        finally:
+            draw_pool.shutdown()
+            encode_pool.shutdown()
+        
+        return [results[name] for name in names]
+    
+    def _profiler(self, name):
+        # Sin memoria pico: con varias fases a la vez no sería de un solo gráfico
+        return ChartProfiler(name, rows=len(self.dataset), enabled=self.profile, memory=False).start()
+    
+    async def _draw(self, name, chart, executor, results):
+        """
+        Etapa de dibujo de un gráfico de matplotlib
+        
+        Returns:
+            Tupla (nombre, gráfico, perfilador, inicio) para los codificadores
+            o None si falló
+        """
+        begin = time.perf_counter()
+        profiler = self._profiler(name)
+        try:
+            await self._stage('draw', _draw_figure, chart, profiler, executor=executor)
+        except Exception as e:
+            close_figure(chart.fig)
+            self._finish(results, name, profiler, begin, error=e)
+            return None
+        return name, chart, profiler, begin
+    
+    async def _encoder(self, drawn, executor, results):
+        """Codificador: toma figuras dibujadas de la cola hasta recibir None"""
+        while (job := await drawn.get()) is not None:
+            name, chart, profiler, begin = job
+            try:
+                await self._stage('encode', self._encode_figure, chart, profiler, executor=executor)
+            except Exception as e:
+                self._finish(results, name, profiler, begin, error=e)
+            else:
+                self._finish(results, name, profiler, begin)
+    
+    def _encode_figure(self, chart, profiler):
+        """Rasteriza y escribe la figura (en un hilo codificador) y la cierra"""
+        try:
+            with theme_scope(chart.theme):
+                with profiler.phase('save'), text_layout(chart.fig):
+                    if not chart.save():
+                        raise RuntimeError("No se guardó ningún archivo")
+                if self.interactive:
+                    with profiler.phase('interactive'):
+                        chart.save_interactive()
+        finally:
+            close_figure(chart.fig)
+    
+    async def _plotly(self, name, chart, results):
+        """Crea un gráfico de Plotly y escribe a la vez su HTML y su PNG (kaleido)"""
+        logger.info(f"Generando: {chart.title}")
+        begin = time.perf_counter()
+        profiler = self._profiler(name)
+        try:
+            with profiler.phase('create'):
+                await self._stage('plotly', chart.create)
+            if chart.fig is None:
+                self._finish(results, name, profiler, begin, status='empty')
+                return
+            with profiler.phase('save'):
+                await asyncio.gather(self._stage('plotly', chart.save_html),
+                                     self._stage('plotly', chart.save_png))
+        except Exception as e:
+            self._finish(results, name, profiler, begin, error=e)
+        else:
+            # Sin kaleido falta el PNG: el HTML sí está y se informa como 'partial'
+            self._finish(results, name, profiler, begin, status='partial' if chart.warnings else 'ok',
+                         notes=chart.warnings)
+    
+    def _finish(self, results, name, profiler, begin, error=None, status='ok', notes=()):
+        """Registra el resultado (y el perfilado) de un gráfico"""
+        seconds = time.perf_counter() - begin
+        if error is None:
+            profiler.stop(status=status, notes=notes)
+            results[name] = BatchResult(name, 'partial' if status == 'partial' else 'ok', seconds=seconds)
+            results[name].notes.extend(notes)
+            return
+        message = str(error).splitlines()[0] if str(error) else type(error).__name__
+        profiler.stop(status='error', error=message)
+        logger.error(f"Error al generar {name}: {message}")
+        results[name] = BatchResult(name, 'error', seconds=seconds, error=message)
+
+
+def _draw_figure(chart, profiler):
+    """Agregados, figura y layout de un gráfico de matplotlib (en el hilo de dibujo)"""
+    logger.info(f"Generando: {chart.title}")
+    with profiler.phase('prepare'):
+        chart.prepare()
+    with theme_scope(chart.theme):
+        with profiler.phase('create'):
+            chart.create()
+        with text_layout(chart.fig):
+            with profiler.phase('customize'):
+                chart.customize()
+            if chart.fig:
+                with profiler.phase('layout'):
+                    chart.fig.tight_layout()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generación completa con etapas solapadas (asyncio)')
+    parser.add_argument('--charts', nargs='+', choices=list(CHARTS), default=None,
+                        help='Gráficos a generar (todos si se omite)')
+    parser.add_argument('--raw', nargs='+', type=Path, default=None,
+                        help='CSV crudos a limpiar y unir: archivos, carpetas de partes o patrones '
+                             '(se lee el siguiente mientras se limpia el actual)')
+    parser.add_argument('--data', type=Path, default=None, help='CSV limpio que se lee o se escribe')
+    parser.add_argument('--queue', type=int, default=ORCHESTRATOR_QUEUE_SIZE,
+                        help='Figuras dibujadas que pueden esperar a ser codificadas')
+    parser.add_argument('--encoders', type=int, default=ORCHESTRATOR_ENCODERS,
+                        help='Hilos que codifican y escriben las imágenes')
+    args = parser.parse_args(argv)
+    
+    orchestrator = BatchOrchestrator(args.data, queue_size=args.queue, encoders=args.encoders)
+    results = orchestrator.run(args.charts, raw=args.raw)
+    
+    for result in results:
+        detail = f"{result.seconds:.1f}s" if result.ok else result.error
+        if result.notes:
+            detail += f" ({'; '.join(result.notes)})"
+        logger.info(f"  {result.name:<30}{result.status:>8}  {detail}")
+    failed = sum(1 for result in results if not result.ok)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
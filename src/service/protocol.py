@@ -0,0 +1,74 @@
+"""
+📨 PROTOCOLO DEL DEMONIO DE RENDERIZADO
+======================================
+Mensajes entre el demonio (daemon.py) y el cliente (client.py) sobre un
+socket Unix local
+
+Cada mensaje es una cabecera JSON en una línea seguida de ``size`` bytes
+de cuerpo (la imagen, o JSON con los resultados):
+
+    {"op": "render", "chart": "06_pareto", "fmt": "png", "size": 0}\\n
+    {"ok": true, "content_type": "image/png", "size": 48213}\\n<48213 bytes>
+
+Este módulo solo usa la biblioteca estándar: el cliente lo importa sin
+cargar pandas ni matplotlib, y por eso arranca en milisegundos.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+SOCKET_ENV = 'SPOTIFY_RENDER_SOCKET'
+MAX_HEADER = 64 * 1024      # Bytes máximos de una cabecera
+
+
+def default_socket_path():
+    """
+    Ruta del socket del demonio
+    
+    Returns:
+        $SPOTIFY_RENDER_SOCKET o <tmp>/spotify-visualizer-<usuario>.sock
+    """
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return Path(tempfile.gettempdir()) / f'spotify-visualizer-{user}.sock'
+
+
+def send_message(stream, header, body=b''):
+    """
+    Escribe un mensaje (cabecera + cuerpo)
+    
+    Args:
+        stream: Fichero binario del socket (makefile('wb'))
+        header: Diccionario serializable a JSON
+        body: Bytes del cuerpo
+    """
+    header = dict(header, size=len(body))
+    stream.write(json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n')
+    if body:
+        stream.write(body)
+    stream.flush()
+
+
+def read_message(stream):
+    """
+    Lee un mensaje (cabecera + cuerpo)
+    
+    Args:
+        stream: Fichero binario del socket (makefile('rb'))
+    
+    Returns:
+        Tupla (cabecera, cuerpo) o (None, b'') si la conexión se cerró
+    """
+    line = stream.readline(MAX_HEADER + 1)
+    if not line:
+        return None, b''
+    if len(line) > MAX_HEADER or not line.endswith(b'\n'):
+        raise ValueError("Cabecera demasiado larga o incompleta")
+    header = json.loads(line.decode('utf-8'))
+    size = int(header.get('size', 0))
+    body = stream.read(size) if size else b''
+    if len(body) != size:
+        raise ConnectionError("Conexión cerrada a mitad de mensaje")
+    return header, body
@@ -0,0 +1,323 @@
+"""
+🏭 RENDERIZADO EN PROCESOS
+=========================
+Pool de procesos (o de hilos) que renderizan gráficos bajo demanda
+
+Cada proceso abre el dataset una sola vez (en el inicializador del pool)
+y después solo recibe el nombre del gráfico y el formato. Si existe el CSV
+limpio, los procesos abren su versión compartida (mmap) y no tienen cada
+uno su copia de las columnas numéricas. Los resultados
+se guardan en una RenderCache; si el archivo de datos cambia, el pool se
+reinicia y la caché se vacía.
+
+Con SERVER_EXECUTOR = 'thread' los gráficos se dibujan en hilos del
+propio proceso del servidor, sobre un único dataset: las figuras no usan
+el estado global de pyplot (visualizations/canvas.py), así que varios
+hilos pueden renderizar a la vez.
+"""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from ..config.settings import (
+    CLEAN_DATA_FILE,
+    RAW_DATA_FILE,
+    SERVER_WORKERS,
+    SERVER_EXECUTOR,
+    SERVER_DPI,
+    RENDER_CACHE_MAX_MB
+)
+from ..config.themes import get_theme
+from ..utils.logger import Logger
+from ..data.shared import ensure_shared
+from .cache import RenderCache, RenderedChart
+
+logger = Logger(__name__)
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf',
+    'html': 'text/html; charset=utf-8'
+}
+
+RENDER_TIMEOUT = 300    # Segundos máximos por gráfico
+
+EXECUTORS = ('process', 'thread')
+
+# Estado de cada proceso del pool (o del servidor, con hilos)
+_worker_data = None
+
+
+def load_dataset(source=None):
+    """
+    Carga el dataset limpio (o limpia los datos crudos si no existe)
+    
+    Args:
+        source: Ruta de un CSV limpio (usa CLEAN_DATA_FILE si es None)
+    
+    Returns:
+        SpotifyDataset listo para los gráficos
+    """
+    from ..data.dataset import SpotifyDataset
+    return SpotifyDataset.load(source, save_clean=False)
+
+
+def prepare_shared(source):
+    """
+    Prepara el dataset compartido (mmap) que abrirán los workers
+    
+    Args:
+        source: CSV limpio
+    
+    Returns:
+        Ruta (str) de la carpeta compartida o None si no es posible
+    """
+    source = Path(source)
+    if not source.exists():
+        return None
+    try:
+        return str(ensure_shared(source))
+    except Exception as e:
+        logger.warning(f"Sin dataset compartido, cada worker cargará el CSV: {e}")
+        return None
+
+
+def init_worker(source, shared_dir=None):
+    """
+    Prepara un proceso worker: backend sin ventanas y datos en memoria
+    
+    Es el inicializador del pool de procesos y también lo usan los workers
+    de los lotes (batch.py). Con ``shared_dir`` los workers abren el dataset
+    compartido (mmap) y comparten sus columnas numéricas en lugar de tener
+    cada uno su copia.
+    
+    Args:
+        source: CSV limpio
+        shared_dir: Carpeta del dataset compartido (None = cargar el CSV)
+    """
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot as plt
+    plt.switch_backend('Agg')
+    
+    from ..utils.logger import configure_logging
+    configure_logging(level='WARNING')
+    
+    _attach_data(source, shared_dir)
+    
+    # Importar los gráficos (seaborn, plotly...) antes de la primera petición
+    # y calcular los intermedios que comparten sobre el dataset completo
+    from ..visualizations import CHARTS
+    _worker_data.pipeline.run(CHARTS.values())
+
+
+def worker_dataset():
+    """
+    Dataset abierto en este proceso por init_worker (None si no se ha abierto)
+    
+    Returns:
+        SpotifyDataset
+    """
+    return _worker_data
+
+
+def _attach_data(source, shared_dir=None):
+    """Abre (mmap) o carga el dataset que usan los renders de este proceso"""
+    global _worker_data
+    
+    if shared_dir is not None:
+        from ..data.dataset import SpotifyDataset
+        _worker_data = SpotifyDataset.attach(shared_dir)
+    else:
+        _worker_data = load_dataset(source)
+
+
+def _ready():
+    """Tarea vacía: obliga a arrancar (e inicializar) un worker del pool"""
+    return os.getpid()
+
+
+def _render(name, fmt, dpi, plotlyjs_src, filters=None, theme=None):
+    """
+    Renderiza un gráfico dentro de un worker del pool (proceso o hilo)
+    
+    Returns:
+        Tupla (bytes, tipo MIME)
+    """
+    from ..visualizations import CHARTS
+    from ..visualizations.interactive import interactive_html
+    
+    chart = CHARTS[name](_worker_data.select(filters)).use_theme(theme)
+    if fmt == 'html':
+        page = interactive_html(chart.to_plotly(), plotlyjs_src, title=chart.title)
+        return page.encode('utf-8'), CONTENT_TYPES['html']
+    return chart.render(fmt, dpi=dpi), CONTENT_TYPES[fmt]
+
+
+class ChartRenderer:
+    """Renderiza gráficos en un pool de procesos (o hilos) con caché y deduplicación"""
+    
+    def __init__(self, source=None, workers=SERVER_WORKERS, cache_mb=RENDER_CACHE_MAX_MB,
+                 plotlyjs_src='/static/plotly.min.js', executor=SERVER_EXECUTOR):
+        """
+        Args:
+            source: CSV limpio a servir (usa CLEAN_DATA_FILE si es None)
+            workers: Número de procesos (o hilos) de renderizado
+            cache_mb: Tamaño máximo de la caché en MB
+            plotlyjs_src: URL del plotly.js para las páginas interactivas
+            executor: 'process' (un proceso por worker) o 'thread' (hilos del servidor)
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Ejecutor no soportado: {executor} (usa {' o '.join(EXECUTORS)})")
+        self.source = Path(source or CLEAN_DATA_FILE)
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.plotlyjs_src = plotlyjs_src
+        self.cache = RenderCache(int(cache_mb * 1024 ** 2))
+        self._pool = None
+        self._version = None
+        self._local_version = None
+        self._inflight = {}
+        self._lock = threading.Lock()
+    
+    def data_version(self):
+        """Identifica la versión de los datos (fecha y tamaño del archivo)"""
+        path = self.source if self.source.exists() else RAW_DATA_FILE
+        try:
+            stat = path.stat()
+            return (str(path), stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return (str(path), None, None)
+    
+    def _ensure_pool(self):
+        """Crea el pool (o lo reinicia si los datos cambiaron) y devuelve la versión"""
+        version = self.data_version()
+        with self._lock:
+            if self._pool is None or version != self._version:
+                if self._pool is not None:
+                    logger.info("Datos actualizados: reiniciando workers y vaciando caché")
+                    self._pool.shutdown(wait=False, cancel_futures=True)
+                    self.cache.clear()
+                self._pool = self._create_pool()
+                self._version = version
+                if self.executor == 'thread':
+                    self._local_version = version
+            return version
+    
+    def start(self):
+        """
+        Crea el pool y espera a que todos los workers estén listos
+        
+        Cada proceso importa las librerías y abre el dataset en su
+        inicializador; tras start() la primera petición ya no paga ese coste.
+        
+        Returns:
+            El propio renderer
+        """
+        self._ensure_pool()
+        if self.executor == 'process':
+            futures = [self._pool.submit(_ready) for _ in range(self.workers)]
+            for future in futures:
+                future.result(timeout=RENDER_TIMEOUT)
+        return self
+    
+    def local_dataset(self):
+        """
+        Dataset abierto en este proceso (búsquedas, comparaciones...)
+        
+        Con executor='thread' es el mismo que usan los renders; con
+        procesos se abre aparte (mmap del dataset compartido) y se vuelve a
+        abrir si el archivo de datos cambia.
+        
+        Returns:
+            SpotifyDataset
+        """
+        version = self._ensure_pool()
+        with self._lock:
+            if self._local_version != version:
+                _attach_data(str(self.source), self._shared_dir())
+                self._local_version = version
+            return _worker_data
+    
+    def _create_pool(self):
+        """Pool de procesos o, con executor='thread', hilos sobre los datos de este proceso"""
+        if self.executor == 'thread':
+            _attach_data(str(self.source), self._shared_dir())
+            return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='render')
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=(str(self.source), self._shared_dir())
+        )
+    
+    def _shared_dir(self):
+        """Prepara el dataset compartido de los workers (None si no es posible)"""
+        return prepare_shared(self.source)
+    
+    def get(self, name, fmt='png', dpi=SERVER_DPI, filters=None, theme=None):
+        """
+        Devuelve un gráfico renderizado (desde la caché si es posible)
+        
+        Peticiones simultáneas del mismo gráfico comparten un solo render.
+        
+        Args:
+            name: Clave del registro CHARTS
+            fmt: 'png', 'svg', 'pdf' o 'html'
+            dpi: Resolución de los formatos raster
+            filters: DataFilter a aplicar (None = todos los datos)
+            theme: Nombre del tema (None = DEFAULT_THEME)
+        
+        Returns:
+            RenderedChart
+        """
+        if fmt not in CONTENT_TYPES:
+            raise ValueError(f"Formato no soportado: {fmt}")
+        if filters is not None and filters.is_empty:
+            filters = None
+        theme = get_theme(theme).name
+        
+        version = self._ensure_pool()
+        key = (name, fmt, dpi if fmt == 'png' else None, filters.key() if filters else (), theme, version)
+        
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._pool.submit(_render, name, fmt, dpi, self.plotlyjs_src, filters, theme)
+                self._inflight[key] = future
+        
+        try:
+            body, content_type = future.result(timeout=RENDER_TIMEOUT)
+        finally:
+            if owner:
+                with self._lock:
+                    self._inflight.pop(key, None)
+        
+        entry = RenderedChart(body, content_type)
+        if owner:
+            self.cache.put(key, entry)
+        return entry
+    
+    def warm(self, names, fmt='png', dpi=SERVER_DPI):
+        """Lanza en segundo plano el renderizado de varios gráficos"""
+        for name in names:
+            threading.Thread(target=self._warm_one, args=(name, fmt, dpi), daemon=True).start()
+    
+    def _warm_one(self, name, fmt, dpi):
+        try:
+            self.get(name, fmt, dpi)
+        except Exception as e:
+            logger.warning(f"No se pudo precalcular {name}.{fmt}: {e}")
+    
+    def close(self):
+        """Detiene el pool de procesos (o de hilos)"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
@@ -0,0 +1,122 @@
+"""
+⚖️ PLANIFICACIÓN DE GRÁFICOS POR COSTE
+=====================================
+Ordena los gráficos de un lote según su coste estimado
+
+Los gráficos cuestan muy distinto (el Sankey con su exportación o el
+swarmplot tardan varias veces más que el Pareto). Si se reparten en el
+orden del menú, el más lento puede empezar el último y dejar al resto de
+workers parados esperándolo. Se estima el coste de cada gráfico y se
+reparten del más caro al más barato (LPT, Longest Processing Time first):
+cada worker libre toma el siguiente más caro.
+
+La estimación usa los registros de perfilado de ejecuciones anteriores
+(PROFILE_LOG_FILE): si hay tiempos con distinto número de filas se ajusta
+una recta tiempo = fijo + coste_por_fila * filas; si no, la mediana de
+los tiempos. Los gráficos sin historial toman la mediana del resto.
+"""
+import heapq
+from statistics import median
+
+from ..config.settings import BATCH_COST_HISTORY, BATCH_DEFAULT_COST
+from ..utils.profiling import load_profiles
+
+MIN_COST = 0.05     # Segundos mínimos estimados (un ajuste nunca da 0 o negativo)
+
+
+class CostModel:
+    """
+    Estima los segundos de cada gráfico a partir de ejecuciones anteriores
+    
+    Uso:
+        >>> model = CostModel()
+        >>> model.estimate('10_sankey', rows=20_000)
+    """
+    
+    def __init__(self, records=None, history=BATCH_COST_HISTORY, default=BATCH_DEFAULT_COST):
+        """
+        Args:
+            records: Registros de perfilado (lee PROFILE_LOG_FILE si es None)
+            history: Ejecuciones más recientes de cada gráfico que se tienen en cuenta
+            default: Segundos estimados si no hay ningún historial
+        """
+        records = load_profiles() if records is None else records
+        self.samples = {}       # gráfico -> [(filas, segundos), ...] del más antiguo al más reciente
+        for record in records:
+            if record.get('status') != 'ok' or not record.get('total_s'):
+                continue
+            self.samples.setdefault(record['chart'], []).append((record.get('rows'), record['total_s']))
+        if history:
+            self.samples = {chart: samples[-history:] for chart, samples in self.samples.items()}
+        self.default = default
+    
+    def known(self, chart):
+        """True si hay tiempos registrados del gráfico"""
+        return chart in self.samples
+    
+    def estimate(self, chart, rows=None):
+        """
+        Segundos estimados de un gráfico
+        
+        Args:
+            chart: Clave del registro CHARTS
+            rows: Filas de entrada (None = no escalar por tamaño)
+        
+        Returns:
+            Segundos estimados
+        """
+        samples = self.samples.get(chart)
+        if not samples:
+            others = [self.estimate(name, rows) for name in self.samples]
+            return median(others) if others else self.default
+        
+        sized = [(n, s) for n, s in samples if n]
+        if rows and len({n for n, _ in sized}) >= 2:
+            return max(MIN_COST, _linear_fit(sized, rows))
+        return max(MIN_COST, median(s for _, s in samples))
+    
+    def plan(self, charts, workers=1, rows=None, longest_first=True):
+        """
+        Ordena los gráficos del más caro al más barato
+        
+        Args:
+            charts: Claves del registro CHARTS
+            workers: Procesos que los generarán en paralelo
+            rows: Filas de entrada
+            longest_first: Si False, se mantiene el orden recibido (solo estima)
+        
+        Returns:
+            Tupla (orden de envío, {gráfico: segundos estimados}, duración
+            total estimada del lote con ``workers`` procesos)
+        """
+        costs = {chart: self.estimate(chart, rows) for chart in charts}
+        order = sorted(costs, key=lambda chart: costs[chart], reverse=True) if longest_first else list(charts)
+        return order, costs, makespan([costs[chart] for chart in order], workers)
+
+
+def _linear_fit(samples, rows):
+    """Mínimos cuadrados de segundos frente a filas, evaluado en ``rows``"""
+    mean_n = sum(n for n, _ in samples) / len(samples)
+    mean_s = sum(s for _, s in samples) / len(samples)
+    var = sum((n - mean_n) ** 2 for n, _ in samples)
+    slope = sum((n - mean_n) * (s - mean_s) for n, s in samples) / var
+    slope = max(slope, 0.0)         # Más filas nunca abarata un gráfico
+    return mean_s + slope * (rows - mean_n)
+
+
+def makespan(costs, workers):
+    """
+    Duración de un lote repartido en orden: cada tarea va al worker que
+    antes queda libre
+    
+    Args:
+        costs: Segundos de cada tarea, en el orden de envío
+        workers: Procesos en paralelo
+    
+    Returns:
+        Segundos hasta que termina la última tarea
+    """
+    finish = [0.0] * max(1, min(workers, len(costs)))
+    for cost in costs:
+        heapq.heapreplace(finish, finish[0] + cost)
+    return max(finish) if costs else 0.0
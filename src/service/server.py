@@ -0,0 +1,223 @@
+"""
+🌐 SERVIDOR HTTP DEL DASHBOARD
+=============================
+Sirve el dashboard y renderiza los gráficos bajo demanda
+
+Rutas:
+    /                       Dashboard con todos los gráficos (acepta los mismos filtros)
+    /charts/<nombre>.<fmt>  Gráfico renderizado (png, svg, pdf, html)
+                            ?year_min=&year_max=&artist=&genre=&explicit=
+                            &album_type=&popularity_min=&popularity_max=
+                            &theme=spotify|spotify_dark
+    /static/plotly.min.js   plotly.js compartido por las páginas interactivas
+    /api/charts             Lista de gráficos disponibles (JSON)
+    /api/stats              Estadísticas de la caché (JSON)
+"""
+import html
+import json
+import re
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from ..config.settings import SERVER_HOST, SERVER_PORT, SERVER_DPI
+from ..config.themes import THEMES
+from ..data.filters import DataFilter
+from ..utils.logger import Logger
+from ..visualizations import CHARTS
+from ..visualizations.interactive import plotlyjs_bundle
+from .renderer import ChartRenderer, CONTENT_TYPES
+
+logger = Logger(__name__)
+
+CHART_PATH = re.compile(r'^/charts/(?P<name>[\w-]+)\.(?P<fmt>[a-z]+)$')
+
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>Spotify Data Visualizer - Dashboard</title>
+<style>
+    body {{ font-family: 'Segoe UI', Tahoma, sans-serif; margin: 0; background: #f4f4f4; color: #191414; }}
+    header {{ background: linear-gradient(135deg, #1DB954 0%, #1ed760 100%); color: white; padding: 24px 40px; }}
+    main {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(520px, 1fr)); gap: 20px; padding: 24px; }}
+    .card {{ background: white; border-radius: 12px; box-shadow: 0 4px 16px rgba(0,0,0,0.1); padding: 16px; }}
+    .card h2 {{ font-size: 1.1em; margin: 0 0 10px; }}
+    .card img {{ width: 100%; min-height: 120px; background: #fafafa; }}
+    .card a {{ color: #1DB954; margin-right: 12px; }}
+</style>
+</head>
+<body>
+<header>
+    <h1>🎵 Spotify Data Visualizer</h1>
+    <p>Gráficos renderizados bajo demanda con los datos actuales</p>
+</header>
+<main>
+{cards}
+</main>
+<script>
+// Los filtros de la URL del dashboard (?year_min=2018&explicit=false) se aplican a todos los gráficos
+if (location.search) {{
+    document.querySelectorAll('.card img').forEach(img => img.src += location.search);
+    document.querySelectorAll('.card a').forEach(a => a.href += location.search);
+}}
+</script>
+</body>
+</html>
+"""
+
+CARD_TEMPLATE = """<section class="card">
+    <h2>{title}</h2>
+    <a href="/charts/{name}.html"><img loading="lazy" src="/charts/{name}.png" alt="{title}"></a>
+    <p><a href="/charts/{name}.html">Interactivo</a><a href="/charts/{name}.svg">SVG</a><a href="/charts/{name}.png">PNG</a></p>
+</section>"""
+
+
+def chart_title(name):
+    """'06_pareto' -> '06 · Pareto'"""
+    number, _, rest = name.partition('_')
+    return f"{number} · {rest.replace('_', ' ').capitalize()}"
+
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    """Manejador de peticiones (una instancia por petición, en su propio hilo)"""
+    
+    server_version = 'SpotifyDashboard/1.0'
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path
+        
+        try:
+            if path in ('/', '/index.html'):
+                self._send(self.server.dashboard, 'text/html; charset=utf-8')
+            elif path == '/static/plotly.min.js':
+                self._send(self.server.plotlyjs, 'application/javascript',
+                           cache='public, max-age=86400')
+            elif path == '/api/charts':
+                self._send_json([
+                    {'name': name, 'title': chart_title(name), 'formats': sorted(CONTENT_TYPES)}
+                    for name in CHARTS
+                ])
+            elif path == '/api/stats':
+                self._send_json(self.server.renderer.cache.stats())
+            elif CHART_PATH.match(path):
+                match = CHART_PATH.match(path)
+                self._send_chart(match['name'], match['fmt'], parse_qs(url.query))
+            else:
+                self.send_error(HTTPStatus.NOT_FOUND)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+    
+    def _send_chart(self, name, fmt, query):
+        """Responde con un gráfico de la caché o recién renderizado"""
+        if name not in CHARTS:
+            self.send_error(HTTPStatus.NOT_FOUND, f"Gráfico desconocido: {name}")
+            return
+        if fmt not in CONTENT_TYPES:
+            self.send_error(HTTPStatus.BAD_REQUEST, f"Formato no soportado: {fmt}")
+            return
+        
+        try:
+            dpi = int(query.get('dpi', [SERVER_DPI])[0])
+        except ValueError:
+            self.send_error(HTTPStatus.BAD_REQUEST, "dpi debe ser un número")
+            return
+        dpi = min(max(dpi, 30), 600)
+        
+        try:
+            filters = DataFilter.from_dict(query)
+        except ValueError:
+            self.send_error(HTTPStatus.BAD_REQUEST, "Filtro inválido: los rangos deben ser números")
+            return
+        
+        theme = query.get('theme', [None])[0] or None
+        if theme is not None and theme not in THEMES:
+            self.send_error(HTTPStatus.BAD_REQUEST, f"Tema desconocido: {theme}")
+            return
+        
+        try:
+            entry = self.server.renderer.get(name, fmt, dpi, filters, theme=theme)
+        except Exception as e:
+            logger.error(f"Error al renderizar {name}.{fmt}: {e}")
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e).splitlines()[0] if str(e) else None)
+            return
+        
+        if self.headers.get('If-None-Match') == entry.etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', entry.etag)
+            self.end_headers()
+            return
+        
+        self._send(entry.body, entry.content_type, etag=entry.etag)
+    
+    def _send(self, body, content_type, etag=None, cache='no-cache'):
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', cache)
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_json(self, payload):
+        self._send(json.dumps(payload, ensure_ascii=False).encode('utf-8'), 'application/json')
+    
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class DashboardServer(ThreadingHTTPServer):
+    """Servidor HTTP con hilos por petición y un ChartRenderer compartido"""
+    
+    daemon_threads = True
+    
+    def __init__(self, host=SERVER_HOST, port=SERVER_PORT, renderer=None):
+        """
+        Args:
+            host: Dirección de escucha
+            port: Puerto
+            renderer: ChartRenderer (se crea uno por defecto si es None)
+        """
+        super().__init__((host, port), DashboardHandler)
+        self.renderer = renderer or ChartRenderer()
+        self.plotlyjs = plotlyjs_bundle().read_bytes()
+        self.dashboard = DASHBOARD_TEMPLATE.format(cards='\n'.join(
+            CARD_TEMPLATE.format(name=name, title=html.escape(chart_title(name)))
+            for name in CHARTS
+        )).encode('utf-8')
+    
+    def server_close(self):
+        super().server_close()
+        self.renderer.close()
+
+
+def serve(host=SERVER_HOST, port=SERVER_PORT, source=None, workers=None, warm=True, executor=None):
+    """
+    Inicia el servidor del dashboard (bloquea hasta Ctrl+C)
+    
+    Args:
+        host: Dirección de escucha
+        port: Puerto
+        source: CSV limpio a servir (usa CLEAN_DATA_FILE si es None)
+        workers: Procesos de renderizado (usa SERVER_WORKERS si es None)
+        warm: Si renderizar los PNG al arrancar para llenar la caché
+        executor: 'process' o 'thread' (usa SERVER_EXECUTOR si es None)
+    """
+    kwargs = {'source': source}
+    if workers:
+        kwargs['workers'] = workers
+    if executor:
+        kwargs['executor'] = executor
+    renderer = ChartRenderer(**kwargs)
+    
+    with DashboardServer(host, port, renderer) as server:
+        logger.success(f"Dashboard disponible en http://{host}:{server.server_address[1]}/")
+        if warm:
+            renderer.warm([name for name in CHARTS if name != '10_sankey'])
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Servidor detenido")
@@ -2,7 +2,7 @@
 Módulo de utilidades
 """
 
-from .logger import Logger
+from .logger import Logger, configure_logging, flush_logs
 from .helpers import (
     format_number,
     calculate_percentage,
@@ -14,9 +14,12 @@ from .helpers import (
     compare_artists
 )
 from .text_utils import truncate_text, wrap_text, clean_label
+from .profiling import ChartProfiler, load_profiles, summarize_profiles, current_rss_mb
 
 __all__ = [
     'Logger',
+    'configure_logging',
+    'flush_logs',
     'format_number',
     'calculate_percentage',
     'get_top_n',
@@ -27,5 +30,9 @@ __all__ = [
     'wrap_text',
     'clean_label',
     'search_songs',
-    'compare_artists'
+    'compare_artists',
+    'ChartProfiler',
+    'load_profiles',
+    'summarize_profiles',
+    'current_rss_mb'
 ]
\ No newline at end of file
@@ -122,7 +122,7 @@ def search_songs(data, query):
     Busca canciones por nombre
     
     Args:
-        data: DataFrame con datos de Spotify
+        data: SpotifyDataset o DataFrame con datos de Spotify
         query: Texto a buscar en el nombre de la canción
     
     Returns:
@@ -133,13 +133,17 @@ def search_songs(data, query):
         >>> print(results.head())
     """
     import pandas as pd
+    from ..data.dataset import as_dataset
+    from ..data.text import contains_text
     
     if not query or query.strip() == "":
         return pd.DataFrame()
     
-    # Buscar en track_name (case insensitive)
+    data = as_dataset(data).frame
+    
+    # Buscar en track_name (case insensitive, una vez por título distinto)
     results = data[
-        data['track_name'].str.contains(query, case=False, na=False)
+        contains_text(data['track_name'], query, case=False)
     ]
     
     # Seleccionar columnas relevantes
@@ -166,7 +170,7 @@ def compare_artists(data, artist1, artist2):
     Compara dos artistas en múltiples métricas
     
     Args:
-        data: DataFrame con datos de Spotify
+        data: SpotifyDataset o DataFrame con datos de Spotify
         artist1: Nombre del primer artista
         artist2: Nombre del segundo artista
     
@@ -179,14 +183,25 @@ def compare_artists(data, artist1, artist2):
     """
     import pandas as pd
     
-    # Buscar artistas (case insensitive)
-    data1 = data[data['artist_name'].str.lower() == artist1.lower()]
-    data2 = data[data['artist_name'].str.lower() == artist2.lower()]
+    from ..data.dataset import as_dataset
+    
+    # Buscar artistas (case insensitive, tabla hash del índice)
+    dataset = as_dataset(data)
+    rows1 = dataset.index.artist_rows(artist1)
+    rows2 = dataset.index.artist_rows(artist2)
+    data1 = dataset.frame.iloc[rows1]
+    data2 = dataset.frame.iloc[rows2]
     
     # Verificar si existen
     if len(data1) == 0 or len(data2) == 0:
         return None
     
+    # Géneros ya interpretados (índice de géneros)
+    def genres(rows):
+        if 'artist_genres' not in dataset.columns:
+            return 'N/A'
+        return ', '.join(dataset.index.genres().row_genres(rows[0])) or 'N/A'
+    
     # Calcular métricas
     comparison = pd.DataFrame({
         'Métrica': [
@@ -209,7 +224,7 @@ def compare_artists(data, artist1, artist2):
             data1['album_name'].nunique(),
             data1['explicit'].sum(),
             f"{(data1['explicit'].sum() / len(data1) * 100):.1f}%",
-            data1['artist_genres'].iloc[0][:50] if 'artist_genres' in data1.columns else 'N/A'
+            genres(rows1)
         ],
         artist2: [
             len(data2),
@@ -220,7 +235,7 @@ def compare_artists(data, artist1, artist2):
             data2['album_name'].nunique(),
             data2['explicit'].sum(),
             f"{(data2['explicit'].sum() / len(data2) * 100):.1f}%",
-            data2['artist_genres'].iloc[0][:50] if 'artist_genres' in data2.columns else 'N/A'
+            genres(rows2)
         ]
     })
     
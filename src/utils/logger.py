@@ -2,39 +2,322 @@
 📝 SISTEMA DE LOGGING CON COLORES
 =================================
 Logger personalizado con timestamps y colores para mejor legibilidad
+
+Todas las instancias de Logger comparten un único backend con:
+- Niveles (DEBUG, INFO, SUCCESS, WARNING, ERROR) para silenciar el detalle
+- Salidas (sinks): consola con colores y archivo JSON Lines con tiempos
+- Escritura asíncrona opcional mediante una cola y un hilo escritor,
+  para que registrar en bucles intensivos no bloquee el renderizado
 """
+import atexit
+import json
+import os
+import queue
+import threading
+import time
 from datetime import datetime
 from colorama import Fore, Style, init
+from ..config.settings import LOG_LEVEL, LOG_JSON_FILE, LOG_ASYNC
 
 # Inicializar colorama para Windows
 init(autoreset=True)
 
+# === NIVELES ===
+DEBUG = 10
+INFO = 20
+SUCCESS = 25
+WARNING = 30
+ERROR = 40
+
+LEVELS = {
+    'DEBUG': DEBUG,
+    'INFO': INFO,
+    'SUCCESS': SUCCESS,
+    'WARNING': WARNING,
+    'ERROR': ERROR
+}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+_PROCESS_START = time.perf_counter()
+
+
+def _parse_level(level):
+    """Acepta un nombre ('INFO') o un número (20)"""
+    if isinstance(level, str):
+        return LEVELS[level.upper()]
+    return int(level)
+
+
+class ConsoleSink:
+    """Salida por consola con colores (formato clásico del sistema)"""
+    
+    STYLES = {
+        DEBUG: (Fore.WHITE, '🔹'),
+        INFO: (Fore.CYAN, 'ℹ️ '),
+        SUCCESS: (Fore.GREEN, '✅'),
+        WARNING: (Fore.YELLOW, '⚠️ '),
+        ERROR: (Fore.RED, '❌')
+    }
+    
+    def emit(self, record):
+        """Imprime un registro"""
+        level, message, wall, _, _, _ = record
+        color, icon = self.STYLES.get(level, (Fore.WHITE, '•'))
+        timestamp = datetime.fromtimestamp(wall).strftime("%H:%M:%S")
+        print(f"{color}{icon} [{timestamp}] {message}{Style.RESET_ALL}")
+    
+    def emit_header(self, message):
+        """Imprime un encabezado (magenta)"""
+        print(f"\n{Fore.MAGENTA}{'='*60}")
+        print(f"{message}")
+        print(f"{'='*60}{Style.RESET_ALL}\n")
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        pass
+
+
+class JsonLinesSink:
+    """Salida a archivo JSON Lines con campos de tiempo"""
+    
+    def __init__(self, filepath):
+        """
+        Args:
+            filepath: Ruta del archivo .jsonl (se añade al final)
+        """
+        self.filepath = filepath
+        os.makedirs(os.path.dirname(os.fspath(filepath)) or '.', exist_ok=True)
+        self._file = open(filepath, 'a', encoding='utf-8')
+    
+    def emit(self, record):
+        """Escribe un registro como una línea JSON (nada si ya se cerró)"""
+        if self._file.closed:
+            return
+        level, message, wall, perf, name, thread = record
+        self._file.write(json.dumps({
+            'ts': round(wall, 6),
+            'time': datetime.fromtimestamp(wall).isoformat(timespec='milliseconds'),
+            'elapsed_s': round(perf - _PROCESS_START, 6),
+            'level': LEVEL_NAMES.get(level, str(level)),
+            'logger': name,
+            'thread': thread,
+            'message': str(message)
+        }, ensure_ascii=False) + '\n')
+    
+    def emit_header(self, message):
+        """Registra el encabezado como un mensaje INFO"""
+        self.emit((INFO, f"== {message} ==", time.time(), time.perf_counter(), 'header', None))
+    
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+    
+    def close(self):
+        self._file.close()
+
+
+class LogBackend:
+    """
+    Backend compartido: filtra por nivel y reparte los registros a las salidas
+    
+    En modo asíncrono el hilo que registra solo construye una tupla y la
+    encola; el formateo (fecha, colores, JSON) y la escritura se hacen en
+    un hilo escritor dedicado. La cola se lee y se retira bajo
+    ``_queue_lock``: lo que se encola antes de shutdown() se escribe y lo
+    que llega después va por el camino síncrono. Las escrituras en las
+    salidas (de cualquier hilo) van siempre bajo ``_lock``.
+    """
+    
+    def __init__(self):
+        self.level = INFO
+        self.sinks = [ConsoleSink()]
+        self._queue = None
+        self._writer = None
+        self._lock = threading.Lock()          # Escritura en las salidas
+        self._queue_lock = threading.Lock()    # Cola y hilo escritor actuales
+    
+    def configure(self, level=None, json_file=None, async_mode=None, console=True):
+        """
+        Configura nivel, salidas y modo de escritura
+        
+        Args:
+            level: Nivel mínimo ('DEBUG', 'INFO', 'WARNING', ...)
+            json_file: Ruta de un archivo JSON Lines (None = sin archivo)
+            async_mode: True para escribir desde un hilo con cola
+            console: Si mantener la salida por consola con colores
+        """
+        self.shutdown()
+        
+        if level is not None:
+            self.level = _parse_level(level)
+        
+        sinks = [ConsoleSink()] if console else []
+        if json_file:
+            sinks.append(JsonLinesSink(json_file))
+        self.sinks = sinks
+        
+        if async_mode:
+            q = queue.SimpleQueue()
+            writer = threading.Thread(target=self._run_writer, args=(q,), name='log-writer', daemon=True)
+            writer.start()
+            with self._queue_lock:
+                self._queue, self._writer = q, writer
+    
+    def log(self, level, message, name):
+        """Registra un mensaje si supera el nivel configurado"""
+        if level < self.level:
+            return
+        record = (level, message, time.time(), time.perf_counter(), name, threading.current_thread().name)
+        with self._queue_lock:
+            q = self._queue
+            if q is not None:
+                q.put(record)
+                return
+        with self._lock:
+            self._dispatch(record)
+    
+    def header(self, message):
+        """Registra un encabezado (nivel INFO)"""
+        if INFO < self.level:
+            return
+        with self._queue_lock:
+            q = self._queue
+            if q is not None:
+                q.put(('header', message))
+                return
+        with self._lock:
+            self._dispatch_header(message)
+    
+    def _dispatch(self, record):
+        for sink in self.sinks:
+            sink.emit(record)
+        if record[0] >= ERROR:
+            self._flush_sinks()
+    
+    def _dispatch_header(self, message):
+        for sink in self.sinks:
+            sink.emit_header(message)
+    
+    def _flush_sinks(self):
+        for sink in self.sinks:
+            sink.flush()
+    
+    def _run_writer(self, q):
+        """Bucle del hilo escritor: vacía la cola por lotes"""
+        while True:
+            item = q.get()
+            batch = [item]
+            try:
+                while len(batch) < 1000:
+                    batch.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            
+            with self._lock:
+                for item in batch:
+                    if item is None:
+                        self._flush_sinks()
+                        return
+                    if isinstance(item, threading.Event):
+                        self._flush_sinks()
+                        item.set()
+                    elif item[0] == 'header':
+                        self._dispatch_header(item[1])
+                    else:
+                        self._dispatch(item)
+                self._flush_sinks()
+    
+    def flush(self, timeout=5.0):
+        """Espera a que se escriban los registros pendientes"""
+        with self._queue_lock:
+            q, writer = self._queue, self._writer
+            if q is not None and writer.is_alive():
+                done = threading.Event()
+                q.put(done)
+        if q is None or not writer.is_alive():
+            with self._lock:
+                self._flush_sinks()
+            return
+        done.wait(timeout)
+    
+    def shutdown(self):
+        """Detiene el hilo escritor (si existe) y cierra las salidas"""
+        with self._queue_lock:
+            q, writer = self._queue, self._writer
+            self._queue = self._writer = None
+        if q is not None:
+            # Nadie más encola en q: todo lo anterior al None se escribe
+            q.put(None)
+            writer.join(timeout=5.0)
+        with self._lock:
+            for sink in self.sinks:
+                sink.flush()
+                if not isinstance(sink, ConsoleSink):
+                    sink.close()
+
+
+_backend = LogBackend()
+_backend.configure(level=LOG_LEVEL, json_file=LOG_JSON_FILE, async_mode=LOG_ASYNC)
+atexit.register(_backend.shutdown)
+
+
+def configure_logging(level=None, json_file=None, async_mode=None, console=True):
+    """
+    Configura el backend de logging compartido por todos los Logger
+    
+    Args:
+        level: Nivel mínimo ('DEBUG', 'INFO', 'SUCCESS', 'WARNING', 'ERROR')
+        json_file: Ruta de un archivo JSON Lines con campos de tiempo
+        async_mode: True para escribir en segundo plano (ideal para lotes)
+        console: Si mantener la salida por consola con colores
+    
+    Ejemplo:
+        >>> configure_logging(level='WARNING', json_file='output/logs/batch.jsonl', async_mode=True)
+    """
+    _backend.configure(level=level, json_file=json_file, async_mode=async_mode, console=console)
+
+
+def flush_logs():
+    """Espera a que el escritor asíncrono vacíe la cola"""
+    _backend.flush()
+
+
 class Logger:
     """Sistema de logging con colores y timestamps"""
     
-    @staticmethod
-    def _timestamp():
-        """Retorna timestamp actual formateado"""
-        return datetime.now().strftime("%H:%M:%S")
+    def __init__(self, name='spotify'):
+        """
+        Args:
+            name: Nombre del módulo que registra (aparece en el archivo JSON)
+        """
+        self.name = name
+    
+    def is_enabled(self, level):
+        """Indica si un nivel se registraría (para evitar formatear mensajes caros)"""
+        return _parse_level(level) >= _backend.level
+    
+    def debug(self, message):
+        """Log de depuración (blanco)"""
+        _backend.log(DEBUG, message, self.name)
     
     def info(self, message):
         """Log de información (azul)"""
-        print(f"{Fore.CYAN}ℹ️  [{self._timestamp()}] {message}{Style.RESET_ALL}")
+        _backend.log(INFO, message, self.name)
     
     def success(self, message):
         """Log de éxito (verde)"""
-        print(f"{Fore.GREEN}✅ [{self._timestamp()}] {message}{Style.RESET_ALL}")
+        _backend.log(SUCCESS, message, self.name)
     
     def warning(self, message):
         """Log de advertencia (amarillo)"""
-        print(f"{Fore.YELLOW}⚠️  [{self._timestamp()}] {message}{Style.RESET_ALL}")
+        _backend.log(WARNING, message, self.name)
     
     def error(self, message):
         """Log de error (rojo)"""
-        print(f"{Fore.RED}❌ [{self._timestamp()}] {message}{Style.RESET_ALL}")
+        _backend.log(ERROR, message, self.name)
     
     def header(self, message):
         """Log de encabezado (magenta)"""
-        print(f"\n{Fore.MAGENTA}{'='*60}")
-        print(f"{message}")
-        print(f"{'='*60}{Style.RESET_ALL}\n")
\ No newline at end of file
+        _backend.header(message)
@@ -0,0 +1,247 @@
+"""
+⏱️ PERFILADO DE GRÁFICOS
+=======================
+Mide el tiempo de cada fase de generación y, si se pide, la memoria pico por gráfico
+
+tracemalloc es global al proceso (start, reset_peak y stop afectan a todos
+los hilos), así que la memoria solo se mide desde el hilo principal; en
+hilos de renderizado el registro lleva peak_memory_mb = None.
+"""
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from ..config.settings import (
+    PROFILING_ENABLED,
+    PROFILE_MEMORY,
+    PROFILE_CPROFILE,
+    PROFILING_DIR,
+    PROFILE_LOG_FILE
+)
+
+
+class ChartProfiler:
+    """
+    Registra tiempos por fase (create, customize, layout, save, show) y,
+    opcionalmente, el delta de memoria pico y un volcado de cProfile
+    
+    Cada gráfico produce un registro que se añade como una línea JSON a
+    ``PROFILE_LOG_FILE``.
+    """
+    
+    def __init__(self, chart, rows=None, enabled=None, memory=None, cprofile=None):
+        """
+        Args:
+            chart: Nombre del gráfico (se usa el nombre del archivo de salida)
+            rows: Número de filas de entrada (para comparar ejecuciones)
+            enabled: Activa el registro (usa PROFILING_ENABLED si es None)
+            memory: Mide memoria pico con tracemalloc (usa PROFILE_MEMORY si es None;
+                siempre desactivado fuera del hilo principal)
+            cprofile: Guarda un volcado .prof (usa PROFILE_CPROFILE si es None)
+        """
+        self.chart = chart
+        self.rows = rows
+        self.enabled = PROFILING_ENABLED if enabled is None else enabled
+        self.memory = (self.enabled and (PROFILE_MEMORY if memory is None else memory)
+                       and threading.current_thread() is threading.main_thread())
+        self.cprofile = self.enabled and (PROFILE_CPROFILE if cprofile is None else cprofile)
+        self.phases = {}
+        self.record = None
+        self._start = None
+        self._mem_start = 0
+        self._owns_tracemalloc = False
+        self._profiler = None
+    
+    def start(self):
+        """Inicia la medición del gráfico"""
+        if not self.enabled:
+            return self
+        
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._mem_start = tracemalloc.get_traced_memory()[0]
+        
+        if self.cprofile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        
+        self._start = time.perf_counter()
+        return self
+    
+    @contextmanager
+    def phase(self, name):
+        """
+        Mide la duración de una fase
+        
+        Args:
+            name: Nombre de la fase (create, customize, layout, save, show...)
+        """
+        if not self.enabled:
+            yield
+            return
+        
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - t0)
+    
+    def stop(self, status='ok', error=None, notes=None):
+        """
+        Finaliza la medición y escribe el registro
+        
+        Args:
+            status: 'ok', 'partial' (faltan salidas), 'empty' o 'error'
+            error: Mensaje de error (opcional)
+            notes: Avisos del gráfico, p. ej. archivos que no se escribieron (opcional)
+        
+        Returns:
+            Diccionario con el registro del gráfico (o None si está desactivado)
+        """
+        if not self.enabled or self._start is None:
+            return None
+        
+        total = time.perf_counter() - self._start
+        
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(PROFILING_DIR / f"{self.chart}.prof")
+            self._profiler = None
+        
+        peak_mb = None
+        if self.memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            peak_mb = round(max(peak - self._mem_start, 0) / 1024 ** 2, 2)
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+                self._owns_tracemalloc = False
+        
+        self.record = {
+            'chart': self.chart,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'rows': self.rows,
+            'status': status,
+            'total_s': round(total, 4),
+            'phases': {name: round(secs, 4) for name, secs in self.phases.items()},
+            'peak_memory_mb': peak_mb
+        }
+        if error:
+            self.record['error'] = str(error)
+        if notes:
+            self.record['notes'] = list(notes)
+        
+        self._write(self.record)
+        self._start = None
+        return self.record
+    
+    @staticmethod
+    def _write(record):
+        """Añade el registro como una línea JSON"""
+        try:
+            with open(PROFILE_LOG_FILE, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError:
+            pass
+
+
+def current_rss_mb(pid=None):
+    """
+    Memoria residente (RSS) actual de un proceso en MB
+    
+    Args:
+        pid: Proceso a medir (None = el actual)
+    
+    Returns:
+        MB o None si el sistema no permite medirla. En Linux se lee
+        /proc/<pid>/statm (valor actual); en otros Unix, solo para el
+        proceso actual, se usa el pico de getrusage.
+    """
+    try:
+        with open(f"/proc/{pid or 'self'}/statm", encoding='ascii') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if pid is not None and pid != os.getpid():
+        return None
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+def load_profiles(filepath=None):
+    """
+    Lee los registros de perfilado guardados
+    
+    Args:
+        filepath: Ruta del archivo JSONL (usa PROFILE_LOG_FILE si es None)
+    
+    Returns:
+        Lista de diccionarios (uno por gráfico generado)
+    """
+    filepath = filepath or PROFILE_LOG_FILE
+    records = []
+    
+    try:
+        with open(filepath, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+    except FileNotFoundError:
+        pass
+    
+    return records
+
+
+def summarize_profiles(records=None):
+    """
+    Resume los registros por gráfico, del más lento al más rápido
+    
+    Args:
+        records: Lista de registros (lee PROFILE_LOG_FILE si es None)
+    
+    Returns:
+        Lista de diccionarios con ejecuciones, tiempo medio por fase y
+        memoria pico máxima de cada gráfico
+    """
+    records = load_profiles() if records is None else records
+    charts = {}
+    
+    for record in records:
+        if record.get('status') != 'ok':
+            continue
+        entry = charts.setdefault(record['chart'], {
+            'chart': record['chart'], 'runs': 0, 'total_s': 0.0,
+            'phases': {}, 'peak_memory_mb': None
+        })
+        entry['runs'] += 1
+        entry['total_s'] += record.get('total_s', 0.0)
+        for phase, secs in record.get('phases', {}).items():
+            entry['phases'][phase] = entry['phases'].get(phase, 0.0) + secs
+        peak = record.get('peak_memory_mb')
+        if peak is not None:
+            entry['peak_memory_mb'] = max(entry['peak_memory_mb'] or 0.0, peak)
+    
+    summary = []
+    for entry in charts.values():
+        runs = entry['runs']
+        entry['total_s'] = round(entry['total_s'] / runs, 4)
+        entry['phases'] = {p: round(s / runs, 4) for p, s in entry['phases'].items()}
+        summary.append(entry)
+    
+    return sorted(summary, key=lambda e: e['total_s'], reverse=True)
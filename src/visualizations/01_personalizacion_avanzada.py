@@ -16,9 +16,9 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
+import plotly.graph_objects as go
 from .base import BasePlot
 from ..config.colors import SPOTIFY
 
@@ -32,23 +32,30 @@ class PersonalizacionAvanzada(BasePlot):
             figsize=(14, 8)
         )
     
+    def aggregate(self):
+        """Top 15 artistas únicos por popularidad"""
+        
+        # Popularidad máxima por artista (top 15 sin ordenar a todos los artistas)
+        artist_popularity = (self.dataset.top_by('artist_name', 'artist_popularity', 15)
+                            .reset_index())
+        
+        return {
+            'artists': artist_popularity,
+            'mean': artist_popularity['artist_popularity'].mean()
+        }
+    
     def create(self):
         """Crea el gráfico de personalización avanzada"""
         
         # === PREPARAR DATOS: Top 15 artistas únicos ===
         
-        # Agrupar por artista y tomar la popularidad máxima
-        artist_popularity = (self.data
-                            .groupby('artist_name')['artist_popularity']
-                            .max()
-                            .reset_index()
-                            .nlargest(15, 'artist_popularity')
-                            .reset_index(drop=True))
+        agg = self.prepare()
+        artist_popularity = agg['artists']
         
         print(f"📊 Mostrando {len(artist_popularity)} artistas")  # Debug
         
         # Crear figura
-        self.fig, ax = plt.subplots(figsize=self.figsize)
+        self.fig, ax = self.subplots(figsize=self.figsize)
         
         # Crear paleta de colores degradada
         colors = sns.color_palette('viridis', len(artist_popularity))
@@ -157,7 +164,7 @@ class PersonalizacionAvanzada(BasePlot):
         
         # === LÍNEA DE REFERENCIA (PROMEDIO) ===
         
-        promedio = artist_popularity['artist_popularity'].mean()
+        promedio = agg['mean']
         ax.axhline(
             y=promedio,
             color='red',
@@ -217,6 +224,51 @@ class PersonalizacionAvanzada(BasePlot):
         # === AJUSTE FINAL ===
         
         self.fig.tight_layout()
+    
+    def to_plotly(self):
+        """Versión interactiva: barras con valores, promedio y anotación"""
+        agg = self.prepare()
+        artists = agg['artists']
+        colors = sns.color_palette('viridis', len(artists)).as_hex()
+        
+        fig = go.Figure(go.Bar(
+            x=artists['artist_name'],
+            y=artists['artist_popularity'],
+            marker=dict(color=colors, line=dict(color='black', width=1.5)),
+            opacity=0.85,
+            text=artists['artist_popularity'].round().astype(int),
+            textposition='outside',
+            hovertemplate='%{x}<br>Popularidad: %{y}<extra></extra>'
+        ))
+        
+        fig.add_hline(
+            y=agg['mean'],
+            line=dict(color='red', dash='dash', width=2),
+            annotation_text=f"Promedio: {agg['mean']:.1f}",
+            annotation_position='top left'
+        )
+        
+        if len(artists) > 0:
+            top = artists.loc[artists['artist_popularity'].idxmax()]
+            fig.add_annotation(
+                x=top['artist_name'],
+                y=top['artist_popularity'],
+                text=f"🏆 Más popular:<br>{top['artist_name']}<br>({top['artist_popularity']:.0f} puntos)",
+                showarrow=True,
+                arrowcolor=SPOTIFY['primary'],
+                ax=60, ay=60,
+                bgcolor='yellow',
+                bordercolor=SPOTIFY['primary']
+            )
+        
+        fig.update_layout(
+            title=self.title.replace('\n', '<br>'),
+            xaxis_title='Artistas',
+            yaxis=dict(title='Nivel de Popularidad (0-100)', range=[0, 105]),
+            template='plotly_white',
+            xaxis_tickangle=-45
+        )
+        return fig
 
 
 def personalization_advanced(data):
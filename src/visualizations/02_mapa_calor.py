@@ -13,17 +13,25 @@ Identificar relaciones entre variables:
 - Detectar variables relacionadas
 
 📊 DATOS QUE VISUALIZA:
+Todas las columnas numéricas del esquema (NUMERIC_COLUMNS):
+- Número de pista
 - Popularidad de canciones
 - Popularidad de artistas
 - Seguidores
-- Duración de canciones
 - Total de tracks en álbum
+- Duración de canciones
+
+⚡ RENDIMIENTO:
+La matriz se calcula de forma incremental (co-momentos por bloques),
+por lo que puede generarse directamente desde un CSV más grande que la RAM.
+Coste: O(k²) en columnas por bloque, una sola pasada (dos para Spearman).
 
 🎨 ELEMENTOS VISUALES:
 - Matriz de correlación con valores
 - Colores divergentes centrados en 0
 - Anotaciones numéricas
 - Dos estilos: RdYlGn y coolwarm
+- Método Pearson o Spearman (rangos aproximados)
 
 💡 CUÁNDO USAR:
 - Para análisis exploratorio de datos
@@ -36,36 +44,56 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import seaborn as sns
+import plotly.graph_objects as go
 from .base import BasePlot
+from ..config.settings import NUMERIC_COLUMNS
+from ..data.correlation import correlation_matrix
+from ..data.loader import DataLoader, read_columns
 
 class MapaCalor(BasePlot):
     
-    def __init__(self, data):
+    def __init__(self, data=None, method='pearson', source=None):
+        """
+        Args:
+            data: DataFrame con los datos (puede ser None si se usa source)
+            method: 'pearson' o 'spearman'
+            source: Ruta de un CSV para calcular la correlación por bloques
+                    sin cargarlo en memoria
+        """
         super().__init__(
             data=data,
-            title='🔥 Análisis de Correlaciones - Mapa de Calor',
+            title=f'🔥 Análisis de Correlaciones ({method.capitalize()}) - Mapa de Calor',
             filename='02_mapa_calor'
         )
+        self.method = method
+        self.source = source
+    
+    def _correlation(self):
+        """Calcula la matriz de correlación de forma incremental"""
+        if self.source is None:
+            # En memoria: se calcula una vez por dataset y se comparte
+            return self.dataset.correlation(NUMERIC_COLUMNS, method=self.method)
+        
+        loader = DataLoader()
+        # Solo las columnas que existen en el CSV (igual que en memoria)
+        disponibles = set(read_columns(self.source))
+        vars_numericas = [col for col in NUMERIC_COLUMNS if col in disponibles]
+        chunks = lambda: loader.iter_chunks(self.source, columns=vars_numericas)
+        return correlation_matrix(chunks, vars_numericas, method=self.method)
+    
+    def aggregate(self):
+        """Matriz de correlación (todas las columnas numéricas del esquema)"""
+        return {'correlation': self._correlation()}
     
     def create(self):
         """Crea el mapa de calor"""
         
-        # Variables numéricas a correlacionar
-        vars_numericas = [
-            'track_popularity',      # Popularidad de la canción
-            'artist_popularity',     # Popularidad del artista
-            'artist_followers',      # Seguidores del artista
-            'track_duration_min',    # Duración en minutos
-            'album_total_tracks'     # Tracks totales en el álbum
-        ]
-        
-        # Calcular matriz de correlación
-        correlacion = self.data[vars_numericas].corr()
+        # Matriz de correlación calculada en prepare()
+        correlacion = self.prepare()['correlation']
         
         # Crear figura con 2 subplots (lado a lado)
-        self.fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        self.fig, (ax1, ax2) = self.subplots(1, 2, figsize=(16, 6))
         
         # === MAPA DE CALOR 1: ESTILO CLÁSICO ===
         
@@ -131,14 +159,40 @@ class MapaCalor(BasePlot):
             fontsize=10,
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5)
         )
+    
+    def to_plotly(self):
+        """Versión interactiva: mapa de calor con valores anotados"""
+        correlacion = self.prepare()['correlation']
+        
+        fig = go.Figure(go.Heatmap(
+            z=correlacion.values,
+            x=list(correlacion.columns),
+            y=list(correlacion.index),
+            zmin=-1,
+            zmax=1,
+            colorscale='RdYlGn',
+            colorbar=dict(title='Correlación'),
+            text=correlacion.round(2).values,
+            texttemplate='%{text:.2f}',
+            hovertemplate='%{y} / %{x}: %{z:.3f}<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title=self.title,
+            yaxis=dict(autorange='reversed', scaleanchor='x'),
+            template='plotly_white'
+        )
+        return fig
 
 
-def heatmap(data):
+def heatmap(data=None, method='pearson', source=None):
     """
     Función helper para generar el mapa de calor
     
     Args:
         data: DataFrame con datos de Spotify
+        method: 'pearson' o 'spearman'
+        source: Ruta de un CSV para calcular la correlación por bloques
     """
-    plot = MapaCalor(data)
+    plot = MapaCalor(data, method=method, source=source)
     plot.generate()
\ No newline at end of file
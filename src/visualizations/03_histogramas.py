@@ -36,13 +36,18 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import seaborn as sns
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from .base import BasePlot
+from .interactive import histogram, kde_curve
 from ..config.colors import SPOTIFY, EXPLICIT
 
 class Histogramas(BasePlot):
     
+    requires = ('popularity_mean', 'explicit_rows')
+    
     def __init__(self, data):
         super().__init__(
             data=data,
@@ -50,11 +55,25 @@ class Histogramas(BasePlot):
             filename='03_histogramas'
         )
     
+    def aggregate(self):
+        """Media, muestra para el rugplot y años recientes"""
+        recent, period = self.year_window(2020)
+        return {
+            'mean': self.inputs['popularity_mean'],
+            # Tomar muestra para rugplot (puntos en el eje)
+            'followers_sample': self.data['artist_followers'].sample(min(500, len(self.data))),
+            # Filtrar años recientes
+            'recent_years': self.data['year'].iloc[recent],
+            'period': period
+        }
+    
     def create(self):
         """Crea los histogramas"""
         
+        agg = self.prepare()
+        
         # Crear figura con 4 subplots (2x2)
-        self.fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        self.fig, axes = self.subplots(2, 2, figsize=(15, 10))
         
         # === HISTOGRAMA 1: POPULARIDAD (básico con KDE) ===
         
@@ -78,7 +97,7 @@ class Histogramas(BasePlot):
         axes[0, 0].set_ylabel('Frecuencia (número de canciones)')
         
         # Línea vertical en la media
-        media = self.data['track_popularity'].mean()
+        media = agg['mean']
         axes[0, 0].axvline(
             media,
             color='red',
@@ -113,8 +132,7 @@ class Histogramas(BasePlot):
         
         # === HISTOGRAMA 3: SEGUIDORES (logarítmico con rugplot) ===
         
-        # Tomar muestra para rugplot (puntos en el eje)
-        sample = self.data.sample(min(500, len(self.data)))
+        sample = agg['followers_sample'].to_frame()
         
         sns.histplot(
             data=sample,
@@ -144,8 +162,7 @@ class Histogramas(BasePlot):
         
         # === HISTOGRAMA 4: CANCIONES POR AÑO ===
         
-        # Filtrar años recientes
-        df_recent = self.data[self.data['year'] >= 2020]
+        df_recent = agg['recent_years'].to_frame()
         
         if len(df_recent) > 0:
             sns.histplot(
@@ -159,7 +176,7 @@ class Histogramas(BasePlot):
             )
             
             axes[1, 1].set_title(
-                'Canciones por Año (2020 en adelante)',
+                f"Canciones por Año ({agg['period']})",
                 fontsize=12,
                 fontweight='bold'
             )
@@ -172,6 +189,61 @@ class Histogramas(BasePlot):
         # Añadir grid en cada gráfico
         for ax in axes.flat:
             ax.grid(axis='y', alpha=0.3, linestyle='--')
+    
+    def to_plotly(self):
+        """Versión interactiva: conteos por intervalo (no filas) y curvas KDE"""
+        agg = self.prepare()
+        fig = make_subplots(rows=2, cols=2, subplot_titles=(
+            'Distribución de Popularidad de Canciones',
+            'Duración: Explícito vs No Explícito',
+            'Distribución de Seguidores (escala logarítmica)',
+            f"Canciones por Año ({agg['period']})"
+        ))
+        
+        # 1. Popularidad con KDE escalada a conteos
+        centers, widths, counts = histogram(self.data['track_popularity'], bins=30)
+        fig.add_trace(go.Bar(x=centers, y=counts, width=widths, name='Popularidad',
+                             marker=dict(color=SPOTIFY['primary'], line=dict(color='black', width=1))),
+                      row=1, col=1)
+        x, density = kde_curve(self.data['track_popularity'])
+        if len(x):
+            fig.add_trace(go.Scatter(x=x, y=density * counts.sum() * widths[0], mode='lines',
+                                     line=dict(color=SPOTIFY['primary']), showlegend=False),
+                          row=1, col=1)
+        fig.add_vline(x=agg['mean'], line=dict(color='red', dash='dash', width=2),
+                      annotation_text=f"Media: {agg['mean']:.1f}", row=1, col=1)
+        
+        # 2. Duración por contenido (mismos intervalos para ambas capas)
+        duration = self.data['track_duration_min']
+        edges = np.histogram_bin_edges(duration.dropna(), bins=30)
+        for flag, label in ((False, 'No Explícito'), (True, 'Explícito')):
+            values = duration.iloc[self.inputs['explicit_rows'][flag]]
+            centers, widths, counts = histogram(values, bins=edges)
+            fig.add_trace(go.Bar(x=centers, y=counts, width=widths, name=label, opacity=0.6,
+                                 marker_color=EXPLICIT[flag]), row=1, col=2)
+            x, density = kde_curve(values)
+            if len(x):
+                fig.add_trace(go.Scatter(x=x, y=density * counts.sum() * widths[0], mode='lines',
+                                         line=dict(color=EXPLICIT[flag]), showlegend=False),
+                              row=1, col=2)
+        
+        # 3. Seguidores (muestra): intervalos sobre log10
+        followers = agg['followers_sample']
+        centers, widths, counts = histogram(np.log10(followers[followers > 0]), bins=40)
+        fig.add_trace(go.Bar(x=centers, y=counts, width=widths, name='Seguidores',
+                             marker_color=SPOTIFY['secondary'],
+                             customdata=10 ** centers,
+                             hovertemplate='~%{customdata:,.0f} seguidores: %{y}<extra></extra>'),
+                      row=2, col=1)
+        fig.update_xaxes(title_text='Seguidores (log10)', row=2, col=1)
+        
+        # 4. Canciones por año
+        years = agg['recent_years'].value_counts().sort_index()
+        fig.add_trace(go.Bar(x=years.index, y=years.values, width=0.8, name='Canciones',
+                             marker_color=SPOTIFY['gray']), row=2, col=2)
+        
+        fig.update_layout(title=self.title, barmode='overlay', template='plotly_white', height=800)
+        return fig
 
 
 def histograms(data):
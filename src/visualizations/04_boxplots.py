@@ -36,13 +36,18 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import seaborn as sns
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from .base import BasePlot
+from .interactive import box_stats
 from ..config.colors import SPOTIFY, EXPLICIT
+from ..data.text import decode_text
 
 class Boxplots(BasePlot):
     
+    requires = ('artist_counts', 'album_type_durations', 'explicit_rows')
+    
     def __init__(self, data):
         super().__init__(
             data=data,
@@ -50,11 +55,30 @@ class Boxplots(BasePlot):
             filename='04_boxplots'
         )
     
+    def aggregate(self):
+        """Mediana y subconjuntos (top 10 artistas, tipos de álbum más comunes)"""
+        
+        # Obtener top 10 artistas con más canciones (el principio del conteo compartido)
+        top_10_artists = self.inputs['artist_counts'].index[:10]
+        
+        top_artists = self.data[['artist_name', 'track_popularity']].iloc[
+            self.index.rows_in('artist_name', top_10_artists)]
+        
+        return {
+            'median': self.data['track_popularity'].median(),
+            # Nombres como texto: el eje del violín solo debe tener estos 10 artistas
+            'top_artists': top_artists.assign(artist_name=decode_text(top_artists['artist_name'])),
+            # Tipos de álbum más comunes (compartido con Enjambre)
+            'album_types': self.inputs['album_type_durations']
+        }
+    
     def create(self):
         """Crea los boxplots"""
         
+        agg = self.prepare()
+        
         # Crear figura con 4 subplots (2x2)
-        self.fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        self.fig, axes = self.subplots(2, 2, figsize=(15, 10))
         
         # === BOXPLOT 1: DISTRIBUCIÓN BÁSICA ===
         
@@ -75,7 +99,7 @@ class Boxplots(BasePlot):
         axes[0, 0].set_xlabel('')
         
         # Agregar líneas de referencia
-        median = self.data['track_popularity'].median()
+        median = agg['median']
         axes[0, 0].axhline(median, color='red', linestyle='--', 
                           linewidth=1, alpha=0.5, label=f'Mediana: {median:.1f}')
         axes[0, 0].legend()
@@ -101,9 +125,7 @@ class Boxplots(BasePlot):
         
         # === BOXPLOT 3: VIOLINPLOT + BOXPLOT (Top 10 artistas) ===
         
-        # Obtener top 10 artistas con más canciones
-        top_10_artists = self.data['artist_name'].value_counts().head(10).index
-        df_top_artists = self.data[self.data['artist_name'].isin(top_10_artists)]
+        df_top_artists = agg['top_artists']
         
         if len(df_top_artists) > 0:
             sns.violinplot(
@@ -125,9 +147,7 @@ class Boxplots(BasePlot):
         
         # === BOXPLOT 4: POR TIPO DE ÁLBUM ===
         
-        # Filtrar tipos de álbum más comunes
-        top_album_types = self.data['album_type'].value_counts().head(3).index
-        df_album_types = self.data[self.data['album_type'].isin(top_album_types)]
+        df_album_types = agg['album_types']
         
         if len(df_album_types) > 0:
             sns.boxplot(
@@ -151,6 +171,49 @@ class Boxplots(BasePlot):
         
         for ax in axes.flat:
             ax.grid(axis='y', alpha=0.3, linestyle='--')
+    
+    @staticmethod
+    def _box(values, name, color=None, horizontal=False):
+        """Caja de Plotly con estadísticos precalculados (sin enviar las filas)"""
+        stats = box_stats(values)
+        if stats is None:
+            return None
+        stats = {key: [value] for key, value in stats.items()}
+        position = {'y': [name]} if horizontal else {'x': [name]}
+        return go.Box(name=name, marker_color=color, orientation='h' if horizontal else 'v',
+                      showlegend=False, **position, **stats)
+    
+    def to_plotly(self):
+        """Versión interactiva: cajas con cuartiles y bigotes precalculados"""
+        agg = self.prepare()
+        fig = make_subplots(rows=2, cols=2, subplot_titles=(
+            'Distribución de Popularidad de Canciones',
+            'Popularidad por Contenido Explícito',
+            'Popularidad por Artista (Top 10)',
+            'Duración por Tipo de Álbum'
+        ))
+        
+        traces = [(self._box(self.data['track_popularity'], 'Popularidad', SPOTIFY['primary']), 1, 1)]
+        for flag, label in ((False, 'No Explícito'), (True, 'Explícito')):
+            values = self.data['track_popularity'].iloc[self.inputs['explicit_rows'][flag]]
+            traces.append((self._box(values, label, EXPLICIT[flag]), 1, 2))
+        
+        top_artists = agg['top_artists']
+        for artist, values in top_artists.groupby('artist_name', sort=False)['track_popularity']:
+            traces.append((self._box(values, artist, horizontal=True), 2, 1))
+        
+        album_types = agg['album_types']
+        for album_type, values in album_types.groupby('album_type', sort=False)['track_duration_min']:
+            traces.append((self._box(values, album_type), 2, 2))
+        
+        for trace, row, col in traces:
+            if trace is not None:
+                fig.add_trace(trace, row=row, col=col)
+        
+        fig.add_hline(y=agg['median'], line=dict(color='red', dash='dash', width=1),
+                      annotation_text=f"Mediana: {agg['median']:.1f}", row=1, col=1)
+        fig.update_layout(title=self.title, template='plotly_white', height=800)
+        return fig
 
 
 def boxplots(data):
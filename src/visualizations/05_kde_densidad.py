@@ -36,14 +36,18 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from .base import BasePlot
+from .interactive import kde_curve
 from ..config.colors import SPOTIFY, EXPLICIT
 
 class KDEDensidad(BasePlot):
     
+    requires = ('popularity_mean', 'explicit_rows')
+    
     def __init__(self, data):
         super().__init__(
             data=data,
@@ -51,11 +55,36 @@ class KDEDensidad(BasePlot):
             filename='05_kde_densidad'
         )
     
+    def aggregate(self):
+        """Media y muestras filtradas para los paneles bivariados"""
+        
+        # Tomar muestra para mejor rendimiento
+        sample = self.data.sample(min(1000, len(self.data)))
+        sample_filtered = sample[
+            (sample['track_duration_min'] > 0) & 
+            (sample['track_popularity'] > 0)
+        ]
+        
+        sample2 = self.data.sample(min(500, len(self.data)))
+        sample2_filtered = sample2[
+            (sample2['artist_followers'] > 0) &
+            (sample2['artist_popularity'] > 0) &
+            (sample2['artist_followers'] < sample2['artist_followers'].quantile(0.99))
+        ]
+        
+        return {
+            'mean': self.inputs['popularity_mean'],
+            'sample_2d': sample_filtered,
+            'sample_scatter': sample2_filtered
+        }
+    
     def create(self):
         """Crea los gráficos KDE"""
         
+        agg = self.prepare()
+        
         # Crear figura con 4 subplots (2x2)
-        self.fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        self.fig, axes = self.subplots(2, 2, figsize=(15, 10))
         
         # === KDE 1: DENSIDAD SIMPLE ===
         
@@ -77,7 +106,7 @@ class KDEDensidad(BasePlot):
         axes[0, 0].set_ylabel('Densidad')
         
         # Añadir línea vertical en la media
-        media = self.data['track_popularity'].mean()
+        media = agg['mean']
         axes[0, 0].axvline(media, color='red', linestyle='--', 
                           linewidth=2, label=f'Media: {media:.1f}')
         axes[0, 0].legend()
@@ -106,12 +135,7 @@ class KDEDensidad(BasePlot):
         
         # === KDE 3: DENSIDAD BIVARIADA (2D) ===
         
-        # Tomar muestra para mejor rendimiento
-        sample = self.data.sample(min(1000, len(self.data)))
-        sample_filtered = sample[
-            (sample['track_duration_min'] > 0) & 
-            (sample['track_popularity'] > 0)
-        ]
+        sample_filtered = agg['sample_2d']
         
         try:
             sns.kdeplot(
@@ -151,12 +175,7 @@ class KDEDensidad(BasePlot):
         
         # === KDE 4: SCATTER + KDE MARGINAL ===
         
-        sample2 = self.data.sample(min(500, len(self.data)))
-        sample2_filtered = sample2[
-            (sample2['artist_followers'] > 0) &
-            (sample2['artist_popularity'] > 0) &
-            (sample2['artist_followers'] < sample2['artist_followers'].quantile(0.99))
-        ]
+        sample2_filtered = agg['sample_scatter']
         
         if len(sample2_filtered) > 50:
             # Scatter
@@ -204,6 +223,56 @@ class KDEDensidad(BasePlot):
         
         for ax in axes.flat:
             ax.grid(alpha=0.3, linestyle='--')
+    
+    def to_plotly(self):
+        """Versión interactiva: curvas KDE precalculadas, contornos y dispersión"""
+        agg = self.prepare()
+        fig = make_subplots(rows=2, cols=2, subplot_titles=(
+            'Densidad de Popularidad (KDE)',
+            'Densidad de Duración por Contenido',
+            'Densidad 2D: Duración vs Popularidad',
+            'Seguidores vs Popularidad'
+        ))
+        
+        # 1. Densidad simple
+        x, density = kde_curve(self.data['track_popularity'])
+        fig.add_trace(go.Scatter(x=x, y=density, mode='lines', fill='tozeroy', name='Popularidad',
+                                 line=dict(color=SPOTIFY['primary'], width=2)), row=1, col=1)
+        fig.add_vline(x=agg['mean'], line=dict(color='red', dash='dash', width=2),
+                      annotation_text=f"Media: {agg['mean']:.1f}", row=1, col=1)
+        
+        # 2. Densidad por contenido (ponderada por la proporción de cada grupo, como hue en seaborn)
+        total = len(self.data)
+        for flag, label in ((False, 'No Explícito'), (True, 'Explícito')):
+            values = self.data['track_duration_min'].iloc[self.inputs['explicit_rows'][flag]]
+            x, density = kde_curve(values)
+            if len(x):
+                fig.add_trace(go.Scatter(x=x, y=density * len(values) / total, mode='lines',
+                                         fill='tozeroy', name=label, opacity=0.5,
+                                         line=dict(color=EXPLICIT[flag], width=2)), row=1, col=2)
+        
+        # 3. Densidad bivariada sobre la muestra
+        sample = agg['sample_2d']
+        fig.add_trace(go.Histogram2dContour(
+            x=sample['track_duration_min'], y=sample['track_popularity'],
+            colorscale='Greens', showscale=False, ncontours=10, name='Densidad 2D'
+        ), row=2, col=1)
+        
+        # 4. Dispersión por contenido
+        sample2 = agg['sample_scatter']
+        for flag, label in ((False, 'No Explícito'), (True, 'Explícito')):
+            group = sample2[sample2['explicit'] == flag]
+            fig.add_trace(go.Scatter(
+                x=group['artist_followers'], y=group['artist_popularity'], mode='markers',
+                name=label, showlegend=False, opacity=0.6,
+                marker=dict(color=EXPLICIT[flag], size=7),
+                text=group['artist_name'],
+                hovertemplate='%{text}<br>Seguidores: %{x:,}<br>Popularidad: %{y}<extra></extra>'
+            ), row=2, col=2)
+        fig.update_xaxes(type='log', row=2, col=2)
+        
+        fig.update_layout(title=self.title, template='plotly_white', height=800)
+        return fig
 
 
 def kde_plots(data):
@@ -35,13 +35,16 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import seaborn as sns
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from .base import BasePlot
 from ..config.colors import SPOTIFY
 
 class GraficoPareto(BasePlot):
     
+    requires = ('artist_counts',)
+    
     def __init__(self, data):
         super().__init__(
             data=data,
@@ -49,21 +52,34 @@ class GraficoPareto(BasePlot):
             filename='06_pareto'
         )
     
-    def create(self):
-        """Crea el gráfico de Pareto"""
+    def aggregate(self):
+        """Conteo por artista (top 20), porcentaje acumulado y cruce del 80%"""
         
-        # Contar canciones por artista (top 20)
-        artist_counts = (self.data['artist_name']
-                        .value_counts()
-                        .head(20)
-                        .sort_values(ascending=False))
+        # Contar canciones por artista (top 20 por argpartition, compartido con Boxplots y Radar)
+        artist_counts = self.inputs['artist_counts']
         
         # Calcular porcentaje acumulado
         cumsum = artist_counts.cumsum()
         cumsum_pct = 100 * cumsum / cumsum.iloc[-1]
         
+        # Encontrar en qué punto se cruza el 80%
+        idx_80 = (cumsum_pct >= 80).idxmax()
+        
+        return {
+            'counts': artist_counts,
+            'cumsum_pct': cumsum_pct,
+            'pos_80': list(artist_counts.index).index(idx_80)
+        }
+    
+    def create(self):
+        """Crea el gráfico de Pareto"""
+        
+        agg = self.prepare()
+        artist_counts = agg['counts']
+        cumsum_pct = agg['cumsum_pct']
+        
         # Crear figura con un eje
-        self.fig, ax1 = plt.subplots(figsize=(14, 7))
+        self.fig, ax1 = self.subplots(figsize=(14, 7))
         
         # === BARRAS (Eje izquierdo) ===
         
@@ -142,9 +158,7 @@ class GraficoPareto(BasePlot):
         )
         
         # Anotación explicativa
-        # Encontrar en qué punto se cruza el 80%
-        idx_80 = (cumsum_pct >= 80).idxmax()
-        pos_80 = list(artist_counts.index).index(idx_80)
+        pos_80 = agg['pos_80']
         
         ax2.annotate(
             f'80% de canciones\nalcanzado en {pos_80+1} artistas',
@@ -154,6 +168,36 @@ class GraficoPareto(BasePlot):
             fontsize=10,
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8)
         )
+    
+    def to_plotly(self):
+        """Versión interactiva: barras + % acumulado en eje secundario"""
+        agg = self.prepare()
+        artist_counts = agg['counts']
+        artists = list(artist_counts.index)
+        
+        fig = make_subplots(specs=[[{'secondary_y': True}]])
+        fig.add_trace(go.Bar(
+            x=artists, y=artist_counts.values, name='Cantidad de Canciones',
+            marker=dict(color=SPOTIFY['primary'], line=dict(color='black', width=1.5)),
+            opacity=0.7
+        ), secondary_y=False)
+        fig.add_trace(go.Scatter(
+            x=artists, y=agg['cumsum_pct'].values, name='% Acumulado',
+            mode='lines+markers', line=dict(color='#FF6B6B', width=3), marker=dict(size=8),
+            hovertemplate='%{x}: %{y:.1f}%<extra></extra>'
+        ), secondary_y=True)
+        fig.add_hline(y=80, line=dict(color='red', dash='dash', width=2), secondary_y=True)
+        fig.add_annotation(
+            x=artists[agg['pos_80']], y=80, yref='y2',
+            text=f"80% de canciones<br>alcanzado en {agg['pos_80'] + 1} artistas",
+            showarrow=True, arrowcolor='red', ax=60, ay=40, bgcolor='wheat'
+        )
+        
+        fig.update_yaxes(title_text='Número de Canciones', secondary_y=False)
+        fig.update_yaxes(title_text='Porcentaje Acumulado (%)', range=[0, 105], secondary_y=True)
+        fig.update_layout(title=self.title.replace('\n', '<br>'), xaxis_title='Artistas',
+                          xaxis_tickangle=-45, template='plotly_white')
+        return fig
 
 
 def pareto_chart(data):
@@ -38,14 +38,16 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
+import plotly.graph_objects as go
 from math import pi
 from .base import BasePlot
 from ..config.colors import get_palette
 
 class GraficoRadar(BasePlot):
     
+    requires = ('artist_counts',)
+    
     def __init__(self, data):
         super().__init__(
             data=data,
@@ -53,14 +55,38 @@ class GraficoRadar(BasePlot):
             filename='07_radar'
         )
     
+    def aggregate(self):
+        """Métricas normalizadas (0-100) de los 5 artistas más populares"""
+        
+        # Seleccionar top 5 artistas (distintos) por popularidad
+        top_artists = self.dataset.top_by('artist_name', 'artist_popularity', 5).index
+        
+        max_followers = self.data['artist_followers'].max()
+        max_duration = self.data['track_duration_min'].max()
+        max_count = self.inputs['artist_counts'].max()
+        
+        profiles = {}
+        for artist in top_artists:
+            artist_data = self.data.iloc[self.index.category('artist_name').rows(artist)]
+            
+            if len(artist_data) == 0:
+                continue
+            
+            # Calcular métricas (normalizar a escala 0-100)
+            profiles[artist] = [
+                artist_data['artist_popularity'].mean(),
+                (artist_data['artist_followers'].mean() / max_followers) * 100,
+                artist_data['track_popularity'].mean(),
+                (artist_data['track_duration_min'].mean() / max_duration) * 100,
+                (len(artist_data) / max_count) * 100
+            ]
+        
+        return {'profiles': profiles}
+    
     def create(self):
         """Crea el gráfico de radar"""
         
-        # Seleccionar top 5 artistas por popularidad
-        top_artists = (self.data
-                      .nlargest(5, 'artist_popularity')
-                      ['artist_name']
-                      .unique()[:5])
+        profiles = self.prepare()['profiles']
         
         # Categorías a comparar
         categorias = [
@@ -72,7 +98,7 @@ class GraficoRadar(BasePlot):
         ]
         
         # Crear figura con proyección polar
-        self.fig, ax = plt.subplots(
+        self.fig, ax = self.subplots(
             figsize=(10, 10),
             subplot_kw=dict(projection='polar')
         )
@@ -85,24 +111,10 @@ class GraficoRadar(BasePlot):
         # Colores para cada artista
         colores = get_palette('categorical', 5)
         
-        # Para cada artista, calcular valores y graficar
-        for i, artist in enumerate(top_artists):
-            artist_data = self.data[self.data['artist_name'] == artist]
-            
-            if len(artist_data) == 0:
-                continue
-            
-            # Calcular métricas (normalizar a escala 0-100)
-            valores = [
-                artist_data['artist_popularity'].mean(),
-                (artist_data['artist_followers'].mean() / self.data['artist_followers'].max()) * 100,
-                artist_data['track_popularity'].mean(),
-                (artist_data['track_duration_min'].mean() / self.data['track_duration_min'].max()) * 100,
-                (len(artist_data) / self.data['artist_name'].value_counts().max()) * 100
-            ]
-            
+        # Para cada artista, graficar sus valores
+        for i, (artist, valores) in enumerate(profiles.items()):
             # Cerrar el polígono (repetir primer valor)
-            valores += valores[:1]
+            valores = valores + valores[:1]
             
             # Graficar línea
             ax.plot(
@@ -153,6 +165,32 @@ class GraficoRadar(BasePlot):
         # Líneas de referencia (cada 25%)
         ax.set_yticks([25, 50, 75, 100])
         ax.set_yticklabels(['25', '50', '75', '100'], size=8)
+    
+    def to_plotly(self):
+        """Versión interactiva: polígonos rellenos en coordenadas polares"""
+        profiles = self.prepare()['profiles']
+        categorias = ['Popularidad Artista', 'Seguidores (norm)', 'Popularidad Tracks',
+                      'Duración Promedio', 'Cantidad Canciones']
+        colores = get_palette('categorical', 5)
+        
+        fig = go.Figure()
+        for i, (artist, valores) in enumerate(profiles.items()):
+            fig.add_trace(go.Scatterpolar(
+                r=valores + valores[:1],
+                theta=categorias + categorias[:1],
+                name=artist,
+                fill='toself',
+                opacity=0.6,
+                line=dict(color=colores[i], width=2),
+                hovertemplate='%{theta}: %{r:.1f}<extra>' + artist + '</extra>'
+            ))
+        
+        fig.update_layout(
+            title=self.title.replace('\n', '<br>'),
+            polar=dict(radialaxis=dict(range=[0, 100], tickvals=[25, 50, 75, 100])),
+            template='plotly_white'
+        )
+        return fig
 
 
 def radar_chart(data):
@@ -35,8 +35,8 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
+import plotly.graph_objects as go
 from .base import BasePlot
 from ..config.colors import SPOTIFY
 
@@ -49,29 +49,38 @@ class GraficoCascada(BasePlot):
             filename='08_cascada'
         )
     
-    def create(self):
-        """Crea el gráfico de cascada"""
+    def aggregate(self):
+        """Canciones por año (desde 2015 salvo filtro de años) y cambio año a año"""
         
-        # Filtrar años válidos y recientes (desde 2015)
-        df_years = (self.data[self.data['year'] >= 2015]
+        # Filtrar años válidos y recientes (desde 2015 o el rango del filtro)
+        recent, _ = self.year_window(2015)
+        df_years = (self.data.iloc[recent]
                    .groupby('year')
                    .size()
                    .reset_index(name='count')
                    .sort_values('year'))
         
+        if len(df_years) > 0:
+            # Calcular cambios año a año
+            df_years['change'] = df_years['count'].diff()
+            df_years.loc[df_years.index[0], 'change'] = df_years.loc[df_years.index[0], 'count']
+        
+        return {'years': df_years}
+    
+    def create(self):
+        """Crea el gráfico de cascada"""
+        
+        df_years = self.prepare()['years']
+        
         if len(df_years) == 0:
             # Si no hay datos, crear gráfico vacío con mensaje
-            self.fig, ax = plt.subplots(figsize=(14, 7))
+            self.fig, ax = self.subplots(figsize=(14, 7))
             ax.text(0.5, 0.5, 'No hay datos suficientes para el gráfico de cascada',
                    ha='center', va='center', fontsize=14)
             return
         
-        # Calcular cambios año a año
-        df_years['change'] = df_years['count'].diff()
-        df_years.loc[df_years.index[0], 'change'] = df_years.loc[df_years.index[0], 'count']
-        
         # Crear figura
-        self.fig, ax = plt.subplots(figsize=(14, 7))
+        self.fig, ax = self.subplots(figsize=(14, 7))
         
         # Posición acumulada para las barras flotantes
         cumulative = 0
@@ -152,6 +161,32 @@ class GraficoCascada(BasePlot):
             Patch(facecolor='#FF6B6B', label='Decremento')
         ]
         ax.legend(handles=legend_elements, loc='upper left')
+    
+    def to_plotly(self):
+        """Versión interactiva: cascada nativa de Plotly con los mismos cambios"""
+        df_years = self.prepare()['years']
+        
+        fig = go.Figure()
+        if len(df_years) > 0:
+            changes = df_years['change'].astype(int)
+            fig.add_trace(go.Waterfall(
+                x=df_years['year'].astype(int).astype(str),
+                y=changes,
+                measure=['relative'] * len(df_years),
+                text=[f'{c:+d}' for c in changes],
+                increasing=dict(marker=dict(color=SPOTIFY['primary'])),
+                decreasing=dict(marker=dict(color='#FF6B6B')),
+                connector=dict(line=dict(color='black', dash='dash'))
+            ))
+        
+        fig.update_layout(
+            title=self.title,
+            xaxis_title='Año',
+            yaxis_title='Cambio en Canciones',
+            template='plotly_white',
+            showlegend=False
+        )
+        return fig
 
 
 def waterfall_chart(data):
@@ -37,13 +37,17 @@ Universidad: ULEAM - Visualización de Datos
 Fecha: 2025-11-23
 """
 
-import matplotlib.pyplot as plt
 import seaborn as sns
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from .base import BasePlot
 from ..config.colors import EXPLICIT, SPOTIFY
+from ..data.text import decode_text
 
 class GraficoEnjambre(BasePlot):
     
+    requires = ('album_type_durations',)
+    
     def __init__(self, data):
         super().__init__(
             data=data,
@@ -51,16 +55,35 @@ class GraficoEnjambre(BasePlot):
             filename='09_enjambre'
         )
     
+    def aggregate(self):
+        """Muestras para los enjambres (los puntos se dibujan uno a uno)"""
+        
+        # Tomar muestra para rendimiento
+        sample_data = self.data[['explicit', 'track_popularity', 'track_name', 'artist_name']].sample(
+            min(500, len(self.data))
+        )
+        
+        # Canciones de los 3 tipos de álbum más comunes (compartido con Boxplots)
+        df_types = self.inputs['album_type_durations']
+        df_types = df_types.sample(min(400, len(df_types)))
+        
+        return {
+            'sample': sample_data,
+            'medians': sample_data.groupby('explicit')['track_popularity'].median(),
+            'album_types': df_types
+        }
+    
     def create(self):
         """Crea los gráficos de enjambre"""
         
+        agg = self.prepare()
+        
         # Crear figura con 2 subplots
-        self.fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+        self.fig, axes = self.subplots(1, 2, figsize=(16, 6))
         
         # === SWARMPLOT 1: BÁSICO ===
         
-        # Tomar muestra para rendimiento
-        sample_data = self.data.sample(min(500, len(self.data)))
+        sample_data = agg['sample']
         
         sns.swarmplot(
             data=sample_data,
@@ -83,7 +106,7 @@ class GraficoEnjambre(BasePlot):
         axes[0].grid(axis='y', alpha=0.3, linestyle='--')
         
         # Añadir línea de mediana
-        medians = sample_data.groupby('explicit')['track_popularity'].median()
+        medians = agg['medians']
         for i, (explicit, median) in enumerate(medians.items()):
             axes[0].hlines(
                 median, i - 0.4, i + 0.4,
@@ -94,9 +117,7 @@ class GraficoEnjambre(BasePlot):
         
         # === SWARMPLOT 2: COMBINADO CON VIOLINPLOT ===
         
-        # Obtener top 3 tipos de álbum
-        top_types = self.data['album_type'].value_counts().head(3).index
-        df_types = self.data[self.data['album_type'].isin(top_types)].sample(min(400, len(self.data)))
+        df_types = agg['album_types']
         
         if len(df_types) > 0:
             # Primero violinplot de fondo
@@ -130,6 +151,46 @@ class GraficoEnjambre(BasePlot):
             axes[1].set_ylabel('Duración (minutos)', fontsize=11)
             axes[1].tick_params(axis='x', rotation=15)
             axes[1].grid(axis='y', alpha=0.3, linestyle='--')
+    
+    def to_plotly(self):
+        """Versión interactiva: puntos con dispersión horizontal sobre las mismas muestras"""
+        agg = self.prepare()
+        fig = make_subplots(rows=1, cols=2, subplot_titles=(
+            'Popularidad por Contenido Explícito',
+            'Duración por Tipo de Álbum'
+        ))
+        
+        sample = agg['sample']
+        for flag, label in ((False, 'No Explícito'), (True, 'Explícito')):
+            group = sample[sample['explicit'] == flag]
+            fig.add_trace(go.Box(
+                x=[label] * len(group), y=group['track_popularity'], name=label,
+                boxpoints='all', jitter=0.6, pointpos=0, fillcolor='rgba(0,0,0,0)',
+                line=dict(color='rgba(0,0,0,0)'), marker=dict(color=EXPLICIT[flag], size=5, opacity=0.7),
+                text=decode_text(group['track_name']) + ' — ' + decode_text(group['artist_name']),
+                hovertemplate='%{text}<br>Popularidad: %{y}<extra></extra>',
+                showlegend=False
+            ), row=1, col=1)
+        for label, median in agg['medians'].items():
+            name = 'Explícito' if label else 'No Explícito'
+            fig.add_trace(go.Scatter(x=[name], y=[median], mode='markers', showlegend=False,
+                                     marker=dict(symbol='line-ew', size=40, color='red',
+                                                 line=dict(width=2, color='red')),
+                                     hovertemplate=f'Mediana: {median:.1f}<extra></extra>'),
+                          row=1, col=1)
+        
+        df_types = agg['album_types']
+        for album_type, group in df_types.groupby('album_type', sort=False):
+            fig.add_trace(go.Violin(
+                x=group['album_type'], y=group['track_duration_min'], name=album_type,
+                points='all', jitter=0.5, pointpos=0, opacity=0.6, showlegend=False,
+                marker=dict(color='black', size=3)
+            ), row=1, col=2)
+        
+        fig.update_yaxes(title_text='Popularidad', row=1, col=1)
+        fig.update_yaxes(title_text='Duración (minutos)', row=1, col=2)
+        fig.update_layout(title=self.title, template='plotly_white')
+        return fig
 
 
 def swarm_plot(data):
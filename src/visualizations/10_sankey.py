@@ -43,31 +43,51 @@ Fecha: 2025-11-23
 import plotly.graph_objects as go
 import pandas as pd
 from ..config.settings import INTERACTIVE_DIR, IMAGES_DIR
+from ..data.dataset import as_dataset
 from ..utils.logger import Logger
+from ..utils.profiling import ChartProfiler
+from .static_export import get_export_worker
+from .interactive import write_interactive_html
 
-logger = Logger()
+logger = Logger(__name__)
 
-def sankey_diagram(data):
+MISSING_PNG = "PNG no guardado (instala kaleido)"
+
+class DiagramaSankey:
     """
-    Genera diagrama de Sankey interactivo
+    Diagrama de Sankey con Plotly
     
-    Args:
-        data: DataFrame con datos de Spotify
+    Sigue la misma interfaz que BasePlot (create, save, show, generate)
+    aunque no hereda de ella porque no usa matplotlib.
     """
-    logger.info("Generando: Diagrama de Sankey (Flujo de datos)")
     
-    try:
-        # Crear categorías de popularidad
-        data_copy = data.copy()
-        data_copy['pop_category'] = pd.cut(
-            data_copy['track_popularity'],
+    def __init__(self, data):
+        """
+        Args:
+            data: SpotifyDataset, DataFrame o RowSelection
+        """
+        self.dataset = as_dataset(data)
+        self.data = self.dataset.frame
+        self.filters = self.dataset.filters
+        self.title = 'Diagrama de Sankey (Flujo de datos)'
+        self.filename = '10_sankey'
+        self.fig = None
+        self.profile = None
+        self.warnings = []        # Salidas que no se escribieron en la última generación
+    
+    def create(self):
+        """Crea el diagrama de Sankey (deja self.fig en None si no hay datos)"""
+        
+        # Crear categorías de popularidad (sin copiar el DataFrame)
+        pop_category = pd.cut(
+            self.data['track_popularity'],
             bins=[0, 30, 60, 100],
             labels=['Baja', 'Media', 'Alta']
-        )
+        ).rename('pop_category')
         
         # Preparar datos: Tipo de Álbum -> Explícito -> Popularidad
-        sankey_data = (data_copy
-                      .groupby(['album_type', 'explicit', 'pop_category'])
+        sankey_data = (self.data
+                      .groupby([self.data['album_type'], self.data['explicit'], pop_category])
                       .size()
                       .reset_index(name='count'))
         
@@ -113,7 +133,7 @@ def sankey_diagram(data):
                 colors.append('rgba(30, 215, 96, 0.4)')    # Verde claro transparente
         
         # Crear gráfico Sankey
-        fig = go.Figure(data=[go.Sankey(
+        self.fig = go.Figure(data=[go.Sankey(
             node=dict(
                 pad=15,
                 thickness=20,
@@ -133,32 +153,157 @@ def sankey_diagram(data):
             )
         )])
         
-        fig.update_layout(
+        self.fig.update_layout(
             title_text="🌊 Diagrama de Sankey - Flujo de Canciones<br>Tipo de Álbum → Contenido → Popularidad",
             title_font_size=18,
             font_size=12,
             height=600,
             width=1200
         )
+    
+    def to_plotly(self):
+        """Devuelve la figura de Plotly (la crea si hace falta)"""
+        if self.fig is None:
+            self.create()
+        return self.fig
+    
+    def save_html(self, filepath=None):
+        """
+        Guarda el HTML interactivo (referencia el plotly.js compartido)
+        
+        Args:
+            filepath: Ruta completa o None para usar default
         
-        # Guardar HTML interactivo
-        html_path = INTERACTIVE_DIR / '10_sankey.html'
-        fig.write_html(html_path)
+        Returns:
+            Ruta del HTML guardado
+        """
+        html_path = filepath or INTERACTIVE_DIR / f'{self.filename}.html'
+        write_interactive_html(self.fig, html_path, title=self.title)
         logger.success(f"Guardado: {html_path.name} (interactivo)")
+        return html_path
+    
+    def save_png(self, filepath=None):
+        """
+        Intenta guardar también el PNG estático (requiere kaleido)
+        
+        Si hay un StaticExportWorker activo (p. ej. en "generar todos"),
+        la figura se encola y el PNG se exporta en segundo plano; si falla,
+        lo informa quien cierra el worker (BatchExecutor).
+        
+        Args:
+            filepath: Ruta completa o None para usar default
+        
+        Returns:
+            True si se escribió el PNG, None si quedó en cola y False si no se
+            pudo escribir (se añade el aviso a self.warnings)
+        """
+        png_path = filepath or IMAGES_DIR / f'{self.filename}.png'
+        options = dict(width=1200, height=600, scale=2)
+        
+        worker = get_export_worker()
+        if worker is not None:
+            worker.submit(self.fig, png_path, **options)
+            logger.info(f"PNG en cola de exportación: {png_path.name}")
+            return None
         
-        # Intentar guardar PNG también
         try:
-            png_path = IMAGES_DIR / '10_sankey.png'
-            fig.write_image(png_path, width=1200, height=600, scale=2)
+            self.fig.write_image(png_path, **options)
             logger.success(f"Guardado: {png_path.name}")
+            return True
         except Exception as e:
             logger.warning(f"No se pudo guardar PNG (instala kaleido): {e}")
+            self.warnings.append(MISSING_PNG)
+            return False
+    
+    def save(self, filepath=None):
+        """
+        Guarda HTML interactivo y PNG
+        
+        Args:
+            filepath: Ruta del PNG o None para usar default (el HTML se
+                      guarda junto a él con extensión .html)
+        
+        Returns:
+            Lista de rutas guardadas (sin el PNG si no se pudo escribir)
+        """
+        png_path = filepath or IMAGES_DIR / f'{self.filename}.png'
+        written = [self.save_html(filepath.with_suffix('.html') if filepath else None)]
+        if self.save_png(png_path):
+            written.append(png_path)
+        return written
+    
+    def render(self, fmt='png', dpi=None):
+        """
+        Crea el diagrama y lo devuelve como bytes (PNG/SVG requieren kaleido)
+        
+        Args:
+            fmt: Formato de imagen ('png', 'svg', 'pdf')
+            dpi: Se ignora (Plotly usa width/height/scale)
         
-        # Mostrar en navegador
-        fig.show()
+        Returns:
+            Bytes de la imagen
+        """
+        fig = self.to_plotly()
+        if fig is None:
+            raise ValueError("No hay datos para el diagrama de Sankey")
+        return fig.to_image(format=fmt, width=1200, height=600, scale=1)
+    
+    def show(self):
+        """Muestra el diagrama en el navegador"""
+        self.fig.show()
+    
+    def generate(self, show=True, save=True, profile=None, interactive=None):
+        """
+        Genera el diagrama completo (crear + guardar + mostrar)
+        
+        Si no se puede escribir el PNG (falta kaleido) el HTML queda guardado,
+        self.warnings lo indica y el perfilado lleva el estado 'partial'.
         
-        logger.info("💡 Abre el archivo HTML en tu navegador para interactividad completa")
+        Args:
+            show: Si abrir el diagrama en el navegador
+            save: Si guardar HTML y PNG
+            profile: Si registrar tiempos por fase (None = usar PROFILING_ENABLED)
+            interactive: Se ignora: el Sankey siempre guarda su HTML
+        """
+        logger.info(f"Generando: {self.title}")
+        self.warnings = []
+        
+        profiler = ChartProfiler(self.filename, rows=len(self.data), enabled=profile).start()
+        
+        try:
+            with profiler.phase('create'):
+                self.create()
+            
+            if self.fig is None:
+                self.profile = profiler.stop(status='empty')
+                return
+            
+            if save:
+                with profiler.phase('save_html'):
+                    self.save_html()
+                with profiler.phase('save_png'):
+                    self.save_png()
+            
+            if show:
+                with profiler.phase('show'):
+                    self.show()
+            
+            self.profile = profiler.stop(status='partial' if self.warnings else 'ok', notes=self.warnings)
+            
+            logger.info("💡 Abre el archivo HTML en tu navegador para interactividad completa")
         
-    except Exception as e:
-        logger.error(f"Error al generar Sankey: {e}")
-        raise
\ No newline at end of file
+        except Exception as e:
+            self.profile = profiler.stop(status='error', error=e)
+            logger.error(f"Error al generar Sankey: {e}")
+            raise
+
+
+def sankey_diagram(data):
+    """
+    Genera diagrama de Sankey interactivo
+    
+    Args:
+        data: DataFrame con datos de Spotify
+    """
+    plot = DiagramaSankey(data)
+    plot.generate()
\ No newline at end of file
@@ -32,7 +32,28 @@ waterfall_chart = mod_08.waterfall_chart
 swarm_plot = mod_09.swarm_plot
 sankey_diagram = mod_10.sankey_diagram
 
+from .static_export import StaticExportWorker, get_export_worker
+from .interactive import write_interactive_html
+
+# Registro de gráficos: nombre de archivo -> clase (create/save/show/generate)
+CHARTS = {
+    '01_personalizacion_avanzada': mod_01.PersonalizacionAvanzada,
+    '02_mapa_calor': mod_02.MapaCalor,
+    '03_histogramas': mod_03.Histogramas,
+    '04_boxplots': mod_04.Boxplots,
+    '05_kde_densidad': mod_05.KDEDensidad,
+    '06_pareto': mod_06.GraficoPareto,
+    '07_radar': mod_07.GraficoRadar,
+    '08_cascada': mod_08.GraficoCascada,
+    '09_enjambre': mod_09.GraficoEnjambre,
+    '10_sankey': mod_10.DiagramaSankey,
+}
+
 __all__ = [
+    'CHARTS',
+    'StaticExportWorker',
+    'get_export_worker',
+    'write_interactive_html',
     'personalization_advanced',
     'heatmap',
     'histograms',
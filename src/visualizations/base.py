@@ -2,48 +2,179 @@
 📊 CLASE BASE PARA GRÁFICOS
 ===========================
 Clase abstracta de la que heredan todos los gráficos
+
+Las figuras se crean con la API orientada a objetos (canvas.py), sin el
+estado global de pyplot: varios gráficos pueden renderizarse a la vez en
+hilos distintos de un mismo proceso. El estilo viene de un tema compilado
+(config/themes.py) que se activa solo mientras el gráfico se renderiza.
 """
-import matplotlib.pyplot as plt
-import seaborn as sns
+from pathlib import Path
 from abc import ABC, abstractmethod
-from ..config.colors import CATEGORICAL
-from ..config.settings import IMAGES_DIR, FIGURE_SIZE, FIGURE_DPI, SAVE_DPI
+from matplotlib.artist import setp
+from ..config.settings import (
+    IMAGES_DIR,
+    INTERACTIVE_DIR,
+    INTERACTIVE_EXPORT,
+    FIGURE_SIZE,
+    FIGURE_DPI,
+    EXPORT_TARGETS,
+    CHART_EXPORT_TARGETS,
+    EXPORT_PAD_INCHES
+)
+from ..config.themes import get_theme, theme_scope
+from ..data.dataset import as_dataset
 from ..utils.logger import Logger
+from ..utils.profiling import ChartProfiler
+from .canvas import new_figure, close_figure, text_layout
+from .export import export_figure, render_figure
+from .interactive import write_interactive_html
 
-logger = Logger()
+logger = Logger(__name__)
 
 class BasePlot(ABC):
     """Clase base abstracta para todos los gráficos"""
     
-    def __init__(self, data, title="", filename="plot", figsize=None):
+    # Intermedios compartidos que usa aggregate() (data/pipeline.py)
+    requires = ()
+    
+    def __init__(self, data, title="", filename="plot", figsize=None, theme=None):
         """
         Inicializa el gráfico base
         
         Args:
-            data: DataFrame con los datos
+            data: SpotifyDataset, DataFrame o RowSelection (DataFilter.select)
             title: Título del gráfico
             filename: Nombre del archivo de salida (sin extensión)
             figsize: Tamaño personalizado (ancho, alto) o None para usar default
+            theme: Nombre del tema, Theme o None para usar DEFAULT_THEME
         """
-        self.data = data
+        self.dataset = as_dataset(data)
+        self.data = self.dataset.frame if self.dataset is not None else None
+        self.filters = self.dataset.filters if self.dataset is not None else None
         self.title = title
         self.filename = filename
         self.figsize = figsize or FIGURE_SIZE
+        self.theme = get_theme(theme)
         self.fig = None
         self.axes = None
+        self.profile = None       # Registro de tiempos de la última generación
+        self.warnings = []        # Salidas que no se escribieron en la última generación
+        self._aggregates = None   # Agregados compartidos por create() y to_plotly()
+        self.inputs = {}          # Intermedios de ``requires`` (los resuelve prepare)
+        self._display = False     # True si la figura se va a mostrar en una ventana
+        
+        # Destinos de exportación (por gráfico o globales)
+        self.export_targets = CHART_EXPORT_TARGETS.get(filename, EXPORT_TARGETS)
+    
+    def use_theme(self, theme):
+        """
+        Cambia el tema del gráfico
+        
+        Args:
+            theme: Nombre del tema, Theme o None para usar DEFAULT_THEME
+        
+        Returns:
+            El propio gráfico (para encadenar llamadas)
+        """
+        self.theme = get_theme(theme)
+        return self
+    
+    def subplots(self, nrows=1, ncols=1, figsize=None, **kwargs):
+        """
+        Crea la figura del gráfico y sus ejes (equivalente a plt.subplots)
+        
+        La figura es independiente de pyplot salvo que se vaya a mostrar
+        en pantalla (generate con show=True).
+        
+        Args:
+            nrows, ncols: Rejilla de ejes
+            figsize: Tamaño (ancho, alto) o None para usar self.figsize
+            **kwargs: Argumentos de Figure.subplots (subplot_kw, sharex...)
+        
+        Returns:
+            Tupla (figura, ejes)
+        """
+        fig = new_figure(figsize=figsize or self.figsize, dpi=FIGURE_DPI, managed=self._display)
+        return fig, fig.subplots(nrows, ncols, **kwargs)
+    
+    def prepare(self):
+        """
+        Calcula (una sola vez) los agregados que necesita el gráfico
+        
+        Tanto create() (matplotlib) como to_plotly() (interactivo) dibujan
+        a partir de este diccionario, así las muestras y los conteos son
+        los mismos en ambas versiones y no se recalculan. Antes se
+        resuelven en self.inputs los intermedios de ``requires``, que el
+        dataset comparte con los demás gráficos.
+        
+        Returns:
+            Diccionario con los agregados
+        """
+        if self._aggregates is None:
+            if self.requires and self.dataset is not None:
+                self.inputs = self.dataset.pipeline.resolve(self.requires)
+            self._aggregates = self.aggregate()
+        return self._aggregates
+    
+    def aggregate(self):
+        """
+        Calcula los agregados del gráfico (sobrescribir en subclases)
+        
+        Returns:
+            Diccionario con los agregados
+        """
+        return {}
+    
+    @property
+    def index(self):
+        """Índices secundarios de self.data (año, tipo de álbum, explícito, artista)"""
+        return self.dataset.index
+    
+    def year_window(self, since):
+        """
+        Años recientes que muestran algunos gráficos (p. ej. desde 2015)
+        
+        Si el filtro activo ya fija un rango de años, se respeta ese rango
+        en lugar del corte por defecto.
         
-        # Configurar estilo
-        self._setup_style()
+        Args:
+            since: Primer año por defecto
+        
+        Returns:
+            Tupla (posiciones de las filas, etiqueta del periodo)
+        """
+        years = self.index.range('year')
+        if self.filters is not None and self.filters.years:
+            low, high = self.filters.years
+            first, last = (years.sorted[0], years.sorted[-1]) if len(years.sorted) else (0, 0)
+            label = f"{int(low if low is not None else first)}-{int(high if high is not None else last)}"
+            return years.rows(), label
+        return years.rows(since), f"{since} en adelante"
     
-    def _setup_style(self):
-        """Configura el estilo visual de matplotlib y seaborn"""
-        sns.set_style("whitegrid")
-        sns.set_context("notebook", font_scale=1.0)
-        sns.set_palette(CATEGORICAL)
+    def to_plotly(self):
+        """
+        Construye la versión interactiva (Plotly) a partir de prepare()
         
-        # Aplicar configuración de tamaño
-        plt.rcParams['figure.figsize'] = self.figsize
-        plt.rcParams['figure.dpi'] = FIGURE_DPI
+        Returns:
+            Figura de Plotly
+        """
+        raise NotImplementedError(f"{type(self).__name__} no tiene versión interactiva")
+    
+    def save_interactive(self, filepath=None, compress=None):
+        """
+        Guarda la versión interactiva como HTML (plotly.js compartido)
+        
+        Args:
+            filepath: Ruta del HTML o None para usar default
+            compress: Comprimir el JSON de la figura (None = INTERACTIVE_COMPRESS)
+        """
+        filepath = filepath or INTERACTIVE_DIR / f"{self.filename}.html"
+        
+        try:
+            write_interactive_html(self.to_plotly(), filepath, compress=compress, title=self.title)
+            logger.success(f"Guardado: {filepath.name} (interactivo)")
+        except Exception as e:
+            logger.error(f"Error al guardar versión interactiva: {e}")
     
     @abstractmethod
     def create(self):
@@ -75,16 +206,18 @@ class BasePlot(ABC):
         """
         if axis == 'x':
             ax.tick_params(axis='x', labelrotation=rotation)
-            plt.setp(ax.get_xticklabels(), rotation=rotation, ha=ha)
+            setp(ax.get_xticklabels(), rotation=rotation, ha=ha)
         else:
-            plt.setp(ax.get_yticklabels(), ha=ha)
+            setp(ax.get_yticklabels(), ha=ha)
     
     def maximize_window(self):
         """
         Ajusta la ventana al tamaño de la pantalla (sin maximizar completamente)
         """
         try:
-            manager = plt.get_current_fig_manager()
+            manager = getattr(self.fig.canvas, 'manager', None) if self.fig else None
+            if manager is None:
+                return
             
             # Intentar diferentes backends
             if hasattr(manager, 'window'):
@@ -113,29 +246,60 @@ class BasePlot(ABC):
         except Exception as e:
             logger.warning(f"No se pudo ajustar ventana: {e}")
     
-    def save(self, filepath=None):
+    def save(self, filepath=None, targets=None):
         """
-        Guarda el gráfico en archivo PNG de alta resolución
+        Guarda el gráfico en todos los formatos configurados
+        
+        La figura se maqueta y recorta una sola vez; cada destino (PNG a
+        distintos DPI, SVG, PDF) reutiliza ese mismo dibujado.
         
         Args:
-            filepath: Ruta completa o None para usar default
+            filepath: Ruta completa o None para usar default (la extensión
+                      se reemplaza por la de cada destino)
+            targets: Lista de destinos o None para usar self.export_targets
+        
+        Returns:
+            Lista de rutas guardadas
         """
         if filepath is None:
             filepath = IMAGES_DIR / f"{self.filename}.png"
+        filepath = Path(filepath)
         
         try:
-            # Guardar con alta resolución (300 DPI)
-            self.fig.savefig(
-                filepath, 
-                dpi=SAVE_DPI,              # ← Alta resolución para archivo
-                bbox_inches='tight',
-                pad_inches=0.3,
-                facecolor='white',
-                edgecolor='none'
+            written = export_figure(
+                self.fig,
+                filepath.with_suffix(''),
+                targets or self.export_targets,
+                pad_inches=EXPORT_PAD_INCHES
             )
-            logger.success(f"Guardado: {filepath.name}")
+            logger.success(f"Guardado: {', '.join(path.name for path in written)}")
+            return written
         except Exception as e:
             logger.error(f"Error al guardar gráfico: {e}")
+            return []
+    
+    def render(self, fmt='png', dpi=FIGURE_DPI):
+        """
+        Crea el gráfico y lo devuelve como bytes, sin escribir archivos
+        
+        Args:
+            fmt: Formato ('png', 'svg', 'pdf', ...)
+            dpi: Resolución para formatos raster
+        
+        Returns:
+            Bytes de la imagen
+        """
+        try:
+            self.prepare()
+            with theme_scope(self.theme):
+                self.create()
+                with text_layout(self.fig):
+                    self.customize()
+                    if self.fig:
+                        self.fig.tight_layout()
+                    return render_figure(self.fig, fmt, dpi=dpi, pad_inches=EXPORT_PAD_INCHES)
+        finally:
+            close_figure(self.fig)
     
     def show(self):
         """Muestra el gráfico en pantalla con tamaño ajustado"""
@@ -143,38 +307,65 @@ class BasePlot(ABC):
             # Ajustar ventana antes de mostrar
             self.maximize_window()
             
-            # Mostrar
-            plt.show()
+            # Mostrar (solo las figuras creadas para pantalla tienen ventana)
+            if self.fig is not None and getattr(self.fig.canvas, 'manager', None) is not None:
+                import matplotlib.pyplot as plt
+                plt.show()
             
         except Exception as e:
             logger.error(f"Error al mostrar gráfico: {e}")
     
-    def generate(self, show=True, save=True):
+    def generate(self, show=True, save=True, profile=None, interactive=None):
         """
         Genera el gráfico completo (crear + personalizar + guardar + mostrar)
         
         Args:
             show: Si mostrar el gráfico en pantalla
             save: Si guardar el gráfico en archivo
+            profile: Si registrar tiempos por fase (None = usar PROFILING_ENABLED)
+            interactive: Si guardar también el HTML de Plotly (None = INTERACTIVE_EXPORT)
         """
+        interactive = INTERACTIVE_EXPORT if interactive is None else interactive
         logger.info(f"Generando: {self.title}")
         
+        rows = len(self.data) if self.data is not None else None
+        profiler = ChartProfiler(self.filename, rows=rows, enabled=profile).start()
+        self._display = show
+        
         try:
-            self.create()
-            self.customize()
+            with profiler.phase('prepare'):
+                self.prepare()
             
-            # Ajustar layout
-            if self.fig:
-                self.fig.tight_layout()
-            
-            if save:
-                self.save()
+            with theme_scope(self.theme):
+                with profiler.phase('create'):
+                    self.create()
+                with profiler.phase('customize'):
+                    self.customize()
+                
+                # Ajustar layout
+                if self.fig:
+                    with profiler.phase('layout'):
+                        self.fig.tight_layout()
+                
+                if save:
+                    with profiler.phase('save'):
+                        if not self.save():
+                            raise RuntimeError("No se guardó ningún archivo")
+                
+                if save and interactive:
+                    with profiler.phase('interactive'):
+                        self.save_interactive()
+                
+                if show:
+                    with profiler.phase('show'):
+                        self.show()
             
-            if show:
-                self.show()
+            self.profile = profiler.stop()
             
         except Exception as e:
+            self.profile = profiler.stop(status='error', error=e)
             logger.error(f"Error al generar gráfico: {e}")
             raise
         finally:
-            plt.close('all')  
\ No newline at end of file
+            close_figure(self.fig)
+            self._display = False
\ No newline at end of file
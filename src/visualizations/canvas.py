@@ -0,0 +1,158 @@
+"""
+🖼️ LIENZO SIN PYPLOT
+===================
+Figuras de matplotlib creadas con la API orientada a objetos
+
+pyplot guarda un estado global (figura actual, registro de figuras,
+rcParams) que impide renderizar dos gráficos a la vez en un mismo
+proceso: ``plt.close('all')`` de uno destruiría la figura del otro. Aquí
+cada figura es un ``Figure`` con su propio ``FigureCanvasAgg``, fuera del
+registro de pyplot, y el tamaño y la resolución se pasan a cada figura
+en lugar de modificar rcParams.
+
+El estilo lo pone el tema (config/themes.py): el tema por defecto se
+instala una sola vez por proceso, antes de crear la primera figura, y
+los gráficos con otro tema lo aplican solo mientras se renderizan.
+
+Solo las figuras que se van a mostrar en pantalla (``managed=True``) se
+crean con pyplot, que es quien gestiona las ventanas.
+
+new_figure() registra cada figura (referencia débil) para poder contar
+las que siguen vivas después de un gráfico: open_figures() detecta fugas.
+
+El intérprete de mathtext (exponentes de los ejes logarítmicos, p. ej.
+10^5) guarda estado en un objeto compartido por todas las figuras y falla
+si dos hilos lo usan a la vez. Quien maqueta o dibuja una figura desde un
+hilo lo hace dentro de text_layout(fig): las figuras con mathtext se
+dibujan de una en una y el resto sigue en paralelo.
+"""
+import gc
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+from ..config.settings import FIGURE_SIZE, FIGURE_DPI
+from ..config.themes import install_theme
+
+GC_PASSES = 3    # Pasadas máximas del recolector en open_figures
+
+_mathtext_lock = threading.RLock()
+_figures = weakref.WeakSet()    # Figuras creadas con new_figure (las liberadas desaparecen solas)
+
+
+def _uses_mathtext(fig):
+    """Si la figura tiene texto de mathtext: ejes logarítmicos (etiquetas 10^n) o texto con '$'"""
+    for ax in fig.axes:
+        if {'log', 'symlog', 'logit'} & {ax.get_xscale(), ax.get_yscale()}:
+            return True
+    return any('$' in text.get_text() for text in fig.findobj(Text))
+
+
+@contextmanager
+def text_layout(fig):
+    """
+    Maquetación y dibujo de una figura a salvo de otros hilos
+    
+    Si la figura usa mathtext, el bloque se ejecuta con un cerrojo común
+    (el intérprete de matplotlib no admite hilos); si no, sin esperas.
+    """
+    if fig is not None and _uses_mathtext(fig):
+        with _mathtext_lock:
+            yield
+    else:
+        yield
+
+
+def new_figure(figsize=None, dpi=None, managed=False, **kwargs):
+    """
+    Crea una figura independiente
+    
+    Args:
+        figsize: Tamaño (ancho, alto) en pulgadas (usa FIGURE_SIZE si es None)
+        dpi: Resolución de la figura (usa FIGURE_DPI si es None)
+        managed: True para crearla con pyplot y poder mostrarla en una ventana
+        **kwargs: Argumentos adicionales de Figure
+    
+    Returns:
+        Figure de matplotlib
+    """
+    install_theme()
+    figsize = figsize or FIGURE_SIZE
+    dpi = dpi or FIGURE_DPI
+    
+    if managed:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=figsize, dpi=dpi, **kwargs)
+        _figures.add(fig)
+        return fig
+    
+    fig = Figure(figsize=figsize, dpi=dpi, **kwargs)
+    FigureCanvasAgg(fig)
+    _figures.add(fig)
+    return fig
+
+
+def subplots(nrows=1, ncols=1, figsize=None, dpi=None, managed=False, **kwargs):
+    """
+    Equivalente a plt.subplots sobre una figura independiente
+    
+    Args:
+        nrows, ncols: Rejilla de ejes
+        figsize: Tamaño de la figura
+        dpi: Resolución de la figura
+        managed: True si la figura se va a mostrar en pantalla
+        **kwargs: Argumentos de Figure.subplots (subplot_kw, sharex...)
+    
+    Returns:
+        Tupla (figura, ejes)
+    """
+    fig = new_figure(figsize=figsize, dpi=dpi, managed=managed)
+    return fig, fig.subplots(nrows, ncols, **kwargs)
+
+
+def close_figure(fig):
+    """
+    Libera una figura
+    
+    Las figuras independientes se liberan al perder su última referencia;
+    las creadas con pyplot se quitan también de su registro.
+    """
+    if fig is None:
+        return
+    # swarmplot de seaborn sustituye draw en cada colección por un método
+    # ligado a ella; ese ciclo no se libera y retendría la figura entera
+    for ax in fig.axes:
+        for collection in ax.collections:
+            vars(collection).pop('draw', None)
+    if getattr(fig.canvas, 'manager', None) is not None:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+
+
+def open_figures(collect=True):
+    """
+    Número de figuras de matplotlib que siguen vivas en este proceso
+    
+    Cuenta las figuras de new_figure aún referenciadas y las abiertas en
+    pyplot (también las creadas fuera de este módulo). Tras terminar un
+    gráfico debería ser 0; si no, alguna referencia mantiene viva la figura.
+    
+    Args:
+        collect: Ejecutar antes el recolector de basura (ciclos pendientes)
+    """
+    if collect:
+        # Varias pasadas: al liberar un renderer, matplotlib suelta su caché
+        # de medidas de texto (WeakKeyDictionary) y eso libera la figura en
+        # la pasada siguiente
+        for _ in range(GC_PASSES):
+            if not gc.collect():
+                break
+    count = len(_figures)
+    if 'matplotlib.pyplot' in sys.modules:
+        from matplotlib._pylab_helpers import Gcf
+        count += sum(1 for manager in Gcf.get_all_fig_managers() if manager.canvas.figure not in _figures)
+    return count
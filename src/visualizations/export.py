@@ -0,0 +1,190 @@
+"""
+💾 EXPORTACIÓN DE FIGURAS
+========================
+Genera varios archivos (PNG web, PNG impresión, SVG, PDF) a partir de un
+único dibujado de la figura
+
+Estrategia:
+- El layout y el recorte ajustado (bbox 'tight') se calculan una sola vez
+  y se congelan, así ningún formato vuelve a maquetar la figura
+- Los PNG se rasterizan una vez al DPI más alto pedido; los de menor DPI
+  se obtienen reduciendo esa imagen con Pillow
+- SVG y PDF reutilizan el mismo recorte precalculado
+"""
+import io
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from ..config.settings import SAVE_DPI
+
+RASTER_FORMATS = {'png', 'jpg', 'jpeg', 'webp'}
+VECTOR_FORMATS = {'svg', 'pdf', 'eps'}
+
+SAVE_OPTIONS = {
+    'facecolor': 'white',
+    'edgecolor': 'none'
+}
+
+
+def normalize_targets(targets):
+    """
+    Completa y valida la lista de destinos de exportación
+    
+    Args:
+        targets: Lista de diccionarios {'format', 'dpi', 'suffix'}
+    
+    Returns:
+        Lista de diccionarios con todas las claves
+    """
+    normalized = []
+    for target in targets:
+        fmt = target.get('format', 'png').lower()
+        if fmt not in RASTER_FORMATS | VECTOR_FORMATS:
+            raise ValueError(f"Formato de exportación no soportado: {fmt}")
+        normalized.append({
+            'format': fmt,
+            'dpi': target.get('dpi', SAVE_DPI),
+            'suffix': target.get('suffix', '')
+        })
+    return normalized
+
+
+@contextmanager
+def _frozen_layout(fig):
+    """
+    Desactiva el motor de layout de una figura mientras se guarda
+    
+    'none' deja un motor que no maqueta (sin consultar rcParams, que son
+    globales al proceso) y al salir se restaura el original.
+    """
+    engine = fig.get_layout_engine()
+    fig.set_layout_engine('none')
+    try:
+        yield fig
+    finally:
+        if engine is not None:
+            fig.set_layout_engine(engine)
+
+
+def _tight_bbox(fig, pad_inches):
+    """Dibuja la figura sin rasterizar y devuelve el recorte ajustado (pulgadas)"""
+    fig.draw_without_rendering()
+    return fig.get_tightbbox().padded(pad_inches)
+
+
+def _render_rgba(fig, bbox, dpi):
+    """
+    Rasteriza la figura recortada a un array RGBA
+    
+    Returns:
+        Array (alto, ancho, 4) de uint8
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='rgba', dpi=dpi, bbox_inches=bbox, **SAVE_OPTIONS)
+    raw = np.frombuffer(buffer.getbuffer(), dtype=np.uint8)
+    
+    # Mismo truncado que el renderizador Agg
+    width, height = int(bbox.width * dpi), int(bbox.height * dpi)
+    if width * height * 4 != raw.size:
+        # Redondeo distinto: leer las dimensiones desde un PNG
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi, bbox_inches=bbox, **SAVE_OPTIONS)
+        buffer.seek(0)
+        return np.asarray(Image.open(buffer).convert('RGBA'))
+    return raw.reshape(height, width, 4)
+
+
+def _save_raster(image, path, fmt, dpi):
+    """Guarda una imagen de Pillow con el formato y los metadatos de DPI"""
+    if fmt in ('jpg', 'jpeg'):
+        image.convert('RGB').save(path, format='JPEG', dpi=(dpi, dpi), quality=92)
+    elif fmt == 'webp':
+        image.save(path, format='WEBP', quality=92)
+    else:
+        image.save(path, format='PNG', dpi=(dpi, dpi))
+
+
+def export_figure(fig, base_path, targets, pad_inches=0.3):
+    """
+    Exporta una figura a todos los destinos con un solo layout
+    
+    Args:
+        fig: Figure de matplotlib
+        base_path: Ruta sin extensión (carpeta + nombre base)
+        targets: Lista de destinos {'format', 'dpi', 'suffix'}
+        pad_inches: Margen alrededor del recorte ajustado
+    
+    Returns:
+        Lista de rutas generadas
+    """
+    base_path = Path(base_path)
+    targets = normalize_targets(targets)
+    
+    def path_for(target):
+        return base_path.with_name(f"{base_path.name}{target['suffix']}.{target['format']}")
+    
+    bbox = _tight_bbox(fig, pad_inches)
+    
+    # Congelar el layout: sin motor de layout, savefig no vuelve a
+    # maquetar la figura antes de cada formato
+    with _frozen_layout(fig):
+        written = _export_frozen(fig, bbox, targets, path_for)
+    
+    return written
+
+
+def render_figure(fig, fmt='png', dpi=SAVE_DPI, pad_inches=0.3):
+    """
+    Renderiza una figura a bytes en memoria (mismo recorte que export_figure)
+    
+    Args:
+        fig: Figure de matplotlib
+        fmt: Formato ('png', 'svg', 'pdf', ...)
+        dpi: Resolución para formatos raster
+        pad_inches: Margen alrededor del recorte ajustado
+    
+    Returns:
+        Bytes del archivo
+    """
+    fmt = normalize_targets([{'format': fmt, 'dpi': dpi}])[0]['format']
+    bbox = _tight_bbox(fig, pad_inches)
+    buffer = io.BytesIO()
+    
+    with _frozen_layout(fig):
+        if fmt in RASTER_FORMATS:
+            _save_raster(Image.fromarray(_render_rgba(fig, bbox, dpi)), buffer, fmt, dpi)
+        else:
+            fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches=bbox, **SAVE_OPTIONS)
+    
+    return buffer.getvalue()
+
+
+def _export_frozen(fig, bbox, targets, path_for):
+    """Escribe los destinos con el layout y el recorte ya fijados"""
+    written = []
+    raster = [t for t in targets if t['format'] in RASTER_FORMATS]
+    if raster:
+        max_dpi = max(t['dpi'] for t in raster)
+        pixels = _render_rgba(fig, bbox, max_dpi)
+        full = Image.fromarray(pixels)
+        
+        for target in raster:
+            image = full
+            if target['dpi'] != max_dpi:
+                scale = target['dpi'] / max_dpi
+                size = (max(1, round(full.width * scale)), max(1, round(full.height * scale)))
+                image = full.resize(size, Image.Resampling.LANCZOS)
+            path = path_for(target)
+            _save_raster(image, path, target['format'], target['dpi'])
+            written.append(path)
+    
+    for target in targets:
+        if target['format'] in VECTOR_FORMATS:
+            path = path_for(target)
+            fig.savefig(path, format=target['format'], dpi=target['dpi'],
+                        bbox_inches=bbox, **SAVE_OPTIONS)
+            written.append(path)
+    
+    return written
@@ -0,0 +1,209 @@
+"""
+🌐 EXPORTACIÓN INTERACTIVA (PLOTLY)
+==================================
+Escribe gráficos de Plotly como HTML compactos que comparten un único
+plotly.js en output/interactive/
+
+Características:
+- plotly.js (~4.5 MB) se copia una sola vez y cada HTML lo referencia
+- Opcionalmente, el JSON de la figura se guarda comprimido (gzip + base64)
+  y el navegador lo descomprime con DecompressionStream
+- Utilidades para que los gráficos de matplotlib construyan su versión
+  Plotly a partir de agregados ya calculados (histogramas, KDE, cajas)
+"""
+import base64
+import gzip
+import html
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import plotly.offline
+from ..config.settings import INTERACTIVE_DIR, INTERACTIVE_COMPRESS
+from ..utils.logger import Logger
+
+logger = Logger(__name__)
+
+PLOTLY_CONFIG = {'responsive': True, 'displaylogo': False}
+
+_bundle_lock = threading.Lock()
+
+COMPRESSED_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotlyjs}"></script>
+</head>
+<body style="margin:0">
+<div id="{div_id}" style="width:100%;height:100vh"></div>
+<script id="{div_id}-data" type="application/octet-stream">{payload}</script>
+<script>
+(async function () {{
+    const b64 = document.getElementById("{div_id}-data").textContent.trim();
+    const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+    const figure = JSON.parse(await new Response(stream).text());
+    Plotly.newPlot("{div_id}", figure.data, figure.layout, {config});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def plotlyjs_bundle(directory=None):
+    """
+    Devuelve la ruta del plotly.js compartido, escribiéndolo si no existe
+    
+    El nombre incluye la versión, así una actualización de Plotly no
+    reutiliza un bundle antiguo.
+    
+    Args:
+        directory: Carpeta de salida (usa INTERACTIVE_DIR si es None)
+    
+    Returns:
+        Path del archivo plotly-<versión>.min.js
+    """
+    directory = Path(directory or INTERACTIVE_DIR)
+    path = directory / f"plotly-{plotly.offline.get_plotlyjs_version()}.min.js"
+    
+    with _bundle_lock:
+        if not path.exists():
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(plotly.offline.get_plotlyjs(), encoding='utf-8')
+            tmp_path.replace(path)
+            logger.info(f"plotly.js compartido: {path.name}")
+    
+    return path
+
+
+def interactive_html(fig, plotlyjs_src, compress=None, title=None):
+    """
+    Genera el HTML de una figura que carga plotly.js desde una URL
+    
+    Args:
+        fig: Figura de Plotly
+        plotlyjs_src: URL (relativa o absoluta) del plotly.js compartido
+        compress: Incrustar el JSON comprimido (usa INTERACTIVE_COMPRESS si es None)
+        title: Título de la página (opcional)
+    
+    Returns:
+        Texto HTML
+    """
+    compress = INTERACTIVE_COMPRESS if compress is None else compress
+    
+    if not compress:
+        return fig.to_html(include_plotlyjs=plotlyjs_src, config=PLOTLY_CONFIG)
+    
+    slug = ''.join(c if c.isalnum() else '-' for c in (title or 'figure'))[:40]
+    payload = base64.b64encode(gzip.compress(fig.to_json().encode('utf-8'), mtime=0)).decode('ascii')
+    return COMPRESSED_TEMPLATE.format(
+        title=html.escape(title or 'Plotly'),
+        plotlyjs=plotlyjs_src,
+        div_id=f"plot-{slug}",
+        payload=payload,
+        config=json.dumps(PLOTLY_CONFIG)
+    )
+
+
+def write_interactive_html(fig, filepath, compress=None, title=None):
+    """
+    Guarda una figura de Plotly como HTML que referencia el plotly.js compartido
+    
+    Args:
+        fig: Figura de Plotly
+        filepath: Ruta del archivo .html
+        compress: Guardar el JSON comprimido (usa INTERACTIVE_COMPRESS si es None)
+        title: Título de la página (opcional)
+    
+    Returns:
+        Path del HTML escrito
+    """
+    filepath = Path(filepath)
+    bundle = plotlyjs_bundle(filepath.parent)
+    src = Path(os.path.relpath(bundle, filepath.parent)).as_posix()
+    
+    filepath.write_text(interactive_html(fig, src, compress=compress, title=title or filepath.stem),
+                        encoding='utf-8')
+    return filepath
+
+
+# === AGREGADOS COMPARTIDOS ===
+
+def histogram(values, bins=30):
+    """
+    Cuenta valores por intervalo
+    
+    Args:
+        values: Serie o array numérico
+        bins: Número de intervalos o array de bordes
+    
+    Returns:
+        Tupla (centros, anchos, conteos)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    return (edges[:-1] + edges[1:]) / 2, np.diff(edges), counts
+
+
+def kde_curve(values, points=200, grid_size=1024):
+    """
+    Curva de densidad gaussiana (ancho de banda de Scott) por convolución
+    
+    Los valores se agrupan primero en una rejilla fina, por lo que el coste
+    es lineal en el número de filas.
+    
+    Args:
+        values: Serie o array numérico
+        points: Puntos de la curva resultante
+        grid_size: Tamaño de la rejilla de agrupación
+    
+    Returns:
+        Tupla (x, densidad) o (array vacío, array vacío) si no hay datos
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if len(values) < 2 or values.std() == 0:
+        return np.empty(0), np.empty(0)
+    
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+    low, high = values.min() - 3 * bandwidth, values.max() + 3 * bandwidth
+    counts, edges = np.histogram(values, bins=grid_size, range=(low, high))
+    step = edges[1] - edges[0]
+    
+    half = int(4 * bandwidth / step) + 1
+    kernel = np.exp(-0.5 * (np.arange(-half, half + 1) * step / bandwidth) ** 2)
+    density = np.convolve(counts, kernel)[half:half + grid_size]
+    density /= density.sum() * step
+    
+    centers = (edges[:-1] + edges[1:]) / 2
+    x = np.linspace(low, high, points)
+    return x, np.interp(x, centers, density)
+
+
+def box_stats(values):
+    """
+    Estadísticos de un diagrama de caja (bigotes a 1.5 × IQR)
+    
+    Returns:
+        Diccionario con q1, median, q3, lowerfence y upperfence
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return None
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    return {
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'lowerfence': inside.min(),
+        'upperfence': inside.max()
+    }
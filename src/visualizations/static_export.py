@@ -0,0 +1,210 @@
+"""
+🖼️ EXPORTACIÓN ESTÁTICA EN SEGUNDO PLANO (PLOTLY)
+================================================
+Worker de larga duración que convierte figuras de Plotly a PNG con kaleido
+
+Kaleido arranca un navegador sin interfaz para cada conversión aislada,
+lo que tarda varios segundos. El worker se inicia una vez por lote, prepara
+kaleido en su propio hilo mientras se generan los gráficos de matplotlib y
+recibe las figuras por una cola, así el arranque se paga una sola vez.
+
+En los lotes (service/batch.py) los gráficos se generan en procesos
+worker: el StaticExportWorker corre en el proceso principal del lote y
+cada proceso worker instala un ExportForwarder que le envía las figuras
+por su tubería.
+"""
+import queue
+import threading
+import time
+from pathlib import Path
+
+import plotly.io as pio
+from ..config.settings import STATIC_EXPORT_TIMEOUT
+from ..utils.logger import Logger
+
+logger = Logger(__name__)
+
+_active_worker = None
+_active_lock = threading.Lock()
+
+
+def get_export_worker():
+    """
+    Devuelve el worker activo del lote actual
+    
+    Returns:
+        StaticExportWorker (o ExportForwarder) o None si no hay ninguno en marcha
+    """
+    return _active_worker
+
+
+def _activate(worker):
+    """Registra el worker activo de este proceso"""
+    global _active_worker
+    with _active_lock:
+        _active_worker = worker
+
+
+def _deactivate(worker):
+    """Quita el worker activo si sigue siendo ``worker``"""
+    global _active_worker
+    with _active_lock:
+        if _active_worker is worker:
+            _active_worker = None
+
+
+class StaticExportWorker:
+    """
+    Hilo exportador alimentado por una cola
+    
+    Uso:
+        >>> with StaticExportWorker():
+        ...     sankey_diagram(data)   # El PNG se encola y no bloquea
+    """
+    
+    def __init__(self, timeout=STATIC_EXPORT_TIMEOUT):
+        """
+        Args:
+            timeout: Segundos máximos de espera al cerrar el worker
+        """
+        self.timeout = timeout
+        self.completed = []       # Rutas exportadas
+        self.failed = []          # (ruta, mensaje de error)
+        self._queue = queue.Queue()
+        self._thread = None
+        self._server_started = False
+    
+    def start(self, activate=True):
+        """
+        Inicia el hilo exportador
+        
+        Args:
+            activate: Registrarlo como worker activo de este proceso (False
+                si solo recibe figuras de otros procesos)
+        """
+        if self._thread is not None:
+            return self
+        
+        self._thread = threading.Thread(target=self._run, name='static-export', daemon=True)
+        self._thread.start()
+        
+        if activate:
+            _activate(self)
+        return self
+    
+    def submit(self, fig, filepath, **options):
+        """
+        Encola una figura para exportarla
+        
+        Args:
+            fig: Figura de Plotly (se copia como diccionario al encolar) o su diccionario
+            filepath: Ruta del archivo de salida
+            **options: width, height, scale... (igual que write_image)
+        """
+        self._queue.put((fig.to_dict() if hasattr(fig, 'to_dict') else fig, Path(filepath), options))
+    
+    def close(self, wait=True):
+        """
+        Detiene el worker tras exportar lo pendiente
+        
+        Args:
+            wait: Si esperar a que terminen las exportaciones encoladas
+        
+        Returns:
+            Tupla (exportados, fallidos)
+        """
+        _deactivate(self)
+        
+        if self._thread is None:
+            return len(self.completed), len(self.failed)
+        
+        self._queue.put(None)
+        if wait:
+            self._thread.join(self.timeout)
+            if self._thread.is_alive():
+                logger.warning(f"Exportación estática sin terminar tras {self.timeout}s")
+        self._thread = None
+        return len(self.completed), len(self.failed)
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def _start_server(self):
+        """Arranca kaleido por adelantado (kaleido >= 1.1 mantiene el navegador abierto)"""
+        try:
+            import kaleido
+        except ImportError:
+            return
+        start = getattr(kaleido, 'start_sync_server', None)
+        if start is None:
+            # kaleido 0.x ya reutiliza su subproceso dentro del mismo proceso
+            return
+        try:
+            start(silence_warnings=True)
+            self._server_started = True
+        except Exception as e:
+            logger.warning(f"No se pudo preparar kaleido: {e}")
+    
+    def _stop_server(self):
+        if not self._server_started:
+            return
+        import kaleido
+        try:
+            kaleido.stop_sync_server(silence_warnings=True)
+        except Exception:
+            pass
+        self._server_started = False
+    
+    def _run(self):
+        """Bucle del hilo: prepara kaleido y exporta cada figura recibida"""
+        self._start_server()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                fig, filepath, options = item
+                t0 = time.perf_counter()
+                try:
+                    pio.write_image(fig, filepath, **options)
+                    self.completed.append(filepath)
+                    logger.success(f"Guardado: {filepath.name} ({time.perf_counter() - t0:.1f}s, en segundo plano)")
+                except Exception as e:
+                    self.failed.append((filepath, str(e)))
+                    logger.warning(f"No se pudo guardar PNG (instala kaleido): {e}")
+        finally:
+            self._stop_server()
+
+
+class ExportForwarder:
+    """
+    Exportador de un proceso worker: envía las figuras al StaticExportWorker
+    del proceso principal en lugar de exportarlas aquí
+    
+    Uso:
+        >>> ExportForwarder(lambda item: conn.send(('export', item))).start()
+    """
+    
+    def __init__(self, send):
+        """
+        Args:
+            send: Función que recibe (diccionario de la figura, ruta, opciones)
+        """
+        self._send = send
+    
+    def start(self):
+        """Lo registra como worker activo de este proceso"""
+        _activate(self)
+        return self
+    
+    def submit(self, fig, filepath, **options):
+        """Envía una figura (como diccionario) para exportarla"""
+        self._send((fig.to_dict(), Path(filepath), options))
+    
+    def close(self):
+        """Deja de reenviar figuras (las siguientes se exportan en este proceso)"""
+        _deactivate(self)
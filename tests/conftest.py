@@ -0,0 +1,62 @@
+"""
+🧪 CONFIGURACIÓN DE PRUEBAS
+==========================
+Datos pequeños y deterministas con el esquema de Spotify
+
+Ejecutar desde la raíz del proyecto:
+    python -m pytest -q
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def numeric_frame():
+    """Columnas numéricas correlacionadas, con nulos dispersos"""
+    rng = np.random.default_rng(7)
+    n = 5_000
+    base = rng.normal(size=n)
+    data = pd.DataFrame({
+        'a': base,
+        'b': 2 * base + rng.normal(scale=0.5, size=n),
+        'c': -base + rng.normal(scale=2.0, size=n),
+        'd': rng.integers(0, 10, size=n).astype(float)
+    })
+    for column, share in (('b', 0.05), ('c', 0.2)):
+        data.loc[rng.random(n) < share, column] = np.nan
+    return data
+
+
+@pytest.fixture
+def tracks():
+    """Canciones limpias (un artista con tres grafías distintas)"""
+    return pd.DataFrame({
+        'track_id': [f't{i}' for i in range(8)],
+        'track_name': [f'Song {i}' for i in range(8)],
+        'track_popularity': [80, 60, 40, 90, 10, 55, 70, 30],
+        'explicit': [True, False, True, False, False, True, False, False],
+        'artist_name': ['Drake', 'DRAKE', 'drake', 'Adele', 'Adele', 'The Weeknd', None, 'Sia'],
+        'artist_followers': [1000, 1000, 1000, 500, 500, 800, 10, 300],
+        'artist_genres': ["['Hip Hop', 'rap']", "['hip hop']", "['rap']", "['pop', 'soul']",
+                          "['pop']", "['R&B']", None, "['Pop']"],
+        'album_name': ['A', 'A', 'B', 'C', 'D', 'E', 'F', 'G'],
+        'album_type': ['album', 'single', 'album', 'album', 'single', 'album', 'compilation', 'single'],
+        'track_duration_min': [3.0, 3.5, 4.0, 4.5, 2.5, 3.2, 3.8, 4.1],
+        'year': [2015.0, 2018.0, 2020.0, 2011.0, 2016.0, 2020.0, np.nan, 2010.0]
+    })
+
+
+@pytest.fixture
+def raw_csv(tmp_path):
+    """CSV crudo sintético (duplicados, faltantes, fechas con precisión mixta)"""
+    from benchmarks.synthetic import generate
+    path = tmp_path / 'raw.csv'
+    for i, chunk in enumerate(generate(3_000, seed=3, chunk_rows=1_000)):
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+    return path
@@ -0,0 +1,123 @@
+"""Caché de renderizados: expulsión LRU por tamaño, ETags y uso desde ChartRenderer"""
+import os
+import threading
+
+import pytest
+
+from src.data.cleaner import DataCleaner
+from src.data.loader import DataLoader
+from src.service.cache import RenderCache, RenderedChart
+from src.service.renderer import ChartRenderer
+
+
+def chart(size, fill=b'x'):
+    return RenderedChart(fill * size, 'image/png')
+
+
+def test_etag_depends_only_on_the_body():
+    assert chart(10).etag == chart(10).etag
+    assert chart(10).etag != chart(10, b'y').etag
+    assert chart(10).etag.startswith('"') and chart(10).etag.endswith('"')
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = RenderCache(max_bytes=30)
+    for key in 'abc':
+        cache.put(key, chart(10))
+    
+    cache.get('a')                  # 'b' pasa a ser la menos usada
+    cache.put('d', chart(10))
+    
+    assert cache.get('b') is None
+    assert all(cache.get(key) is not None for key in 'acd')
+    assert cache.size == 30
+
+
+def test_replacing_a_key_updates_the_size():
+    cache = RenderCache(max_bytes=100)
+    cache.put('a', chart(40))
+    cache.put('a', chart(10))
+    
+    assert cache.size == 10
+    assert cache.stats()['entries'] == 1
+
+
+def test_large_entry_evicts_several_and_oversized_entry_is_not_stored():
+    cache = RenderCache(max_bytes=30)
+    for key in 'abc':
+        cache.put(key, chart(10))
+    
+    cache.put('big', chart(25))
+    cache.put('huge', chart(31))
+    
+    assert cache.get('huge') is None
+    assert cache.get('big') is not None
+    assert [cache.get(key) for key in 'ab'] == [None, None]
+    assert cache.size == 25
+
+
+def test_stats_count_hits_and_misses():
+    cache = RenderCache(max_bytes=1024 ** 2)
+    cache.put('a', chart(1024))
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+    
+    stats = cache.stats()
+    
+    assert (stats['hits'], stats['misses'], stats['entries']) == (2, 1, 1)
+    assert stats['max_mb'] == 1.0
+    cache.clear()
+    assert cache.size == 0 and cache.get('a') is None
+
+
+def test_concurrent_puts_keep_the_size_consistent():
+    cache = RenderCache(max_bytes=500)
+    
+    def fill(offset):
+        for i in range(500):
+            cache.put((offset, i % 37), chart(1 + i % 13))
+            cache.get((offset, (i * 7) % 37))
+    
+    threads = [threading.Thread(target=fill, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert cache.size == sum(len(entry.body) for entry in cache._entries.values())
+    assert cache.size <= cache.max_bytes
+
+
+@pytest.fixture
+def renderer(raw_csv, tmp_path):
+    cleaner = DataCleaner(DataLoader().load_raw_data(raw_csv))
+    cleaner.clean()
+    cleaner.save(tmp_path / 'limpio.csv', shared=False)
+    renderer = ChartRenderer(tmp_path / 'limpio.csv', workers=2, executor='thread')
+    yield renderer
+    renderer.close()
+
+
+def test_renderer_serves_repeated_requests_from_the_cache(renderer):
+    first = renderer.get('06_pareto', 'svg')
+    again = renderer.get('06_pareto', 'svg')
+    other = renderer.get('06_pareto', 'svg', theme='spotify_dark')
+    
+    assert again is first
+    assert other.etag != first.etag
+    assert first.content_type == 'image/svg+xml'
+    assert renderer.cache.stats()['hits'] == 1
+
+
+def test_renderer_drops_the_cache_when_the_data_changes(renderer):
+    first = renderer.get('06_pareto', 'svg')
+    stat = renderer.source.stat()
+    with open(renderer.source, 'a', encoding='utf-8') as handle:
+        handle.write('\n')
+    os.utime(renderer.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    
+    second = renderer.get('06_pareto', 'svg')
+    
+    assert second is not first
+    assert renderer.cache.stats()['entries'] == 1
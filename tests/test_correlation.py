@@ -0,0 +1,91 @@
+"""Correlación incremental frente a DataFrame.corr()"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.correlation import (
+    RankSketch,
+    StreamingCorrelation,
+    correlation_matrix,
+    iter_frame_chunks
+)
+
+
+def test_pearson_matches_pandas_with_missing_values(numeric_frame):
+    columns = list(numeric_frame.columns)
+    
+    result = correlation_matrix(lambda: iter_frame_chunks(numeric_frame, columns, chunksize=333), columns)
+    
+    pd.testing.assert_frame_equal(result, numeric_frame.corr(), atol=1e-10)
+
+
+def test_pearson_does_not_depend_on_chunk_size(numeric_frame):
+    columns = list(numeric_frame.columns)
+    
+    whole = StreamingCorrelation(columns).update(numeric_frame).result()
+    chunked = correlation_matrix(lambda: iter_frame_chunks(numeric_frame, columns, chunksize=1), columns)
+    
+    pd.testing.assert_frame_equal(chunked, whole, atol=1e-10)
+
+
+def test_merge_combines_partial_accumulators(numeric_frame):
+    columns = list(numeric_frame.columns)
+    half = len(numeric_frame) // 2
+    
+    first = StreamingCorrelation(columns).update(numeric_frame.iloc[:half])
+    second = StreamingCorrelation(columns).update(numeric_frame.iloc[half:])
+    
+    pd.testing.assert_frame_equal(first.merge(second).result(), numeric_frame.corr(), atol=1e-10)
+
+
+def test_constant_column_gives_nan():
+    data = pd.DataFrame({'x': [1.0, 2.0, 3.0], 'y': [5.0, 5.0, 5.0]})
+    
+    result = StreamingCorrelation(['x', 'y']).update(data).result()
+    
+    assert np.isnan(result.loc['x', 'y'])
+    assert result.loc['x', 'x'] == pytest.approx(1.0)
+
+
+def test_spearman_is_exact_when_the_sample_holds_every_row(numeric_frame):
+    data = numeric_frame.dropna()
+    columns = list(data.columns)
+    
+    result = correlation_matrix(lambda: iter_frame_chunks(data, columns, chunksize=500), columns,
+                                method='spearman')
+    
+    pd.testing.assert_frame_equal(result, data.corr(method='spearman'), atol=1e-10)
+
+
+def test_spearman_approximation_on_sampled_ranks(numeric_frame):
+    data = numeric_frame.dropna()
+    columns = list(data.columns)
+    sketch = RankSketch(columns, sample_size=1_000)
+    accumulator = StreamingCorrelation(columns)
+    
+    for chunk in iter_frame_chunks(data, columns, chunksize=500):
+        sketch.update(chunk)
+    for chunk in iter_frame_chunks(data, columns, chunksize=500):
+        accumulator.update(sketch.ranks(chunk))
+    
+    np.testing.assert_allclose(accumulator.result(), data.corr(method='spearman'), atol=0.02)
+
+
+def test_unknown_method_is_rejected(numeric_frame):
+    with pytest.raises(ValueError):
+        correlation_matrix(lambda: iter([numeric_frame]), list(numeric_frame.columns), method='kendall')
+
+
+def test_heatmap_streams_only_the_columns_in_the_csv(tmp_path, numeric_frame):
+    import importlib
+    from src.config.settings import NUMERIC_COLUMNS
+    heatmap = importlib.import_module('src.visualizations.02_mapa_calor')
+    present = NUMERIC_COLUMNS[1:4]
+    data = pd.DataFrame({column: numeric_frame[name]
+                         for column, name in zip(present, numeric_frame.columns)})
+    data.to_csv(tmp_path / 'limpio.csv', index=False)
+    
+    result = heatmap.MapaCalor(source=tmp_path / 'limpio.csv').aggregate()['correlation']
+    
+    assert list(result.columns) == present
+    pd.testing.assert_frame_equal(result, data.corr(), atol=1e-10)
@@ -0,0 +1,81 @@
+"""Fechas de lanzamiento de precisión mixta y su paso por el dataset compartido"""
+import numpy as np
+import pandas as pd
+
+from src.data.dates import PRECISION_COLUMN, PRECISIONS, parse_release_dates
+from src.data.loader import DataLoader
+from src.data.shared import SharedDataset, write_shared
+
+
+def test_each_precision_is_parsed_with_its_own_format():
+    values = pd.Series(['2019-05-17', '2019-05', '2019', '2019-05-17'], index=[10, 11, 12, 13])
+    
+    dates, precision, year = parse_release_dates(values)
+    
+    assert list(dates) == [pd.Timestamp('2019-05-17'), pd.Timestamp('2019-05-01'),
+                           pd.Timestamp('2019-01-01'), pd.Timestamp('2019-05-17')]
+    assert list(precision) == ['day', 'month', 'year', 'day']
+    assert list(precision.cat.categories) == list(PRECISIONS)
+    assert precision.name == PRECISION_COLUMN
+    assert year.dtype == 'Int16'
+    assert list(year) == [2019] * 4
+    assert list(dates.index) == list(precision.index) == list(year.index) == [10, 11, 12, 13]
+
+
+def test_missing_and_invalid_values_are_null_in_every_output():
+    values = pd.Series(['1999', None, '', 'no date', '2020-13', '2021-02-30'])
+    
+    dates, precision, year = parse_release_dates(values)
+    
+    assert dates.iloc[0] == pd.Timestamp('1999-01-01')
+    assert dates.iloc[1:].isna().all()
+    assert precision.iloc[1:].isna().all()
+    assert year.iloc[1:].isna().all()
+
+
+def test_unusual_shapes_fall_back_to_per_value_parsing():
+    values = pd.Series([' 2019-05-17 ', '2019-5-7', '2019-05-17T00:00:00'])
+    
+    dates, precision, _ = parse_release_dates(values)
+    
+    assert list(dates) == [pd.Timestamp('2019-05-17'), pd.Timestamp('2019-05-07'), pd.Timestamp('2019-05-17')]
+    assert list(precision) == ['day', 'day', 'day']
+
+
+def test_categorical_input_gives_the_same_result():
+    values = pd.Series(['2019', '2019-05', None, '2019', '2001-01-31'])
+    
+    expected = parse_release_dates(values)
+    result = parse_release_dates(values.astype('category'))
+    
+    for left, right in zip(result, expected):
+        pd.testing.assert_series_equal(left, right)
+
+
+def test_clean_csv_keeps_the_original_precision(tmp_path):
+    pd.DataFrame({
+        'track_id': ['a', 'b', 'c'],
+        'album_release_date': ['2019-01-01', '2019-05-01', '2019-05-17'],
+        PRECISION_COLUMN: ['year', 'month', 'day']
+    }).to_csv(tmp_path / 'limpio.csv', index=False)
+    
+    data = DataLoader().load_clean_data(tmp_path / 'limpio.csv')
+    
+    assert list(data[PRECISION_COLUMN]) == ['year', 'month', 'day']
+    assert list(data['year']) == [2019, 2019, 2019]
+    assert data['year'].dtype == 'Int16'
+
+
+def test_shared_dataset_keeps_nullable_years_and_date_unit(tmp_path):
+    dates, precision, year = parse_release_dates(pd.Series(['2019', None, '2020-02-29']))
+    frame = pd.DataFrame({'album_release_date': dates.astype('datetime64[s]'),
+                          PRECISION_COLUMN: precision, 'year': year})
+    
+    shared = SharedDataset(write_shared(frame, tmp_path / 'shared')).frame()
+    
+    assert shared['year'].dtype == 'Int16'
+    assert shared['year'].isna().tolist() == [False, True, False]
+    assert shared['album_release_date'].dtype == np.dtype('datetime64[s]')
+    assert shared['album_release_date'].iloc[2] == pd.Timestamp('2020-02-29')
+    assert shared[PRECISION_COLUMN].isna().tolist() == [False, True, False]
+    assert shared[PRECISION_COLUMN].dropna().tolist() == ['year', 'day']
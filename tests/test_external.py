@@ -0,0 +1,74 @@
+"""Ordenación externa y limpieza por bloques frente a la limpieza en memoria"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.cleaner import DataCleaner
+from src.data.external import ExternalSorter, ROW_COLUMN
+from src.data.loader import DataLoader
+
+
+@pytest.fixture
+def unsorted():
+    """Bloque con empates, nulos y una clave de texto"""
+    rng = np.random.default_rng(11)
+    n = 2_000
+    frame = pd.DataFrame({
+        'score': rng.integers(0, 20, n).astype(float),
+        'name': rng.choice(['a', 'b', 'c'], n),
+        'payload': rng.normal(size=n)
+    })
+    frame.loc[rng.random(n) < 0.1, 'score'] = np.nan
+    frame[ROW_COLUMN] = np.arange(n)
+    return frame
+
+
+def sort_in_blocks(frame, by, ascending, budget_mb, rows=50):
+    with ExternalSorter(by, ascending=ascending, budget_mb=budget_mb) as sorter:
+        for start in range(0, len(frame), rows):
+            sorter.add(frame.iloc[start:start + rows])
+        spilled = len(sorter.runs)
+        result = pd.concat(list(sorter.sorted_blocks()), ignore_index=True)
+    return result, spilled
+
+
+@pytest.mark.parametrize('budget_mb', [0.001, 0.05, 100])
+def test_external_sort_matches_stable_sort(unsorted, budget_mb):
+    by, ascending = ['score', 'name'], [False, True]
+    expected = unsorted.sort_values(by + [ROW_COLUMN], ascending=ascending + [True], ignore_index=True)
+    
+    result, spilled = sort_in_blocks(unsorted, by, ascending, budget_mb)
+    
+    pd.testing.assert_frame_equal(result, expected)
+    assert (spilled > 0) == (budget_mb < 1)
+
+
+def test_external_sort_without_keys_keeps_input_order(unsorted):
+    shuffled = unsorted.sample(frac=1, random_state=0)
+    
+    result, _ = sort_in_blocks(shuffled, [], None, 0.001)
+    
+    np.testing.assert_array_equal(result[ROW_COLUMN], np.arange(len(unsorted)))
+
+
+def test_sorter_removes_its_runs(unsorted):
+    with ExternalSorter(['score'], budget_mb=0.001) as sorter:
+        for start in range(0, len(unsorted), 50):
+            sorter.add(unsorted.iloc[start:start + 50])
+        directory = sorter.runs[0].path.parent
+        assert directory.exists()
+    
+    assert not directory.exists()
+
+
+@pytest.mark.parametrize('budget_mb, chunksize', [(0.02, 97), (0.2, 500), (100, None)])
+def test_clean_external_matches_clean_in_memory(raw_csv, tmp_path, budget_mb, chunksize):
+    cleaner = DataCleaner(DataLoader().load_raw_data(raw_csv))
+    cleaner.clean()
+    cleaner.save(tmp_path / 'memoria.csv', shared=False)
+    
+    written = DataCleaner.clean_external(raw_csv, tmp_path / 'externa.csv', budget_mb=budget_mb,
+                                         chunksize=chunksize)
+    
+    assert written == len(cleaner.data)
+    assert (tmp_path / 'externa.csv').read_bytes() == (tmp_path / 'memoria.csv').read_bytes()
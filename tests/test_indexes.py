@@ -0,0 +1,83 @@
+"""Índices secundarios: categorías, rangos, géneros y búsquedas sin mayúsculas"""
+import numpy as np
+
+from src.data.dataset import as_dataset
+from src.data.filters import DataFilter
+from src.data.genres import GenreIndex
+from src.data.indexes import CategoryIndex, SortedIndex, dataset_index
+from src.utils.helpers import compare_artists
+
+
+def test_category_rows_match_a_column_scan(tracks):
+    index = CategoryIndex(tracks['album_type'])
+    
+    for value in tracks['album_type'].unique():
+        np.testing.assert_array_equal(index.rows(value), np.flatnonzero(tracks['album_type'] == value))
+    assert len(index.rows('ep')) == 0
+
+
+def test_category_rows_in_and_mask(tracks):
+    index = CategoryIndex(tracks['album_type'])
+    expected = tracks['album_type'].isin(['single', 'compilation', 'ep'])
+    
+    np.testing.assert_array_equal(index.rows_in(['single', 'compilation', 'ep']), np.flatnonzero(expected))
+    np.testing.assert_array_equal(index.mask(['single', 'compilation', 'ep']), expected.to_numpy())
+
+
+def test_case_insensitive_lookup_finds_every_spelling(tracks):
+    index = CategoryIndex(tracks['artist_name'])
+    
+    np.testing.assert_array_equal(index.rows('drake', case=False), [0, 1, 2])
+    np.testing.assert_array_equal(index.rows('DrAkE', case=False), [0, 1, 2])
+    np.testing.assert_array_equal(index.rows('drake'), [2])
+    assert len(index.codes_of('drake', case=False)) == 3
+    assert index.mask(['DRAKE', 'sia'], case=False).sum() == 4
+
+
+def test_case_insensitive_lookup_ignores_nulls(tracks):
+    index = CategoryIndex(tracks['artist_name'])
+    
+    assert len(index.rows('none', case=False)) == 0
+    assert len(index.rows('nan', case=False)) == 0
+
+
+def test_artist_helpers(tracks):
+    index = dataset_index(tracks)
+    
+    np.testing.assert_array_equal(index.artist_rows('drake'), [0, 1, 2])
+    assert index.artist_name('DRAKE') == 'Drake'
+    assert index.artist_name('nadie') is None
+
+
+def test_compare_artists_counts_every_spelling(tracks):
+    comparison = compare_artists(tracks, 'drake', 'adele')
+    
+    assert comparison.loc[0, 'drake'] == 3
+    assert comparison.loc[0, 'adele'] == 2
+    assert compare_artists(tracks, 'drake', 'nadie') is None
+
+
+def test_artist_filter_counts_every_spelling(tracks):
+    selection = as_dataset(tracks).select(DataFilter(artists=['drake']))
+    
+    assert len(selection) == 3
+
+
+def test_sorted_index_ranges_match_comparisons(tracks):
+    index = SortedIndex(tracks['year'])
+    years = tracks['year']
+    
+    for low, high in [(None, None), (2015, None), (None, 2015), (2016, 2018), (2030, None)]:
+        expected = years.between(low if low is not None else -np.inf, high if high is not None else np.inf)
+        np.testing.assert_array_equal(index.rows(low, high), np.flatnonzero(expected))
+        np.testing.assert_array_equal(index.mask(low, high), expected.to_numpy())
+        assert index.count(low, high) == expected.sum()
+
+
+def test_genre_mask_ignores_case_and_spelling(tracks):
+    genres = GenreIndex(tracks['artist_genres'])
+    
+    np.testing.assert_array_equal(np.flatnonzero(genres.mask(['POP'])), [3, 4, 7])
+    np.testing.assert_array_equal(np.flatnonzero(genres.mask(['hip hop', 'r&b'])), [0, 1, 5])
+    assert genres.row_genres(0) == ['Hip Hop', 'rap']
+    assert not genres.mask(['jazz']).any()
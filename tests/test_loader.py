@@ -0,0 +1,93 @@
+"""Datos crudos en varias partes: resolución de archivos, lectura y unión"""
+import pandas as pd
+import pytest
+
+from src.data.cleaner import DataCleaner
+from src.data.loader import DataLoader, read_columns, resolve_sources
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'track_id': [f't{i}' for i in range(9)],
+        'track_popularity': list(range(9)),
+        'artist_name': [f'Artist {i % 3}' for i in range(9)]
+    })
+
+
+def write_shards(directory, frame, suffixes):
+    """Escribe una parte por sufijo (el nombre fija el orden de lectura)"""
+    directory.mkdir(exist_ok=True)
+    size = -(-len(frame) // len(suffixes))
+    for part, suffix in enumerate(suffixes):
+        frame.iloc[part * size:(part + 1) * size].to_csv(directory / f'part_{part}{suffix}', index=False)
+    return directory
+
+
+def test_single_file(tmp_path, frame):
+    frame.to_csv(tmp_path / 'raw.csv', index=False)
+    
+    assert resolve_sources(tmp_path / 'raw.csv') == [tmp_path / 'raw.csv']
+    pd.testing.assert_frame_equal(DataLoader().load_raw_data(tmp_path / 'raw.csv'), frame)
+
+
+def test_folder_reads_every_compression_in_name_order(tmp_path, frame):
+    suffixes = ['.csv', '.csv.gz', '.csv.bz2', '.csv.xz', '.csv.zip']
+    folder = write_shards(tmp_path / 'parts', frame, suffixes)
+    (folder / 'notes.txt').write_text('ignorado')
+    
+    paths = resolve_sources(folder)
+    loaded = DataLoader().load_raw_data(folder, workers=3)
+    
+    assert [path.name for path in paths] == [f'part_{i}{suffix}' for i, suffix in enumerate(suffixes)]
+    pd.testing.assert_frame_equal(loaded, frame)
+
+
+def test_glob_pattern(tmp_path, frame):
+    write_shards(tmp_path, frame, ['.csv.gz', '.csv.gz', '.csv'])
+    
+    paths = resolve_sources(tmp_path / 'part_*.csv.gz')
+    
+    assert [path.name for path in paths] == ['part_0.csv.gz', 'part_1.csv.gz']
+
+
+def test_missing_source_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        resolve_sources(tmp_path / 'nada.csv')
+    (tmp_path / 'vacia').mkdir()
+    with pytest.raises(FileNotFoundError):
+        resolve_sources(tmp_path / 'vacia')
+
+
+def test_shards_are_joined_on_the_common_schema(tmp_path, frame):
+    folder = tmp_path / 'parts'
+    folder.mkdir()
+    frame.iloc[:4].to_csv(folder / 'a.csv', index=False)
+    frame.iloc[4:].drop(columns=['artist_name']).assign(extra=1).to_csv(folder / 'b.csv.gz', index=False)
+    
+    loaded = DataLoader().load_raw_data(folder)
+    
+    assert read_columns(folder) == ['track_id', 'track_popularity', 'artist_name', 'extra']
+    assert list(loaded.columns) == read_columns(folder)
+    assert loaded['artist_name'].isna().tolist() == [False] * 4 + [True] * 5
+    assert loaded['extra'].isna().tolist() == [True] * 4 + [False] * 5
+    pd.testing.assert_frame_equal(loaded[frame.columns[:2]], frame[frame.columns[:2]])
+
+
+def test_iter_chunks_walks_every_shard(tmp_path, frame):
+    folder = write_shards(tmp_path / 'parts', frame, ['.csv', '.csv.gz', '.csv.bz2'])
+    
+    chunks = list(DataLoader().iter_chunks(folder, columns=['track_id', 'missing'], chunksize=2))
+    
+    assert all(list(chunk.columns) == ['track_id'] for chunk in chunks)
+    assert pd.concat(chunks, ignore_index=True)['track_id'].tolist() == frame['track_id'].tolist()
+
+
+def test_cleaning_shards_matches_cleaning_one_file(raw_csv, tmp_path):
+    raw = pd.read_csv(raw_csv)
+    folder = write_shards(tmp_path / 'parts', raw, ['.csv.gz', '.csv', '.csv.xz'])
+    
+    whole = DataCleaner(DataLoader().load_raw_data(raw_csv)).clean()
+    sharded = DataCleaner(DataLoader().load_raw_data(folder)).clean()
+    
+    pd.testing.assert_frame_equal(sharded, whole)